@@ -1,16 +1,25 @@
 """Yo! Holocron CLI is here!"""
 
+import collections
 import io
+import os
 import pathlib
+import socket
 import sys
+import threading
+import time
 import logging
 import logging.handlers
 import argparse
 import warnings
 import contextlib
 
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:
+    import importlib_metadata
+
 import colorama
-import pkg_resources
 import termcolor
 import yaml
 
@@ -45,8 +54,54 @@ def create_app_from_yml(path):
     return create_app(conf["metadata"], pipes=conf["pipes"])
 
 
+class _ProgressLine:
+    """Show a live progress line with items/sec rate of a running pipe."""
+
+    def __init__(self, pipe, stream=None, interval=0.1):
+        self._pipe = pipe
+        self._stream = stream or sys.stderr
+        self._interval = interval
+        self._started = time.monotonic()
+        self._shown = 0.0
+        self._visible = False
+        self.count = 0
+
+    def update(self, count):
+        self.count = count
+
+        # Redrawing a line on every item is anything but cheap, and that's
+        # not something a human can read anyway.
+        now = time.monotonic()
+        if now - self._shown >= self._interval:
+            self._shown = now
+            self._draw(now)
+
+    def clear(self):
+        if self._visible:
+            self._stream.write("\r\x1b[K")
+            self._stream.flush()
+            self._visible = False
+
+    def done(self):
+        self._draw(time.monotonic())
+        self._stream.write("\n")
+        self._stream.flush()
+        self._visible = False
+
+    def _draw(self, now):
+        elapsed = now - self._started
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+
+        self._stream.write(
+            f"\r\x1b[K[{self._pipe}] {self.count} items, "
+            f"{rate:.1f} items/sec, {elapsed:.1f}s"
+        )
+        self._stream.flush()
+        self._visible = True
+
+
 @contextlib.contextmanager
-def configure_logger(level):
+def configure_logger(level, progress=None, capacity=100, flush_interval=1.0):
     """
     Configure a root logger to print records in pretty format.
 
@@ -59,17 +114,86 @@ def configure_logger(level):
         [WARN] message
         [ERRO] message
 
+    Records are buffered to avoid interleaving with the output, yet the
+    buffer is bounded both in size and time so records are streamed while a
+    pipe is running. Repeated records are printed only once, and summarized
+    at exit.
+
     :param level: a minimum logging level to be printed
+    :param progress: a progress line to clear before printing records
+    :param capacity: a maximum number of records to buffer
+    :param flush_interval: a maximum number of seconds to buffer records
     """
 
     class _PendingHandler(logging.handlers.MemoryHandler):
         def __init__(self, target):
-            return super(_PendingHandler, self).__init__(
-                capacity=-1, target=target
+            super(_PendingHandler, self).__init__(
+                capacity=capacity, target=target
             )
+            self._flushed = time.monotonic()
+
+            # Some warnings (e.g. unknown language to highlight) may be
+            # issued for many items in the stream. Keep track of seen records
+            # to print them only once. The number of tracked records is
+            # bounded too, so least recently seen ones are forgotten.
+            self._seen = collections.OrderedDict()
+
+        def emit(self, record):
+            key = (record.levelno, record.name, record.getMessage())
+
+            if key in self._seen:
+                self._seen[key][1] += 1
+                self._seen.move_to_end(key)
+                return
+
+            self._seen[key] = [record, 0]
+            while len(self._seen) > capacity:
+                self._summarize(*self._seen.popitem(last=False)[1])
+            super(_PendingHandler, self).emit(record)
 
         def shouldFlush(self, record):
-            return False
+            return (
+                super(_PendingHandler, self).shouldFlush(record)
+                or time.monotonic() - self._flushed >= flush_interval
+            )
+
+        def flush(self):
+            self._flushed = time.monotonic()
+            super(_PendingHandler, self).flush()
+
+        def flush_if_due(self):
+            if self.buffer and time.monotonic() - self._flushed >= (
+                flush_interval
+            ):
+                self.flush()
+
+        def summarize(self):
+            self.flush()
+            while self._seen:
+                self._summarize(*self._seen.popitem(last=False)[1])
+
+        def _summarize(self, record, repeated):
+            if repeated:
+                self.acquire()
+                try:
+                    self.buffer.append(
+                        logging.makeLogRecord(
+                            dict(
+                                vars(record),
+                                msg="%s (repeated %d more times)",
+                                args=(record.getMessage(), repeated),
+                            )
+                        )
+                    )
+                finally:
+                    self.release()
+                self.flush()
+
+    class _StreamHandler(logging.StreamHandler):
+        def emit(self, record):
+            if progress:
+                progress.clear()
+            super(_StreamHandler, self).emit(record)
 
     class _Formatter(logging.Formatter):
         def format(self, record):
@@ -77,7 +201,7 @@ def configure_logger(level):
             return super(_Formatter, self).format(record)
 
     # create stream handler with custom formatter
-    stream_handler = logging.StreamHandler()
+    stream_handler = _StreamHandler()
     stream_handler.setFormatter(_Formatter("[%(levelname)s] %(message)s"))
     pending_handler = _PendingHandler(stream_handler)
 
@@ -86,10 +210,265 @@ def configure_logger(level):
     logger.addHandler(pending_handler)
     logger.setLevel(level)
 
+    # Records are checked for being due when a next one is emitted, but
+    # a warning may be the last record for the whole long build. So records
+    # are also flushed on timer, in order to show them without delays.
+    stopped = threading.Event()
+
+    def flush_periodically():
+        while not stopped.wait(flush_interval / 4):
+            pending_handler.flush_if_due()
+
+    flusher = threading.Thread(target=flush_periodically, daemon=True)
+    flusher.start()
+
     # capture warnings issued by 'warnings' module
     logging.captureWarnings(True)
-    yield
-    pending_handler.flush()
+    try:
+        yield
+    finally:
+        stopped.set()
+        flusher.join()
+        pending_handler.summarize()
+        logger.removeHandler(pending_handler)
+
+
+def run_pipes(app, pipes, *, report, concurrent=False, resume_from=None):
+    """Run given pipes and return a number of items and time per pipe."""
+
+    lock = threading.Lock()
+
+    def invoke(pipe):
+        if resume_from is None:
+            return app.invoke(pipe)
+
+        from ._processors import checkpoint
+
+        return checkpoint.resume(app, pipe, resume_from)
+
+    def run(pipe):
+        started, count = time.monotonic(), 0
+
+        for item in invoke(pipe):
+            count += 1
+
+            # Pipes may run concurrently, and we don't want their output to
+            # be interleaved.
+            with lock:
+                report(str(item["destination"]))
+        return count, time.monotonic() - started
+
+    if concurrent and len(pipes) > 1:
+        from concurrent import futures
+
+        with futures.ThreadPoolExecutor(len(pipes)) as executor:
+            submitted = [executor.submit(run, pipe) for pipe in pipes]
+            return {
+                pipe: future.result() for pipe, future in zip(pipes, submitted)
+            }
+
+    return {pipe: run(pipe) for pipe in pipes}
+
+
+def _run_site(conf, pipes):
+    # Sites are usually described with paths relative to a directory with
+    # their configuration file, so that's where they must be built from.
+    cwd = os.getcwd()
+    started, count = time.monotonic(), 0
+
+    try:
+        os.chdir(os.path.dirname(conf))
+        app = create_app_from_yml(conf)
+
+        for pipe in pipes:
+            for _ in app.invoke(pipe):
+                count += 1
+    except Exception as exc:
+        return count, time.monotonic() - started, str(exc)
+    finally:
+        os.chdir(cwd)
+    return count, time.monotonic() - started, None
+
+
+def run_sites(confs, pipes, *, report, workers=None):
+    """Build many sites in a shared process or a pool of processes.
+
+    Every site gets its own application instance, so metadata are never
+    shared between sites. Everything else, i.e. imported processors,
+    compiled templates of shared themes, scanned directories and highlighted
+    code, is cached process-wide and therefore is reused by sites built in
+    the same process. Returns a number of items, time and error per site.
+    """
+
+    confs = [os.path.abspath(conf) for conf in confs]
+    timings = {}
+
+    if workers is not None and len(confs) > 1:
+        import functools
+        import multiprocessing
+
+        with multiprocessing.Pool(min(workers, len(confs))) as pool:
+            results = pool.imap(
+                functools.partial(_run_site, pipes=pipes), confs
+            )
+            for conf, timing in zip(confs, results):
+                timings[conf] = timing
+                report(conf, *timing)
+        return timings
+
+    for conf in confs:
+        timings[conf] = _run_site(conf, pipes)
+        report(conf, *timings[conf])
+    return timings
+
+
+def _get_socket_path(conf):
+    return str(pathlib.Path(conf).resolve().parent / ".holocron.sock")
+
+
+def create_daemon(conf, socket_path):
+    """Return a server that runs pipes on requests over a Unix socket.
+
+    The server keeps an application instance alive between requests, so
+    requests do not pay for Python startup, imports and cold caches. Each
+    request, however, starts with configured metadata only. The application
+    is recreated once the configuration file is changed. Requests and
+    responses are JSON documents, one per line.
+    """
+
+    import json
+    import socketserver
+
+    state = {"app": None, "mtime": None}
+
+    def get_app():
+        try:
+            mtime = os.stat(conf).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if state["app"] is None or state["mtime"] != mtime:
+            if state["app"] is not None:
+                logging.getLogger("holocron").info("reloading %s", conf)
+            state["app"], state["mtime"] = create_app_from_yml(conf), mtime
+        return state["app"]
+
+    class _RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            started = time.monotonic()
+            request = json.loads(self.rfile.readline())
+
+            def send(message):
+                self.wfile.write(json.dumps(message).encode("UTF-8") + b"\n")
+
+            try:
+                app = get_app()
+
+                # Processors pass artifacts to each other through metadata
+                # (e.g. an index of items, or a manifest of assets), and the
+                # ones of a previous request must not leak into this one.
+                # Metadata set by processors go to the first mapping of the
+                # chain, so it's replaced by a fresh one, while configured
+                # metadata, processors and their caches are kept.
+                app.metadata.maps[0] = {}
+
+                if request.get("shard"):
+                    app.metadata["shard"], app.metadata["shards"] = request[
+                        "shard"
+                    ]
+
+                timings = run_pipes(
+                    app,
+                    request["pipes"],
+                    report=lambda destination: send({"item": destination}),
+                    concurrent=request.get("concurrent", False),
+                    resume_from=request.get("resume_from"),
+                )
+            except Exception as exc:
+                logging.getLogger().exception("Oops.. something went wrong.")
+                send({"error": str(exc)})
+                return
+
+            latency = time.monotonic() - started
+            print(
+                f"[{','.join(request['pipes'])}] "
+                f"{sum(count for count, _ in timings.values())} items, "
+                f"{latency:.3f}s",
+                file=sys.stderr,
+            )
+            send({"timings": timings, "latency": latency})
+
+    # A socket file is left behind if a daemon has been killed, and there's
+    # no way to reuse it. If nobody listens on it, it's safe to remove it.
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+        else:
+            raise RuntimeError(f"Daemon is already running: {socket_path}")
+
+    # Warm up the application before accepting requests, so the very first
+    # request is served as fast as the others.
+    get_app()
+    return socketserver.UnixStreamServer(socket_path, _RequestHandler)
+
+
+def request_daemon(
+    socket_path,
+    pipes,
+    *,
+    report,
+    concurrent=False,
+    resume_from=None,
+    shard=None,
+):
+    """Ask a daemon to run given pipes and return their timings."""
+
+    import json
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise RuntimeError(f"No daemon is running: {socket_path}")
+
+        request = {
+            "pipes": pipes,
+            "concurrent": concurrent,
+            "resume_from": resume_from,
+            "shard": shard,
+        }
+        sock.sendall(json.dumps(request).encode("UTF-8") + b"\n")
+
+        for line in sock.makefile("rb"):
+            response = json.loads(line)
+
+            if "item" in response:
+                report(response["item"])
+            elif "error" in response:
+                raise RuntimeError(response["error"])
+            else:
+                return {
+                    pipe: tuple(timing)
+                    for pipe, timing in response["timings"].items()
+                }
+
+    raise RuntimeError("Daemon has closed the connection unexpectedly.")
+
+
+def _parse_shard(value):
+    shard, sep, shards = value.partition("/")
+
+    try:
+        shard, shards = int(shard), int(shards)
+    except ValueError:
+        shard, shards = -1, 0
+
+    if not sep or not 0 <= shard < shards:
+        raise argparse.ArgumentTypeError(f"expected I/N, got {value!r}")
+    return shard, shards
 
 
 def parse_command_line(args):
@@ -149,7 +528,7 @@ def parse_command_line(args):
     parser.add_argument(
         "--version",
         action="version",
-        version=pkg_resources.get_distribution("holocron").version,
+        version=importlib_metadata.version("holocron"),
         help="show the holocron version and exit",
     )
 
@@ -158,7 +537,72 @@ def parse_command_line(args):
     )
 
     run_parser = command_parser.add_parser("run")
-    run_parser.add_argument("pipe", help="a pipe to run")
+    run_parser.add_argument("pipes", nargs="+", help="pipes to run")
+    run_parser.add_argument(
+        "--via-daemon",
+        dest="via_daemon",
+        action="store_true",
+        default=False,
+        help="ask a running daemon to run given pipes",
+    )
+    run_parser.add_argument(
+        "--socket",
+        dest="socket",
+        help="set path to the daemon's socket (default: next to CONF)",
+    )
+    run_parser.add_argument(
+        "--resume-from",
+        dest="resume_from",
+        metavar="CHECKPOINT",
+        help="replay a stream saved by a checkpoint and run the rest",
+    )
+    run_parser.add_argument(
+        "--shard",
+        dest="shard",
+        type=_parse_shard,
+        metavar="I/N",
+        help="build I-th of N shards (zero-based) with the 'shard' processor",
+    )
+    run_parser.add_argument(
+        "--concurrent",
+        dest="concurrent",
+        action="store_true",
+        default=False,
+        help="run given pipes concurrently rather than one by one",
+    )
+    run_parser.add_argument(
+        "--progress",
+        dest="progress",
+        action="store_true",
+        default=False,
+        help="show a live progress line instead of built items",
+    )
+
+    run_many_parser = command_parser.add_parser("run-many")
+    run_many_parser.add_argument(
+        "confs", nargs="+", help="configuration files of sites to build"
+    )
+    run_many_parser.add_argument(
+        "-p",
+        "--pipe",
+        dest="pipes",
+        action="append",
+        required=True,
+        help="pipe to run for every site (may be repeated)",
+    )
+    run_many_parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        help="build sites in a pool of worker processes",
+    )
+
+    daemon_parser = command_parser.add_parser("daemon")
+    daemon_parser.add_argument(
+        "--socket",
+        dest="socket",
+        help="set path to the daemon's socket (default: next to CONF)",
+    )
 
     # parse cli and form arguments object
     arguments = parser.parse_args(args)
@@ -182,16 +626,85 @@ def main(args=sys.argv[1:]):
     # Windows API calls. Second, it strips ANSI colors away from a stream if
     # it's not connected to a tty (e.g. holocron is called from pipe).
     with colorama.colorama_text():
+        if arguments.command == "daemon":
+            _serve(arguments)
+            return
+
+        if arguments.command == "run-many":
+            _run_many(arguments)
+            return
+
+        progress = None
+        if arguments.progress:
+            progress = _ProgressLine(",".join(arguments.pipes))
+
+        total = 0
+
+        def report(destination):
+            nonlocal total
+            total += 1
+
+            if progress:
+                progress.update(total)
+                return
+
+            print(
+                termcolor.colored("==>", "green", attrs=["bold"]),
+                termcolor.colored(destination, attrs=["bold"]),
+            )
+
         # initial logger configuration - use custom format for records
         # and print records with WARNING level and higher.
-        with configure_logger(arguments.verbosity or logging.WARNING):
+        with configure_logger(
+            arguments.verbosity or logging.WARNING, progress=progress
+        ):
             try:
-                holocron = create_app_from_yml(arguments.conf)
+                started = time.monotonic()
+
+                if arguments.via_daemon:
+                    timings = request_daemon(
+                        arguments.socket or _get_socket_path(arguments.conf),
+                        arguments.pipes,
+                        report=report,
+                        concurrent=arguments.concurrent,
+                        resume_from=arguments.resume_from,
+                        shard=arguments.shard,
+                    )
+                else:
+                    app = create_app_from_yml(arguments.conf)
+
+                    # Shards of a site are built by different processes (or
+                    # hosts), and each one has to know which shard it builds.
+                    if arguments.shard:
+                        app.metadata["shard"], app.metadata["shards"] = (
+                            arguments.shard
+                        )
+
+                    timings = run_pipes(
+                        app,
+                        arguments.pipes,
+                        report=report,
+                        concurrent=arguments.concurrent,
+                        resume_from=arguments.resume_from,
+                    )
 
-                for item in holocron.invoke(arguments.pipe):
+                if progress:
+                    progress.done()
+
+                # Pipes are run in the same process in order to share
+                # caches (e.g. scanned directories, compiled templates,
+                # highlighted code), and the whole point is to save time.
+                # So let's show how much time it took.
+                if len(timings) > 1:
+                    for pipe, (count, elapsed) in timings.items():
+                        print(
+                            f"[{pipe}] {count} items, {elapsed:.1f}s",
+                            file=sys.stderr,
+                        )
                     print(
-                        termcolor.colored("==>", "green", attrs=["bold"]),
-                        termcolor.colored(item["destination"], attrs=["bold"]),
+                        f"[total] {sum(c for c, _ in timings.values())} "
+                        f"items, {time.monotonic() - started:.1f}s",
+                        file=sys.stderr,
                     )
             except (RuntimeError, IsADirectoryError) as exc:
                 print(str(exc), file=sys.stderr)
@@ -199,3 +712,58 @@ def main(args=sys.argv[1:]):
             except Exception:
                 logging.getLogger().exception("Oops.. something went wrong.")
                 sys.exit(1)
+
+
+def _serve(arguments):
+    socket_path = arguments.socket or _get_socket_path(arguments.conf)
+
+    with configure_logger(arguments.verbosity or logging.WARNING):
+        try:
+            server = create_daemon(arguments.conf, socket_path)
+        except (RuntimeError, IsADirectoryError) as exc:
+            print(str(exc), file=sys.stderr)
+            sys.exit(1)
+
+        print(f"Listening on {socket_path}", file=sys.stderr)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.unlink(socket_path)
+
+
+def _run_many(arguments):
+    def report(conf, count, elapsed, error):
+        if error is not None:
+            print(f"[{conf}] {error}", file=sys.stderr)
+            return
+
+        print(
+            termcolor.colored("==>", "green", attrs=["bold"]),
+            termcolor.colored(conf, attrs=["bold"]),
+            f"{count} items, {count / max(elapsed, 1e-9):.1f} items/sec, "
+            f"{elapsed:.1f}s",
+        )
+
+    with configure_logger(arguments.verbosity or logging.WARNING):
+        started = time.monotonic()
+        timings = run_sites(
+            arguments.confs,
+            arguments.pipes,
+            report=report,
+            workers=arguments.workers,
+        )
+        elapsed = time.monotonic() - started
+        count = sum(count for count, _, _ in timings.values())
+
+        print(
+            f"[total] {len(timings)} sites, {count} items, "
+            f"{count / max(elapsed, 1e-9):.1f} items/sec, {elapsed:.1f}s",
+            file=sys.stderr,
+        )
+
+        if any(error is not None for _, _, error in timings.values()):
+            sys.exit(1)
@@ -1,8 +1,11 @@
 """Holocron, The Application."""
 
 import collections
+import collections.abc
 import logging
+import types
 
+from . import graph
 from .._processors import _misc
 
 
@@ -49,6 +52,10 @@ class Application:
     def metadata(self):
         return self._metadata
 
+    @property
+    def pipes(self):
+        return types.MappingProxyType(self._pipes)
+
     def add_processor(self, name, processor):
         if name in self._processors:
             _logger.warning("processor override: '%s'", name)
@@ -77,6 +84,14 @@ class Application:
                 raise ValueError(f"no such pipe: '{pipe}'")
             pipe = self._pipes[pipe]
 
+        # Pipes may also be graphs, i.e. mappings of named stages where each
+        # stage is a pipe itself and may come after other stages.
+        if isinstance(pipe, collections.abc.Mapping):
+            yield from graph.invoke(
+                self, pipe, stream, self.metadata.get("buffersize", 128)
+            )
+            return
+
         # Since processors expect an input stream to be an iterator, we cast a
         # given stream explicitly to an iterator even though everything will
         # probably work even if it's not. We just want to respect and enforce
@@ -102,6 +117,22 @@ class Application:
             processfn = self._processors[name]
             stream = processfn(self, stream, *args, **kwargs)
 
+            # Stateless processors return item maps (see '_misc.itemmap').
+            # When an item map receives another item map as its input, the
+            # two are fused into one, so batches of items are passed through
+            # all their map functions without resuming a generator of every
+            # processor for every single item. Any other processor, e.g. the
+            # ones that aggregate items, breaks the fusion and receives items
+            # one by one.
+            if isinstance(stream, _misc.ItemMap):
+                if isinstance(stream.stream, _misc.ItemMap):
+                    stream = _misc.ItemMap(
+                        stream.stream.functions + stream.functions,
+                        stream.stream.stream,
+                    )
+                stream.batchsize = self.metadata.get("batchsize", 256)
+                stream.workers = self.metadata.get("workers")
+
         yield from stream
 
 
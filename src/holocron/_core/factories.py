@@ -1,7 +1,7 @@
 """Factory functions to create core instances."""
 
 from . import Application
-from .._processors import import_processors, when
+from .._processors import import_processors
 
 
 def create_app(metadata, processors=None, pipes=None):
@@ -9,39 +9,55 @@ def create_app(metadata, processors=None, pipes=None):
 
     instance = Application(metadata)
 
-    # In order to avoid code duplication, we use existing built-in import
-    # processor to import and register built-in processors on the application
-    # instance. This is, to be honest, the main purpose of this factory
-    # function, because otherwise one must create an Application instance
-    # directly.
-    import_processors.process(
-        instance,
-        [],
-        imports=[
-            "archive = holocron._processors.archive:process",
-            "chain = holocron._processors.chain:process",
-            "commonmark = holocron._processors.commonmark:process",
-            "feed = holocron._processors.feed:process",
-            "frontmatter = holocron._processors.frontmatter:process",
-            "import-processors = holocron._processors.import_processors:process",
-            "jinja2 = holocron._processors.jinja2:process",
-            "markdown = holocron._processors.markdown:process",
-            "metadata = holocron._processors.metadata:process",
-            "pipe = holocron._processors.pipe:process",
-            "prettyuri = holocron._processors.prettyuri:process",
-            "restructuredtext = holocron._processors.restructuredtext:process",
-            "save = holocron._processors.save:process",
-            "sitemap = holocron._processors.sitemap:process",
-            "source = holocron._processors.source:process",
-            "todatetime = holocron._processors.todatetime:process",
-        ],
-    )
+    # Built-in processors depend on quite heavy 3rd party packages (e.g.
+    # docutils, pygments, feedgen), and importing them all takes time that
+    # may easily exceed the time required to run a simple pipe. That's why
+    # they are registered as lazy proxies, and their modules are imported
+    # when a processor is used for the first time.
+    for import_ in [
+        "aggregate = holocron._processors.aggregate:process",
+        "archive = holocron._processors.archive:process",
+        "chain = holocron._processors.chain:process",
+        "checkpoint = holocron._processors.checkpoint:process",
+        "commonmark = holocron._processors.commonmark:process",
+        "feed = holocron._processors.feed:process",
+        "fingerprint = holocron._processors.fingerprint:process",
+        "frontmatter = holocron._processors.frontmatter:process",
+        "import-processors = holocron._processors.import_processors:process",
+        "index = holocron._processors.index:process",
+        "jinja2 = holocron._processors.jinja2:process",
+        "linkcheck = holocron._processors.linkcheck:process",
+        "markdown = holocron._processors.markdown:process",
+        "merge = holocron._processors.merge:process",
+        "metadata = holocron._processors.metadata:process",
+        "pipe = holocron._processors.pipe:process",
+        "prettyuri = holocron._processors.prettyuri:process",
+        "restructuredtext = holocron._processors.restructuredtext:process",
+        "save = holocron._processors.save:process",
+        "search = holocron._processors.search:process",
+        "shard = holocron._processors.shard:process",
+        "sitemap = holocron._processors.sitemap:process",
+        "source = holocron._processors.source:process",
+        "taxonomy = holocron._processors.taxonomy:process",
+        "todatetime = holocron._processors.todatetime:process",
+    ]:
+        entry_point = import_processors.parse_entry_point(import_)
+        instance.add_processor(
+            entry_point.name, import_processors.LazyProcessor(entry_point)
+        )
 
     # When is the only known processor wrapper, and, frankly, we don't expect
     # more. Processor wrappers are mere hacks to avoid hardcoding yet provide
     # better syntax for wrapping processors. So let's hardcode that knowledge
     # here, and think later about general approach when the need arise.
-    instance.add_processor_wrapper("when", when.process)
+    instance.add_processor_wrapper(
+        "when",
+        import_processors.LazyProcessor(
+            import_processors.parse_entry_point(
+                "when = holocron._processors.when:process"
+            )
+        ),
+    )
 
     for name, processor in (processors or {}).items():
         instance.add_processor(name, processor)
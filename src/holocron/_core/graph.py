@@ -0,0 +1,171 @@
+"""Pipe graphs, i.e. pipes with shared upstream stages."""
+
+import collections
+import collections.abc
+import queue
+import threading
+
+
+_DONE = object()
+
+
+class _Stopped(Exception):
+    """Raised in stage threads when a graph evaluation is stopped."""
+
+
+class _Channel:
+    """Bounded buffer that passes items from one stage to another."""
+
+    def __init__(self, maxsize, producers, stopped):
+        self._queue = queue.Queue(maxsize)
+        self._producers = producers
+        self._stopped = stopped
+
+    def put(self, item):
+        # A consumer may never come for items if the evaluation is stopped,
+        # so we can't block forever and have to check if it's still running.
+        while True:
+            if self._stopped.is_set():
+                raise _Stopped()
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def close(self):
+        self.put(_DONE)
+
+    def __iter__(self):
+        producers = self._producers
+
+        while producers:
+            if self._stopped.is_set():
+                raise _Stopped()
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            if item is _DONE:
+                producers -= 1
+                continue
+            yield item
+
+
+def _copy(item):
+    # Branches are free to modify items they receive, so each branch gets
+    # its own copy of an item. Item's values are not copied though, since
+    # they are usually immutable.
+    copied = item.__class__.__new__(item.__class__)
+    copied._mapping = dict(item._mapping)
+    return copied
+
+
+def parse(graph):
+    """Return a list of (name, pipe, after) stages in topological order."""
+
+    stages = {}
+
+    for name, stage in graph.items():
+        if not isinstance(stage, collections.abc.Mapping) or not isinstance(
+            stage.get("pipe"), collections.abc.Sequence
+        ):
+            raise ValueError(f"stage must have a pipe: '{name}'")
+
+        after = stage.get("after", [])
+        if isinstance(after, str):
+            after = [after]
+
+        for upstream in after:
+            if upstream not in graph:
+                raise ValueError(f"no such stage: '{upstream}'")
+
+        stages[name] = (name, stage["pipe"], after)
+
+    ordered, visited = [], set()
+
+    def visit(name, path):
+        if name in path:
+            raise ValueError(f"pipe graph has a cycle: '{name}'")
+
+        if name not in visited:
+            for upstream in stages[name][2]:
+                visit(upstream, path | {name})
+            visited.add(name)
+            ordered.append(stages[name])
+
+    for name in stages:
+        visit(name, frozenset())
+    return ordered
+
+
+def invoke(app, graph, stream, buffersize=128):
+    """Pass a stream of items through a pipe graph.
+
+    Each stage of a graph is a pipe that receives items either from the
+    input stream or from the stages it comes after. Stages run in their own
+    threads and are connected with bounded buffers, so a shared upstream
+    stage runs once and its items are fed to all downstream branches as
+    they are produced. Items produced by stages no other stage comes after
+    form the output stream.
+    """
+
+    stages = parse(graph)
+    stopped = threading.Event()
+    failures = []
+
+    downstream = collections.defaultdict(list)
+    for name, _, after in stages:
+        for upstream in after or [None]:
+            downstream[upstream].append(name)
+
+    sinks = [name for name, _, _ in stages if name not in downstream]
+    inboxes = {
+        name: _Channel(buffersize, len(after) or 1, stopped)
+        for name, _, after in stages
+    }
+    output = _Channel(buffersize, len(sinks) or 1, stopped)
+
+    def feed(items, name):
+        outboxes = [inboxes[stage] for stage in downstream[name]] or [output]
+
+        try:
+            for item in items:
+                first, *rest = outboxes
+                for outbox in rest:
+                    outbox.put(_copy(item))
+                first.put(item)
+
+            for outbox in outboxes:
+                outbox.close()
+        except _Stopped:
+            pass
+        except BaseException as exc:
+            failures.append(exc)
+            stopped.set()
+
+    threads = [
+        threading.Thread(
+            target=feed,
+            args=(app.invoke(pipe, inboxes[name]), name),
+            daemon=True,
+        )
+        for name, pipe, _ in stages
+    ]
+    threads.append(
+        threading.Thread(target=feed, args=(stream or [], None), daemon=True)
+    )
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        yield from output
+    except _Stopped:
+        raise failures[0] from None
+    finally:
+        stopped.set()
+
+        for thread in threads:
+            thread.join()
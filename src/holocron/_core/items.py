@@ -111,3 +111,70 @@ class WebSiteItem(Item):
         # there's a need to strip a trailing '/' character away from 'baseurl'
         # property to prevent doubled '/' after concatenation.
         return self["baseurl"].rstrip("/") + self.url
+
+
+class _CompactMapping(collections.abc.MutableMapping):
+    """Mapping that stores keys separately, so they can be shared."""
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys, values):
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key):
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        try:
+            self._values[self._keys.index(key)] = value
+        except ValueError:
+            self._keys = self._keys + (key,)
+            self._values.append(value)
+
+    def __delitem__(self, key):
+        try:
+            index = self._keys.index(key)
+        except ValueError:
+            raise KeyError(key)
+
+        self._keys = self._keys[:index] + self._keys[index + 1 :]
+        del self._values[index]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+_shared_keys = {}
+
+
+def project(item, fields):
+    """Return a lightweight copy of an item with given fields only.
+
+    Fields computed by an item class (e.g. 'url') are not copied but keep
+    being computed, that's why a copy is always an instance of the same
+    class that carries properties required to compute them. Copies made
+    with the same set of fields share their keys, so memory they occupy is
+    mostly determined by values.
+    """
+
+    fields = itertools.chain(("source", "destination", "baseurl"), fields)
+    computed = vars(item.__class__)
+
+    keys, values = [], []
+    for field in fields:
+        if field not in computed and field not in keys and field in item:
+            keys.append(field)
+            values.append(item[field])
+
+    keys = _shared_keys.setdefault(tuple(keys), tuple(keys))
+
+    projection = item.__class__.__new__(item.__class__)
+    projection._mapping = _CompactMapping(keys, values)
+    return projection
@@ -0,0 +1,475 @@
+"""Compact binary representation of streams of items.
+
+A stream starts with a header that carries a format version, and is
+followed by items one after another, so streams can be written and read
+without keeping them in memory. Every value is prefixed with a one byte
+tag of its type. Things that tend to repeat across items, namely field
+names and sets of fields (shapes), are written once when they are seen for
+the first time, and are referred to by index afterwards. Content is
+referred to the same way, but only recently seen content is remembered,
+so neither a writer nor a reader keeps the whole stream in memory.
+"""
+
+import collections
+import datetime
+import hashlib
+import importlib
+import io
+import pathlib
+import struct
+
+import dateutil.tz
+
+from .items import Item, WebSiteItem
+
+
+MAGIC = b"HOLOCRON"
+VERSION = 2
+
+# The number of recently seen contents a writer refers to instead of writing
+# them again. A reader keeps as many, since it's told where to put each.
+_CONTENT_SLOTS = 64
+
+(
+    _NONE,
+    _TRUE,
+    _FALSE,
+    _INT,
+    _FLOAT,
+    _STR,
+    _BYTES,
+    _LIST,
+    _DICT,
+    _PATH,
+    _DATETIME,
+    _DATE,
+    _ITEM,
+    _CONTENT,
+    _EXTERNAL,
+) = range(15)
+
+_TZ_NAIVE, _TZ_UTC, _TZ_OFFSET, _TZ_NAMED = range(4)
+
+_float = struct.Struct("<d")
+_item_classes = {"Item": Item, "WebSiteItem": WebSiteItem}
+_item_classnames = {cls: name for name, cls in _item_classes.items()}
+_epoch = datetime.datetime(1970, 1, 1)
+
+
+def _getclass(name):
+    if name in _item_classes:
+        return _item_classes[name]
+
+    module, _, qualname = name.partition(":")
+    cls = importlib.import_module(module)
+    for attr in qualname.split("."):
+        cls = getattr(cls, attr)
+    return cls
+
+
+def _zonename(tzinfo):
+    # Zones are preferred over UTC offsets, since offsets change over time
+    # (e.g. daylight saving) and templates may print zone names. Zones
+    # created by 'zoneinfo' know their names, and are the zones of those
+    # names, while 'dateutil' ones know a path to a file they are read from,
+    # so it's checked that the file is the one the name resolves to.
+    name = getattr(tzinfo, "key", None)
+
+    if name is not None:
+        return name if dateutil.tz.gettz(name) is not None else None
+
+    filename = getattr(tzinfo, "_filename", None) or ""
+    name = filename.rpartition("zoneinfo/")[2] or None
+
+    if name and dateutil.tz.gettz(name) == tzinfo:
+        return name
+    return None
+
+
+class Writer:
+    """Write a stream of items to a binary file object.
+
+    Content of items is written out of line, i.e. content that one of the
+    recent items already has is not written again. If 'store' is passed,
+    content is not written to the stream at all; instead, 'store' is called
+    with a content and has to return a string key to fetch the content by.
+    """
+
+    def __init__(self, fileobj, *, store=None):
+        self._fileobj = fileobj
+        self._store = store
+        self._strings = {}
+        self._shapes = {}
+        self._contents = collections.OrderedDict()
+        self._zones = {}
+        self._fileobj.write(MAGIC + bytes([VERSION]))
+
+    def write(self, item):
+        buffer = bytearray()
+        self._write_item(buffer, item)
+
+        # Items are prefixed with their size, so a reader can read an item
+        # at once and parse it from memory.
+        size = bytearray()
+        self._write_uint(size, len(buffer))
+        self._fileobj.write(size + buffer)
+
+    def _write_uint(self, buffer, value):
+        while value > 0x7F:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def _write_int(self, buffer, value):
+        self._write_uint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+
+    def _write_bytes(self, buffer, value):
+        self._write_uint(buffer, len(value))
+        buffer += value
+
+    def _write_string(self, buffer, value):
+        # Field names, class names and zone names are written once, and then
+        # are referred to by index. A reader learns a new string when it sees
+        # an index it does not know yet.
+        index = self._strings.get(value)
+
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+            self._write_uint(buffer, index)
+            self._write_bytes(buffer, value.encode("UTF-8"))
+        else:
+            self._write_uint(buffer, index)
+
+    def _write_item(self, buffer, item):
+        cls = item.__class__
+        shape = (cls, tuple(item._mapping))
+        index = self._shapes.get(shape)
+
+        buffer.append(_ITEM)
+        if index is None:
+            index = self._shapes[shape] = len(self._shapes)
+            self._write_uint(buffer, index)
+            self._write_string(
+                buffer,
+                _item_classnames.get(cls)
+                or f"{cls.__module__}:{cls.__qualname__}",
+            )
+            self._write_uint(buffer, len(shape[1]))
+            for key in shape[1]:
+                self._write_string(buffer, key)
+        else:
+            self._write_uint(buffer, index)
+
+        for key, value in item._mapping.items():
+            if key == "content" and isinstance(value, (str, bytes)):
+                self._write_content(buffer, value)
+            else:
+                self._write_value(buffer, value)
+
+    def _write_content(self, buffer, value):
+        is_text = isinstance(value, str)
+        data = value.encode("UTF-8") if is_text else value
+
+        if self._store is not None:
+            buffer.append(_EXTERNAL)
+            buffer.append(is_text)
+            self._write_string(buffer, self._store(data))
+            return
+
+        digest = hashlib.sha1(data).digest()
+        slot = self._contents.get(digest)
+
+        buffer.append(_CONTENT)
+        if slot is None:
+            # Contents are kept in a fixed number of slots, and the least
+            # recently used one is reused for a new content. A slot is
+            # written along with a content, so a reader does not have to
+            # track their usage.
+            if len(self._contents) < _CONTENT_SLOTS:
+                slot = len(self._contents)
+            else:
+                _, slot = self._contents.popitem(last=False)
+            self._contents[digest] = slot
+            self._write_uint(buffer, slot * 2 + 1)
+            buffer.append(is_text)
+            self._write_bytes(buffer, data)
+        else:
+            self._contents.move_to_end(digest)
+            self._write_uint(buffer, slot * 2)
+
+    def _write_datetime(self, buffer, value):
+        tz, name = _TZ_NAIVE, None
+
+        if value.tzinfo is not None:
+            # Timezones are not hashable, yet the same instances are usually
+            # shared by all datetimes in a stream.
+            if id(value.tzinfo) not in self._zones:
+                self._zones[id(value.tzinfo)] = (
+                    value.tzinfo,
+                    _zonename(value.tzinfo),
+                )
+            _, name = self._zones[id(value.tzinfo)]
+
+            if name is not None:
+                tz = _TZ_NAMED
+            elif value.utcoffset():
+                tz = _TZ_OFFSET
+            else:
+                tz = _TZ_UTC
+
+        delta = value.replace(tzinfo=None) - _epoch
+        buffer.append(tz)
+        self._write_int(buffer, delta.days)
+        self._write_uint(buffer, delta.seconds)
+        self._write_uint(buffer, delta.microseconds)
+
+        if tz == _TZ_OFFSET:
+            self._write_int(buffer, int(value.utcoffset().total_seconds()))
+        elif tz == _TZ_NAMED:
+            self._write_string(buffer, name)
+
+    def _write_value(self, buffer, value):
+        if value is None:
+            buffer.append(_NONE)
+        elif value is True:
+            buffer.append(_TRUE)
+        elif value is False:
+            buffer.append(_FALSE)
+        elif isinstance(value, int):
+            buffer.append(_INT)
+            self._write_int(buffer, value)
+        elif isinstance(value, float):
+            buffer.append(_FLOAT)
+            buffer += _float.pack(value)
+        elif isinstance(value, str):
+            buffer.append(_STR)
+            self._write_bytes(buffer, value.encode("UTF-8"))
+        elif isinstance(value, bytes):
+            buffer.append(_BYTES)
+            self._write_bytes(buffer, value)
+        elif isinstance(value, (list, tuple)):
+            buffer.append(_LIST)
+            self._write_uint(buffer, len(value))
+            for element in value:
+                self._write_value(buffer, element)
+        elif isinstance(value, dict):
+            buffer.append(_DICT)
+            self._write_uint(buffer, len(value))
+            for key, element in value.items():
+                if not isinstance(key, str):
+                    raise TypeError(f"cannot serialize key {key!r}")
+                self._write_string(buffer, key)
+                self._write_value(buffer, element)
+        elif isinstance(value, pathlib.PurePath):
+            buffer.append(_PATH)
+            self._write_bytes(buffer, value.as_posix().encode("UTF-8"))
+        elif isinstance(value, datetime.datetime):
+            buffer.append(_DATETIME)
+            self._write_datetime(buffer, value)
+        elif isinstance(value, datetime.date):
+            buffer.append(_DATE)
+            self._write_uint(buffer, value.toordinal())
+        elif isinstance(value, Item):
+            self._write_item(buffer, value)
+        else:
+            raise TypeError(f"cannot serialize {value.__class__.__name__!r}")
+
+
+class Reader:
+    """Read a stream of items from a binary file object.
+
+    If a stream was written with a content store, 'fetch' has to be passed
+    and is called with a key the store returned to get content back.
+    """
+
+    def __init__(self, fileobj, *, fetch=None):
+        self._fileobj = fileobj
+        self._fetch = fetch
+        self._strings = []
+        self._shapes = []
+        self._contents = {}
+        self._zones = {}
+        self._data, self._pos = b"", 0
+
+        header = fileobj.read(len(MAGIC) + 1)
+        if len(header) != len(MAGIC) + 1 or not header.startswith(MAGIC):
+            raise ValueError("not a stream of items")
+        if header[-1] != VERSION:
+            raise ValueError(f"unsupported format version: {header[-1]}")
+
+    def __iter__(self):
+        while True:
+            size, shift = 0, 0
+            while True:
+                byte = self._fileobj.read(1)
+                if not byte:
+                    if shift:
+                        raise ValueError("truncated stream of items")
+                    return
+                size |= (byte[0] & 0x7F) << shift
+                if not byte[0] & 0x80:
+                    break
+                shift += 7
+
+            self._data, self._pos = self._fileobj.read(size), 0
+            if len(self._data) != size:
+                raise ValueError("truncated stream of items")
+            if self._read_byte() != _ITEM:
+                raise ValueError(f"unexpected tag: {self._data[0]}")
+            yield self._read_item()
+
+    def _read_byte(self):
+        try:
+            byte = self._data[self._pos]
+        except IndexError:
+            raise ValueError("truncated stream of items") from None
+        self._pos += 1
+        return byte
+
+    def _read_uint(self):
+        value, shift = 0, 0
+        while True:
+            byte = self._read_byte()
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+
+    def _read_int(self):
+        value = self._read_uint()
+        return -((value + 1) >> 1) if value & 1 else value >> 1
+
+    def _read_bytes(self, size=None):
+        if size is None:
+            size = self._read_uint()
+        start, end = self._pos, self._pos + size
+        if end > len(self._data):
+            raise ValueError("truncated stream of items")
+        self._pos = end
+        return self._data[start:end]
+
+    def _read_string(self):
+        index = self._read_uint()
+        if index == len(self._strings):
+            self._strings.append(self._read_bytes().decode("UTF-8"))
+        return self._strings[index]
+
+    def _read_item(self):
+        index = self._read_uint()
+
+        if index == len(self._shapes):
+            cls = _getclass(self._read_string())
+            keys = [self._read_string() for _ in range(self._read_uint())]
+            self._shapes.append((cls, keys))
+
+        cls, keys = self._shapes[index]
+        item = cls.__new__(cls)
+        item._mapping = {key: self._read_value() for key in keys}
+        return item
+
+    def _read_content(self):
+        slot, is_new = divmod(self._read_uint(), 2)
+        if is_new:
+            is_text = self._read_byte()
+            data = self._read_bytes()
+            self._contents[slot] = data.decode("UTF-8") if is_text else data
+        try:
+            return self._contents[slot]
+        except KeyError:
+            raise ValueError(f"unknown content: {slot}") from None
+
+    def _read_external(self):
+        is_text = self._read_byte()
+        key = self._read_string()
+
+        if self._fetch is None:
+            raise ValueError("content is stored outside of the stream")
+
+        data = self._fetch(key)
+        return data.decode("UTF-8") if is_text else data
+
+    def _read_datetime(self):
+        tz = self._read_byte()
+        value = _epoch + datetime.timedelta(
+            days=self._read_int(),
+            seconds=self._read_uint(),
+            microseconds=self._read_uint(),
+        )
+
+        if tz == _TZ_UTC:
+            value = value.replace(tzinfo=dateutil.tz.UTC)
+        elif tz == _TZ_OFFSET:
+            offset = datetime.timedelta(seconds=self._read_int())
+            value = value.replace(tzinfo=datetime.timezone(offset))
+        elif tz == _TZ_NAMED:
+            name = self._read_string()
+            if name not in self._zones:
+                self._zones[name] = dateutil.tz.gettz(name)
+            value = value.replace(tzinfo=self._zones[name])
+        return value
+
+    def _read_value(self):
+        tag = self._read_byte()
+
+        if tag == _NONE:
+            return None
+        elif tag == _TRUE:
+            return True
+        elif tag == _FALSE:
+            return False
+        elif tag == _INT:
+            return self._read_int()
+        elif tag == _FLOAT:
+            return _float.unpack(self._read_bytes(_float.size))[0]
+        elif tag == _STR:
+            return self._read_bytes().decode("UTF-8")
+        elif tag == _BYTES:
+            return self._read_bytes()
+        elif tag == _LIST:
+            return [self._read_value() for _ in range(self._read_uint())]
+        elif tag == _DICT:
+            return {
+                self._read_string(): self._read_value()
+                for _ in range(self._read_uint())
+            }
+        elif tag == _PATH:
+            return pathlib.Path(self._read_bytes().decode("UTF-8"))
+        elif tag == _DATETIME:
+            return self._read_datetime()
+        elif tag == _DATE:
+            return datetime.date.fromordinal(self._read_uint())
+        elif tag == _ITEM:
+            return self._read_item()
+        elif tag == _CONTENT:
+            return self._read_content()
+        elif tag == _EXTERNAL:
+            return self._read_external()
+        raise ValueError(f"unexpected tag: {tag}")
+
+
+def dump(items, fileobj, *, store=None):
+    """Write a stream of items to a binary file object."""
+
+    writer = Writer(fileobj, store=store)
+    for item in items:
+        writer.write(item)
+
+
+def load(fileobj, *, fetch=None):
+    """Return a stream of items read from a binary file object."""
+
+    yield from Reader(fileobj, fetch=fetch)
+
+
+def dumps(items, *, store=None):
+    """Return a stream of items as bytes."""
+
+    buffer = io.BytesIO()
+    dump(items, buffer, store=store)
+    return buffer.getvalue()
+
+
+def loads(data, *, fetch=None):
+    """Return a list of items read from bytes."""
+
+    return list(load(io.BytesIO(data), fetch=fetch))
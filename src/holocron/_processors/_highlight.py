@@ -0,0 +1,159 @@
+"""Syntax highlighting service shared between markup processors."""
+
+import collections
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+
+import pygments
+import pygments.formatters.html
+import pygments.lexers
+
+
+class Highlighter:
+    """Highlight code snippets and memorize the results.
+
+    Highlighted snippets are kept in a bounded in-memory LRU cache, and,
+    if a cache directory is given, persisted on disk so they survive
+    between builds. Cache entries are keyed by the snippet's hash, its
+    language and the options used to highlight it, so it's safe for
+    different markup processors to share one instance.
+    """
+
+    def __init__(self, *, maxsize=4096, cachedir=None):
+        self._maxsize = maxsize
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._lexers = {}
+        self._cachedir = None
+
+        if cachedir:
+            self._cachedir = pathlib.Path(cachedir, "highlight")
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_lexer(self, language):
+        # Looking up a lexer by its name is anything but cheap in Pygments,
+        # since it walks through all known lexers and imports the matched
+        # one. Lexers are stateless, so they can safely be reused.
+        try:
+            return self._lexers[language]
+        except KeyError:
+            lexer = pygments.lexers.get_lexer_by_name(language)
+            self._lexers[language] = lexer
+            return lexer
+
+    def highlight(self, code, language, **options):
+        """Return a given code highlighted as HTML."""
+
+        html = self.lookup(code, language, options)
+
+        if html is None:
+            html = pygments.highlight(
+                code,
+                self.get_lexer(language),
+                pygments.formatters.html.HtmlFormatter(**options),
+            )
+            self.store(code, language, options, html)
+        return html
+
+    def lookup(self, code, language, options):
+        """Return a memorized value for a given snippet, or None."""
+
+        key = _makekey(code, language, options)
+
+        # Pipes may run concurrently in one process, and they share
+        # highlighters. LRU bookkeeping is not atomic, hence the lock.
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = self._load(key)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def store(self, code, language, options, value):
+        """Memorize a value for a given snippet.
+
+        The value must be JSON serializable, since it may be persisted on
+        disk.
+        """
+
+        key = _makekey(code, language, options)
+
+        with self._lock:
+            self._remember(key, value)
+        self._dump(key, value)
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
+
+    def _getpath(self, key):
+        digest = hashlib.sha1(repr(key).encode("UTF-8")).hexdigest()
+        return self._cachedir.joinpath(digest[:2], digest + ".json")
+
+    def _load(self, key):
+        if not self._cachedir:
+            return None
+
+        try:
+            with self._getpath(key).open("rt", encoding="UTF-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _dump(self, key, value):
+        if not self._cachedir:
+            return
+
+        path = self._getpath(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first and then move it in place, so
+        # concurrent builds never see partially written cache entries.
+        fd, tmppath = tempfile.mkstemp(dir=str(path.parent))
+        with open(fd, "wt", encoding="UTF-8") as f:
+            json.dump(value, f)
+        os.replace(tmppath, str(path))
+
+
+def _makekey(code, language, options):
+    # Pygments version is a part of the key because a new version may produce
+    # different markup for the very same snippet, and hence persisted
+    # entries must be invalidated.
+    return (
+        hashlib.sha1(code.encode("UTF-8")).hexdigest(),
+        language,
+        repr(sorted(options.items())),
+        pygments.__version__,
+    )
+
+
+_highlighters = {}
+
+
+def get_highlighter(cachedir=None):
+    """Return a highlighter instance shared across processors."""
+
+    key = str(cachedir) if cachedir else None
+
+    if key not in _highlighters:
+        _highlighters[key] = Highlighter(cachedir=cachedir)
+    return _highlighters[key]
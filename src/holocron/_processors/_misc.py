@@ -1,14 +1,23 @@
 """Various miscellaneous functions to make code easier to read & write."""
 
 import copy
+import collections
 import collections.abc
 import inspect
+import itertools
 import logging
 import functools
+import gzip
+import io
+import pathlib
+import struct
 import urllib.parse
+import zlib
 
-import jsonschema
 import jsonpointer
+import more_itertools
+
+import holocron
 
 
 _logger = logging.getLogger("holocron")
@@ -79,6 +88,11 @@ class parameters:
                     arguments[param] = kwargs[param] = value
 
             if self._jsonschema:
+                # Jsonschema is quite heavy to import, and since processors
+                # are imported lazily, we'd better postpone its import until
+                # it's really required.
+                import jsonschema
+
                 try:
                     format_checker = jsonschema.FormatChecker()
 
@@ -121,3 +135,277 @@ class parameters:
             return fn(app, *args, **kwargs)
 
         return wrapper
+
+
+def paginate_items(
+    app, items, *, scheme, save_as, paginate, paginate_as, **properties
+):
+    """Return pages that list given items, the way archives do.
+
+    Items are listed the latest first, while ones with no 'published'
+    property go last, retaining their order. Items are split into chunks of
+    'paginate' items each, or go to one page if it's not set. The first page
+    is saved as 'save_as', while others are saved as 'paginate_as' formatted
+    with a page number. If 'paginate_as' is not set, the others go to
+    'page/{page}' next to the first one. Pages carry 'items', 'groups'
+    (items grouped by year), 'pagination' if items are paginated, and given
+    properties.
+    """
+
+    # Sorting and grouping items in templates means doing that on every
+    # render, and that's not something templates are good at. So let's do
+    # it once here.
+    items = sorted(
+        items,
+        key=lambda item: ("published" in item, item.get("published")),
+        reverse=True,
+    )
+
+    if paginate_as is None:
+        save_as_ = pathlib.PurePosixPath(save_as)
+        paginate_as = str(save_as_.parent / "page" / "{page}" / save_as_.name)
+
+    if paginate:
+        chunks = list(more_itertools.chunked(items, paginate)) or [[]]
+    else:
+        chunks = [items]
+
+    pages = []
+    for number, chunk in enumerate(chunks, start=1):
+        destination = save_as
+        if number > 1:
+            destination = paginate_as.format(page=number)
+
+        pages.append(
+            holocron.WebSiteItem(
+                {
+                    "source": pathlib.Path(f"{scheme}://", destination),
+                    "destination": pathlib.Path(destination),
+                    "items": chunk,
+                    "groups": _groupby_year(chunk),
+                    "baseurl": app.metadata["url"],
+                    **properties,
+                }
+            )
+        )
+
+    # Pages refer to each other by URLs rather than by items in order to
+    # avoid reference cycles, which prevent pages from being freed as soon
+    # as they aren't used.
+    if paginate:
+        for number, page in enumerate(pages, start=1):
+            page["pagination"] = {
+                "page": number,
+                "pages": len(pages),
+                "prev": pages[number - 2]["url"] if number > 1 else None,
+                "next": pages[number]["url"] if number < len(pages) else None,
+            }
+    return pages
+
+
+def _groupby_year(items):
+    def _year(item):
+        return item["published"].year if "published" in item else None
+
+    return [
+        (year, list(group))
+        for year, group in itertools.groupby(items, key=_year)
+    ]
+
+
+def gzip_compress(data):
+    """Return data compressed by gzip, the same for the same data.
+
+    Compressed data is usually saved and served as is, so it's compressed
+    once at the best level. Modification time is not recorded, so builds
+    are reproducible.
+    """
+
+    buffer = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=buffer, mode="wb", compresslevel=9, mtime=0
+    ) as compressed:
+        compressed.write(data)
+    return buffer.getvalue()
+
+
+def gzip_uptodate(path, data):
+    """Return whether a gzip file at a given path holds given data."""
+
+    # Gzip files end with CRC-32 and size of uncompressed data, and checking
+    # them is way cheaper than either decompressing or compressing data.
+    try:
+        with open(path, "rb") as compressed:
+            compressed.seek(-8, io.SEEK_END)
+            crc, size = struct.unpack("<II", compressed.read(8))
+    except OSError:
+        return False
+    return (crc, size) == (zlib.crc32(data), len(data) & 0xFFFFFFFF)
+
+
+class ItemMap:
+    """Stream of items produced by applying map functions to a stream.
+
+    Map functions receive a list of items and return a list of the same
+    items, and they are applied one after another to batches of items.
+    Adjacent item maps in a pipe are fused by Holocron core into one, so
+    batches aren't passed through a chain of generators and processors loop
+    over plain lists. If 'workers' is set, batches are mapped in a pool of
+    worker processes.
+    """
+
+    def __init__(self, functions, stream, *, batchsize=1, workers=None):
+        self.functions = list(functions)
+        self.stream = stream
+        self.batchsize = batchsize
+        self.workers = workers
+        self._iterator = None
+
+    def __iter__(self):
+        # Batches are flattened by a built-in iterator rather than by a
+        # generator, so nothing but map functions is run for every item.
+        if self._iterator is None:
+            self._iterator = itertools.chain.from_iterable(self._iterate())
+        return self._iterator
+
+    def __next__(self):
+        return next(iter(self))
+
+    def _iterate(self):
+        batches = more_itertools.chunked(self.stream, self.batchsize)
+        mapped = None
+
+        if self.workers:
+            import multiprocessing
+
+            # Map functions are usually closures, and closures cannot be
+            # pickled. Forked workers, however, inherit them from the parent
+            # process, so only items travel between processes. Where fork is
+            # not available, items are mapped in the current process.
+            if "fork" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("fork")
+                mapped = self._map_in_pool(batches, context)
+
+        yield from mapped or map(self._map, batches)
+
+        # Map functions may accumulate some statistics worth reporting, or
+        # hold resources worth releasing once the stream is exhausted.
+        for function in self.functions:
+            if hasattr(function, "close"):
+                function.close()
+
+    def _map(self, batch):
+        for function in self.functions:
+            batch = function(batch)
+        return batch
+
+    def _map_in_pool(self, batches, context):
+        pool = context.Pool(
+            self.workers,
+            initializer=_init_map_worker,
+            initargs=(self.functions,),
+        )
+
+        # The number of batches in flight is bounded, so the stream is never
+        # consumed further than workers can keep up with.
+        pending = collections.deque()
+
+        def receive():
+            batch, result = pending.popleft()
+            mapped, counters = result.get()
+
+            # Statistics that map functions gather in workers are merged
+            # back, so they are reported as if items were mapped here.
+            for function, counter in zip(self.functions, counters):
+                if counter is not None:
+                    function.counters.update(counter)
+
+            # Items that come back from workers are copies. Their state is
+            # moved to the original items, so items keep their identity no
+            # matter where they were mapped, which is what processors such
+            # as 'when' rely upon.
+            if len(mapped) == len(batch):
+                for original, item in zip(batch, mapped):
+                    if type(original) is type(item):
+                        vars(original).update(vars(item))
+                mapped = batch
+            return mapped
+
+        try:
+            for batch in batches:
+                pending.append(
+                    (batch, pool.apply_async(_map_batch, (batch,)))
+                )
+
+                if len(pending) > self.workers * 2:
+                    yield receive()
+
+            while pending:
+                yield receive()
+
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+# Map functions a worker process applies to items. They are set by the pool
+# initializer and inherited from the parent process.
+_map_functions = []
+
+
+def _init_map_worker(functions):
+    global _map_functions
+    _map_functions = functions
+
+
+def _map_batch(batch):
+    for function in _map_functions:
+        batch = function(batch)
+
+    # Map functions may count things in 'counters' attribute. Counted in a
+    # worker, they are sent back to the parent process and reset here.
+    counters = []
+    for function in _map_functions:
+        counter = getattr(function, "counters", None)
+        if counter is not None:
+            counters.append(collections.Counter(counter))
+            counter.clear()
+        else:
+            counters.append(None)
+    return batch, counters
+
+
+def itemmap(fn):
+    """Turn a factory of an item map function into a processor.
+
+    A decorated function receives processor's arguments and must return a
+    function that receives a list of items and returns a list of the same
+    items. Such processors are stateless in the sense that each item is
+    processed independently of others, which allows Holocron core to fuse
+    adjacent ones, to pass them batches of items, and to map batches in
+    parallel.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(app, stream, *args, **kwargs):
+        # Outside of Holocron core, items are mapped one at a time in order
+        # to preserve the streaming nature of the processor, i.e. an item is
+        # passed down the stream as soon as it's processed.
+        return ItemMap([fn(app, *args, **kwargs)], stream)
+
+    # Processors receive a stream of items as the second argument, while
+    # factories don't need one. Since the signature is used to validate
+    # processor's arguments, let's pretend the stream is there.
+    signature = inspect.signature(fn)
+    app, *parameters = signature.parameters.values()
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            app,
+            inspect.Parameter(
+                "stream", inspect.Parameter.POSITIONAL_OR_KEYWORD
+            ),
+            *parameters,
+        ]
+    )
+    return wrapper
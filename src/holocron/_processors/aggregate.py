@@ -0,0 +1,110 @@
+"""Pass a stream once through many aggregating processors."""
+
+import collections.abc
+
+from .._core.items import project
+from ._misc import parameters
+
+
+def _collect_item_refs(node):
+    # Feed processor picks item's properties by means of JSON references,
+    # so the only properties it needs are the ones referenced.
+    if isinstance(node, collections.abc.Mapping):
+        if isinstance(node.get("$ref"), str):
+            uri, _, pointer = node["$ref"].partition("#")
+            if uri == "item:":
+                yield pointer.lstrip("/").split("/")[0]
+        else:
+            for value in node.values():
+                yield from _collect_item_refs(value)
+    elif isinstance(node, collections.abc.Sequence) and not isinstance(
+        node, str
+    ):
+        for value in node:
+            yield from _collect_item_refs(value)
+
+
+def _taxonomy_fields(*, key="tags", fields=["published", "title"], **kwargs):
+    # Taxonomy processor classifies items by a property that's not
+    # necessarily among the ones it keeps for pages.
+    return None if fields is None else {key, *fields}
+
+
+# Built-in aggregating processors know what properties they need, so
+# users don't have to declare them.
+_fields = {
+    "archive": lambda args: args.get("fields", ["published", "title"]),
+    "feed": lambda args: {"published"}
+    | set(_collect_item_refs(args.get("item", {}))),
+    "sitemap": lambda args: {"updated"},
+    "taxonomy": lambda args: _taxonomy_fields(**args),
+}
+
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "aggregators": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "args": {"type": "object"},
+                        "fields": {
+                            "anyOf": [
+                                {"type": "array", "items": {"type": "string"}},
+                                {"type": "null"},
+                            ]
+                        },
+                    },
+                    "required": ["name"],
+                    "additionalProperties": False,
+                },
+            }
+        },
+    }
+)
+def process(app, stream, *, aggregators):
+    fields = set()
+
+    for aggregator in aggregators:
+        if "fields" in aggregator:
+            required = aggregator["fields"]
+        elif aggregator["name"] in _fields:
+            required = _fields[aggregator["name"]](aggregator.get("args", {}))
+        else:
+            required = None
+
+        # If at least one aggregator did not tell what it needs, there's no
+        # other way but to pass whole items.
+        if required is None:
+            fields = None
+            break
+        fields.update(required)
+
+    # Items are passed down the stream as soon as possible, while aggregators
+    # receive their projections once the stream is exhausted. Projections
+    # carry only required properties, so it's cheap to keep them in memory
+    # even for large streams.
+    records = []
+
+    for item in stream:
+        records.append(item if fields is None else project(item, fields))
+        yield item
+
+    # Every aggregator receives the same records, the ones of the input
+    # stream, and nothing produced by other aggregators. Aggregators expect
+    # items of a particular shape (e.g. feed needs 'published', sitemap
+    # needs 'updated'), and pages produced by one aggregator usually don't
+    # have it. Items produced by aggregators go at the end of the stream.
+    passthrough = set(map(id, records))
+
+    for aggregator in aggregators:
+        for item in app.invoke(
+            [{"name": aggregator["name"], "args": aggregator.get("args", {})}],
+            list(records),
+        ):
+            if id(item) not in passthrough:
+                yield item
@@ -1,10 +1,9 @@
 """Generate an archive page."""
 
 import itertools
-import pathlib
 
-import holocron
-from ._misc import parameters
+from .._core.items import project
+from ._misc import paginate_items, parameters
 
 
 @parameters(
@@ -13,21 +12,50 @@ from ._misc import parameters
         "properties": {
             "template": {"type": "string"},
             "save_as": {"type": "string"},
+            "fields": {
+                "anyOf": [
+                    {"type": "array", "items": {"type": "string"}},
+                    {"type": "null"},
+                ]
+            },
+            "paginate": {
+                "anyOf": [
+                    {"type": "integer", "exclusiveMinimum": 0},
+                    {"type": "null"},
+                ]
+            },
+            "paginate_as": {"type": "string"},
         },
     }
 )
-def process(app, stream, *, template="archive.j2", save_as="index.html"):
+def process(
+    app,
+    stream,
+    *,
+    template="archive.j2",
+    save_as="index.html",
+    fields=["published", "title"],
+    paginate=None,
+    paginate_as=None,
+):
     passthrough, stream = itertools.tee(stream)
 
-    index = holocron.WebSiteItem(
-        {
-            "source": pathlib.Path("archive://", save_as),
-            "destination": pathlib.Path(save_as),
-            "template": template,
-            "items": list(stream),
-            "baseurl": app.metadata["url"],
-        }
+    # Archive page is usually rendered at the very end of the pipe, so
+    # keeping whole items (with rendered content) means keeping the whole
+    # site in memory. Since archive page needs just few properties of items,
+    # let's keep only them unless asked otherwise.
+    if fields is not None:
+        stream = (project(item, fields) for item in stream)
+
+    pages = paginate_items(
+        app,
+        stream,
+        scheme="archive",
+        save_as=save_as,
+        paginate=paginate,
+        paginate_as=paginate_as,
+        template=template,
     )
 
     yield from passthrough
-    yield index
+    yield from pages
@@ -4,6 +4,7 @@ import operator
 
 import more_itertools
 
+from .._core.items import project
 from ._misc import parameters
 
 
@@ -13,10 +14,23 @@ from ._misc import parameters
         "properties": {
             "order_by": {"type": "string"},
             "direction": {"type": "string", "enum": ["asc", "desc"]},
+            "fields": {
+                "anyOf": [
+                    {"type": "array", "items": {"type": "string"}},
+                    {"type": "null"},
+                ]
+            },
         },
     }
 )
-def process(app, stream, *, order_by=None, direction=None):
+def process(
+    app,
+    stream,
+    *,
+    order_by=None,
+    direction=None,
+    fields=["published", "title"],
+):
     if direction and not order_by:
         raise ValueError("'direction' cannot be set without 'order_by'")
 
@@ -30,10 +44,17 @@ def process(app, stream, *, order_by=None, direction=None):
             reverse=direction == "desc",
         )
 
+    # Linking items to each other directly creates a reference cycle through
+    # the whole stream, so no item can be freed until the garbage collector
+    # breaks it. That's why items are linked to lightweight projections of
+    # their neighbours, unless asked otherwise.
+    def _summarize(item):
+        return item if fields is None else project(item, fields)
+
     for prev, curr in more_itertools.windowed(stream, 2):
         if curr:
-            curr["prev"] = prev
-            prev["next"] = curr
+            curr["prev"] = _summarize(prev)
+            prev["next"] = _summarize(curr)
 
         if prev:
             yield prev
@@ -0,0 +1,109 @@
+"""Save a stream of items, so a pipe can be resumed from this point."""
+
+import collections.abc
+import functools
+import hashlib
+import os
+import pathlib
+
+from .._core import serialization
+from ._misc import parameters, resolve_json_references
+
+
+def _store(objects, data):
+    # Content is stored by its hash, so unchanged content is written once
+    # no matter how many times a stream is saved, and it's never held in
+    # memory while the rest of an item is read.
+    digest = hashlib.sha256(data).hexdigest()
+    path = objects / digest[:2] / digest[2:]
+
+    if not path.exists():
+        path.parent.mkdir(exist_ok=True, parents=True)
+        path.with_suffix(".tmp").write_bytes(data)
+        os.replace(path.with_suffix(".tmp"), path)
+    return digest
+
+
+def _fetch(objects, digest):
+    return (objects / digest[:2] / digest[2:]).read_bytes()
+
+
+def _dump(stream, to, name):
+    objects = to / "objects"
+    path = to / f"{name}.items"
+    path.parent.mkdir(exist_ok=True, parents=True)
+
+    with open(f"{path}.tmp", "wb") as f:
+        serialization.dump(stream, f, store=functools.partial(_store, objects))
+
+    # Only a stream that has been saved as a whole can be resumed from.
+    os.replace(f"{path}.tmp", path)
+
+
+def load(to, name):
+    """Return a stream of items saved by a given checkpoint."""
+
+    to = pathlib.Path(to)
+    path = to / f"{name}.items"
+
+    if not path.exists():
+        raise ValueError(f"checkpoint has not been saved: '{name}'")
+
+    with open(path, "rb") as f:
+        yield from serialization.load(
+            f, fetch=functools.partial(_fetch, to / "objects")
+        )
+
+
+def resume(app, pipe, name):
+    """Return a stream of a pipe resumed from a given checkpoint.
+
+    A stream saved by the checkpoint is passed to processors that follow
+    the checkpoint in the pipe, while processors that precede it are not
+    invoked at all.
+    """
+
+    if isinstance(pipe, str):
+        if pipe not in app.pipes:
+            raise ValueError(f"no such pipe: '{pipe}'")
+        pipe = app.pipes[pipe]
+
+    # A stage of a graph consumes streams of other stages, and there's no
+    # telling which of them to re-run when resuming from its middle.
+    if isinstance(pipe, collections.abc.Mapping):
+        raise ValueError("cannot resume a graph pipe from a checkpoint")
+
+    for index, processor in enumerate(pipe):
+        if processor.get("name") != "checkpoint":
+            continue
+
+        args = resolve_json_references(
+            processor.get("args", {}), {"metadata:": app.metadata}
+        )
+
+        if args.get("name") == name:
+            following = index + 1
+            return app.invoke(
+                pipe[following:], load(args.get("to", "_checkpoints"), name)
+            )
+
+    raise ValueError(f"no such checkpoint: '{name}'")
+
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "pattern": r"^[\w.-]+$"},
+            "to": {"type": "string", "format": "path"},
+        },
+    }
+)
+def process(app, stream, *, name, to="_checkpoints"):
+    to = pathlib.Path(to)
+
+    # The stream has to be saved as a whole before it goes any further, or a
+    # failure down the pipe would leave nothing to resume from. Items are
+    # read back from disk, so they are not kept in memory in the meantime.
+    _dump(stream, to, name)
+    yield from load(to, name)
@@ -4,29 +4,15 @@ import io
 import logging
 
 import mistletoe
-import pygments
-import pygments.formatters.html
-import pygments.lexers
 import pygments.util
 
-from ._misc import parameters
+from ._highlight import get_highlighter
+from ._misc import itemmap, parameters
 
 
 _logger = logging.getLogger("holocron")
 
 
-def _pygmentize(code, language):
-    try:
-        formatter = _pygmentize.formatter
-    except AttributeError:
-        formatter = (
-            _pygmentize.formatter
-        ) = pygments.formatters.html.HtmlFormatter()
-
-    lexer = pygments.lexers.get_lexer_by_name(language)
-    return pygments.highlight(code, lexer, formatter)
-
-
 class _HTMLRenderer(mistletoe.HTMLRenderer):
     def __init__(self, *extras, pygmentize):
         super(_HTMLRenderer, self).__init__(*extras)
@@ -59,22 +45,30 @@ class _HTMLRenderer(mistletoe.HTMLRenderer):
 
 
 @parameters(
+    fallback={"cachedir": "metadata://#/cachedir"},
     jsonschema={
         "type": "object",
-        "properties": {"pygmentize": {"type": "boolean"}},
-    }
+        "properties": {
+            "pygmentize": {"type": "boolean"},
+            "cachedir": {"type": "string", "format": "path"},
+        },
+    },
 )
-def process(app, stream, *, pygmentize=False):
-    pygmentize = pygmentize and _pygmentize
+@itemmap
+def process(app, *, pygmentize=False, cachedir=None):
+    pygmentize = pygmentize and get_highlighter(cachedir).highlight
+
+    def convert(items):
+        for item in items:
+            with _HTMLRenderer(pygmentize=pygmentize) as renderer:
+                item["content"] = renderer.render(
+                    mistletoe.Document(io.StringIO(item["content"]))
+                ).strip()
 
-    for item in stream:
-        with _HTMLRenderer(pygmentize=pygmentize) as renderer:
-            item["content"] = renderer.render(
-                mistletoe.Document(io.StringIO(item["content"]))
-            ).strip()
+            if "title" in renderer.extracted:
+                item["title"] = item.get("title", renderer.extracted["title"])
 
-        if "title" in renderer.extracted:
-            item["title"] = item.get("title", renderer.extracted["title"])
+            item["destination"] = item["destination"].with_suffix(".html")
+        return items
 
-        item["destination"] = item["destination"].with_suffix(".html")
-        yield item
+    return convert
@@ -4,7 +4,11 @@ import itertools
 import pathlib
 
 import feedgen.feed
-import pkg_resources
+
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:
+    import importlib_metadata
 
 import holocron
 from ._misc import parameters, resolve_json_references
@@ -85,7 +89,7 @@ def process(
     feed_generator.link(_resolvefeed("link"), replace=True)
     feed_generator.category(_resolvefeed("category"), replace=True)
     feed_generator.contributor(_resolvefeed("contributor"), replace=True)
-    _generator_version = pkg_resources.get_distribution("holocron").version
+    _generator_version = importlib_metadata.version("holocron")
     feed_generator.generator(
         generator=f"Holocron/v{_generator_version}",
         version=_generator_version,
@@ -0,0 +1,157 @@
+"""Fingerprint assets, so they can be cached forever."""
+
+import hashlib
+import itertools
+import re
+
+from ._misc import parameters
+
+
+# References are matched only as whole attribute values or CSS 'url()'
+# arguments, possibly followed by a query or fragment.
+_lookbehind, _lookahead = r"(?<=[\"'(=\s])", r"(?=[\"')\s?#>])"
+_re_reference = re.compile(_lookbehind + r"([^\"'()\s?#>]+)" + _lookahead)
+
+
+def _compile(references):
+    # Longer URLs go first, so '/static/a.css.map' isn't matched as
+    # '/static/a.css'.
+    return re.compile(
+        r"%s(%s)%s"
+        % (
+            _lookbehind,
+            "|".join(
+                re.escape(url)
+                for url in sorted(references, key=len, reverse=True)
+            ),
+            _lookahead,
+        )
+    )
+
+
+@parameters(
+    fallback={"encoding": "metadata://#/encoding"},
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "pattern": {"type": "string"},
+            "length": {"type": "integer", "minimum": 4, "maximum": 40},
+            "rewrite": {"type": "array", "items": {"type": "string"}},
+            "encoding": {"type": "string", "format": "encoding"},
+        },
+    },
+)
+def process(
+    app,
+    stream,
+    *,
+    pattern=r"static/",
+    length=8,
+    rewrite=[],
+    encoding="UTF-8",
+):
+    re_pattern = re.compile(pattern)
+    references = {}
+    fingerprinted_urls = set()
+
+    # Metadata is the way processors pass artifacts to each other, and
+    # that's how the jinja2 processor resolves 'asset_url()'. The manifest
+    # is updated as assets pass by, so it's ready as soon as they are.
+    manifest = dict(app.metadata.get("assets", {}))
+    app.metadata["assets"] = manifest
+
+    def fingerprint(item):
+        content = item["content"]
+        if isinstance(content, str):
+            content = content.encode(encoding)
+
+        # Content is hashed right from the item, no matter whether it came
+        # from a file or was produced, so files are never read again.
+        digest = hashlib.sha1(content).hexdigest()[:length]
+        destination = item["destination"]
+        url, absurl = item["url"], item["absurl"]
+
+        item["destination"] = destination.with_name(
+            f"{destination.stem}.{digest}{destination.suffix}"
+        )
+        manifest[destination.as_posix()] = item["destination"].as_posix()
+        references[url] = item["url"]
+        references[absurl] = item["absurl"]
+        fingerprinted_urls.update((item["url"], item["absurl"]))
+
+    re_references, compiled = None, 0
+
+    def rewrite_references(item):
+        nonlocal re_references, compiled
+
+        if references and compiled != len(references):
+            re_references, compiled = _compile(references), len(references)
+
+        if re_references is not None:
+            item["content"] = re_references.sub(
+                lambda match: references[match.group(1)], item["content"]
+            )
+
+    def refers_unseen(item):
+        # Only URLs of assets can be rewritten, i.e. root-relative or
+        # absolute URLs that point to paths matching the pattern.
+        baseurl = item["baseurl"].rstrip("/") + "/"
+        offset = len(baseurl)
+
+        for match in _re_reference.finditer(item["content"]):
+            # Templates may already refer to fingerprinted URLs by means of
+            # 'asset_url()', and there's nothing to wait for then.
+            url = match.group(1)
+            if url in references or url in fingerprinted_urls:
+                continue
+
+            if url.startswith(baseurl):
+                path = url[offset:]
+            elif url.startswith("/"):
+                path = url[1:]
+            else:
+                continue
+
+            if re_pattern.match(path):
+                return True
+        return False
+
+    # Items that refer to assets not seen yet have to be held until all
+    # assets are fingerprinted, while other items are rewritten and passed at
+    # once. Templates that refer to assets by means of 'asset_url()' need no
+    # rewriting at all, since the jinja2 processor emits theme statics before
+    # it renders items, and hence fingerprinted URLs are known by then. That's
+    # why rewriting is off unless asked.
+    pending = []
+
+    for item in stream:
+        if isinstance(item.get("content"), str) and (
+            item["destination"].suffix in rewrite
+        ):
+            if refers_unseen(item):
+                pending.append(item)
+                continue
+            rewrite_references(item)
+
+        if re_pattern.match(item["destination"].as_posix()):
+            fingerprint(item)
+        yield item
+
+    # Stylesheets are both assets and items that refer to assets. They are
+    # rewritten and fingerprinted first, so their fingerprints change
+    # whenever assets they refer to do, and pages refer to the right ones.
+    assets = [
+        item
+        for item in pending
+        if re_pattern.match(item["destination"].as_posix())
+    ]
+    fingerprinted = set(map(id, assets))
+    others = [item for item in pending if id(item) not in fingerprinted]
+
+    for item in itertools.chain(assets, others):
+        rewrite_references(item)
+
+        if id(item) in fingerprinted:
+            fingerprint(item)
+
+    yield from pending
@@ -4,7 +4,7 @@ import collections.abc
 import json
 import re
 
-from ._misc import parameters
+from ._misc import itemmap, parameters
 
 
 class _FrontmatterParser:
@@ -77,24 +77,27 @@ class _FrontmatterParser:
         },
     }
 )
-def process(app, stream, *, delimiter="---", overwrite=True, format=None):
+@itemmap
+def process(app, *, delimiter="---", overwrite=True, format=None):
     delimiter = re.escape(delimiter)
     parser = _FrontmatterParser(format)
-
-    for item in stream:
-        match = re.match(
-            # Match block between delimiters and block outsides of them, if
-            # the block between delimiters is on the beginning of content.
-            rf"\s*{delimiter}\s*\n(.*)\n{delimiter}\s*\n(.*)",
-            item["content"],
-            re.M | re.S,
-        )
-
-        if match:
-            frontmatter, item["content"] = match.groups()
-
-            for key, value in parser(frontmatter).items():
-                if overwrite or key not in item:
-                    item[key] = value
-
-        yield item
+    re_frontmatter = re.compile(
+        # Match block between delimiters and block outsides of them, if
+        # the block between delimiters is on the beginning of content.
+        rf"\s*{delimiter}\s*\n(.*)\n{delimiter}\s*\n(.*)",
+        re.M | re.S,
+    )
+
+    def parse(items):
+        for item in items:
+            match = re_frontmatter.match(item["content"])
+
+            if match:
+                frontmatter, item["content"] = match.groups()
+
+                for key, value in parser(frontmatter).items():
+                    if overwrite or key not in item:
+                        item[key] = value
+        return items
+
+    return parse
@@ -3,11 +3,56 @@
 import contextlib
 import sys
 
-import pkg_resources
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:
+    import importlib_metadata
 
 from ._misc import parameters
 
 
+def parse_entry_point(import_):
+    """Parse an entry point in 'name = module:attr' format."""
+
+    name, sep, value = import_.partition("=")
+
+    if not sep or not name.strip() or not value.strip():
+        raise ValueError(
+            f"EntryPoint must be in 'name = module:attr' format: {import_!r}"
+        )
+
+    return importlib_metadata.EntryPoint(
+        name.strip(), value.strip(), "holocron.processors"
+    )
+
+
+class LazyProcessor:
+    """Processor proxy that imports a processor on first use."""
+
+    def __init__(self, entry_point):
+        self._entry_point = entry_point
+        self._processor = None
+
+    def _resolve(self):
+        if self._processor is None:
+            self._processor = self._entry_point.load()
+        return self._processor
+
+    def __call__(self, app, *args, **kwargs):
+        return self._resolve()(app, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # Processors may carry attributes that are used by Holocron core. In
+        # order to be a transparent proxy, forward attribute access to an
+        # actual processor.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __repr__(self):
+        return f"<LazyProcessor {self._entry_point.value}>"
+
+
 @parameters(
     jsonschema={
         "type": "object",
@@ -18,16 +63,14 @@ from ._misc import parameters
     }
 )
 def process(app, items, *, imports, from_=None):
-    distribution = pkg_resources.get_distribution("holocron")
-
     with contextlib.ExitStack() as exit:
         if from_:
             sys.path.insert(0, from_)
             exit.callback(sys.path.pop, 0)
 
         for import_ in imports:
-            entry_point = pkg_resources.EntryPoint.parse(import_, distribution)
-            app.add_processor(entry_point.name, entry_point.resolve())
+            entry_point = parse_entry_point(import_)
+            app.add_processor(entry_point.name, entry_point.load())
 
     # Processors are generators, so we must return iterable to be compliant
     # with the protocol. The only reason why a top-level 'process' function is
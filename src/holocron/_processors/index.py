@@ -0,0 +1,184 @@
+"""Index metadata of items in SQLite, so templates can query them."""
+
+import datetime
+import os
+import pathlib
+import sqlite3
+import tempfile
+
+from .._core import serialization
+from ._misc import parameters
+
+
+_SCHEMA = """
+CREATE TABLE items (
+  id INTEGER PRIMARY KEY, source TEXT, date TEXT, data BLOB NOT NULL
+);
+CREATE TABLE tags (tag TEXT NOT NULL, item INTEGER NOT NULL);
+CREATE INDEX items_source ON items (source);
+CREATE INDEX items_date ON items (date);
+CREATE INDEX tags_tag ON tags (tag, item);
+CREATE INDEX tags_item ON tags (item);
+"""
+
+
+def _normalize(value):
+    # Dates are stored as ISO 8601 strings, which are compared as dates as
+    # long as they are in the same timezone.
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return value.replace(tzinfo=None).isoformat()
+
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time()).isoformat()
+
+    return None
+
+
+def _parse(value):
+    if isinstance(value, str):
+        import dateutil.parser
+
+        return dateutil.parser.isoparse(value)
+    return value
+
+
+class Index:
+    """Read-only view of an index that answers queries with indexed lookups.
+
+    Results are cached, since the same queries (e.g. for a sidebar) tend
+    to be made while rendering every page.
+    """
+
+    def __init__(self, path):
+        self._connection = sqlite3.connect(
+            f"{pathlib.Path(path).resolve().as_uri()}?mode=ro", uri=True
+        )
+        self._cache = {}
+
+    def close(self):
+        self._connection.close()
+
+    def _select(self, sql, parameters):
+        key = (sql, parameters)
+
+        if key not in self._cache:
+            self._cache[key] = [
+                serialization.loads(data)[0]
+                for (data,) in self._connection.execute(sql, parameters)
+            ]
+        return self._cache[key]
+
+    def query(self, tag=None, since=None, until=None, limit=None):
+        """Return items with a given tag and date, the latest first."""
+
+        sql, conditions, parameters = "SELECT data FROM items", [], []
+
+        if tag is not None:
+            sql += " JOIN tags ON tags.item = items.id"
+            conditions.append("tags.tag = ?")
+            parameters.append(tag)
+
+        if since is not None:
+            conditions.append("items.date >= ?")
+            parameters.append(_normalize(_parse(since)))
+
+        if until is not None:
+            conditions.append("items.date < ?")
+            parameters.append(_normalize(_parse(until)))
+
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY items.date DESC, items.id"
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+
+        return self._select(sql, tuple(parameters))
+
+    def related(self, item, limit=5):
+        """Return items that share most tags with a given item."""
+
+        return self._select(
+            "SELECT data FROM items"
+            " JOIN tags ON tags.item = items.id"
+            " WHERE tags.tag IN ("
+            "  SELECT tags.tag FROM tags"
+            "  JOIN items ON tags.item = items.id"
+            "  WHERE items.source = ?"
+            " )"
+            " AND items.source IS NOT ?"
+            " GROUP BY items.id"
+            " ORDER BY COUNT(*) DESC, items.date DESC, items.id"
+            " LIMIT ?",
+            (_source(item), _source(item), limit),
+        )
+
+
+def _source(item):
+    source = item.get("source")
+    return None if source is None else str(source)
+
+
+def _dumps(item):
+    # Content is usually the largest part of an item, and it's not what is
+    # queried. Besides, it's not ready yet when items are indexed.
+    stripped = item.__class__.__new__(item.__class__)
+    stripped._mapping = {
+        key: value for key, value in item._mapping.items() if key != "content"
+    }
+    return serialization.dumps([stripped])
+
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "to": {"type": "string", "format": "path"},
+            "date": {"type": "string"},
+            "tags": {"type": "string"},
+        },
+    }
+)
+def process(app, stream, *, to="_index.sqlite", date="published", tags="tags"):
+    to = pathlib.Path(to)
+    to.parent.mkdir(exist_ok=True, parents=True)
+
+    # Templates query the index while items are being rendered, so the
+    # whole stream has to be indexed before any item goes further. Items are
+    # spilled to a temporary file in the meantime and read back afterwards,
+    # so they are not kept in memory, content included.
+    with tempfile.TemporaryFile() as spill:
+        writer = serialization.Writer(spill)
+
+        with sqlite3.connect(f"{to}.tmp") as connection:
+            connection.executescript(
+                "DROP TABLE IF EXISTS items; DROP TABLE IF EXISTS tags;"
+                + _SCHEMA
+            )
+
+            for item in stream:
+                terms = item.get(tags) or []
+                if isinstance(terms, str):
+                    terms = [terms]
+
+                cursor = connection.execute(
+                    "INSERT INTO items (source, date, data) VALUES (?, ?, ?)",
+                    (_source(item), _normalize(item.get(date)), _dumps(item)),
+                )
+                connection.executemany(
+                    "INSERT INTO tags (tag, item) VALUES (?, ?)",
+                    [(term, cursor.lastrowid) for term in terms],
+                )
+                writer.write(item)
+        connection.close()
+        os.replace(f"{to}.tmp", to)
+
+        # Metadata is the way processors pass artifacts to each other, and
+        # that's how the jinja2 processor finds the index.
+        app.metadata["index"] = str(to)
+
+        spill.seek(0)
+        yield from serialization.load(spill)
@@ -1,6 +1,7 @@
 """Render items using Jinja2 template engine."""
 
 import pathlib
+import urllib.parse
 
 import jinja2
 import jsonpointer
@@ -9,6 +10,33 @@ from .. import source
 from .._misc import parameters
 
 
+# Compiling templates takes time, and compiled templates are cached by an
+# environment. Environments are shared between pipes that run in the same
+# process and use the same themes, so templates are compiled once.
+_environments = {}
+
+
+def _get_environment(themes):
+    # Relative paths are resolved against the current working directory,
+    # which may change between pipes.
+    key = tuple(str(pathlib.Path(theme).resolve()) for theme in themes)
+
+    if key not in _environments:
+        env = jinja2.Environment(
+            loader=jinja2.ChoiceLoader(
+                [
+                    jinja2.FileSystemLoader(
+                        str(pathlib.Path(theme, "templates"))
+                    )
+                    for theme in key
+                ]
+            )
+        )
+        env.filters["jsonpointer"] = jsonpointer.resolve_pointer
+        _environments[key] = env
+    return _environments[key]
+
+
 @parameters(
     jsonschema={
         "type": "object",
@@ -29,23 +57,48 @@ def process(app, stream, *, template="item.j2", context={}, themes=None):
     if themes is None:
         themes = [str(pathlib.Path(__file__).parent / "theme")]
 
-    env = jinja2.Environment(
-        loader=jinja2.ChoiceLoader(
-            [
-                jinja2.FileSystemLoader(str(pathlib.Path(theme, "templates")))
-                for theme in themes
-            ]
-        )
-    )
-    env.filters["jsonpointer"] = jsonpointer.resolve_pointer
+    env = _get_environment(themes)
+
+    # Assets may be fingerprinted, and their URLs are looked up in the
+    # manifest whenever templates ask for them, so the manifest may come
+    # from any preceding processor. Until then, logical URLs are used.
+    def asset_url(path):
+        path = str(path).lstrip("/")
+        path = app.metadata.get("assets", {}).get(path, path)
+        return "/" + urllib.parse.quote(path)
 
-    for item in stream:
-        render = env.get_template(item.get("template", template)).render
-        item["content"] = render(item=item, metadata=app.metadata, **context)
-        yield item
+    context = dict(context, asset_url=asset_url)
+    index = None
 
     # Themes may optionally come with various statics (e.g. css, images) they
     # depend on. That's why we need to inject these statics to the stream;
-    # otherwise, rendered items may look improperly.
+    # otherwise, rendered items may look improperly. Statics go first, so
+    # processors that come next (e.g. fingerprint) are done with them by the
+    # time items are rendered, and templates get final URLs of statics.
     for theme in themes:
         yield from source.process(app, [], path=theme, pattern=r"static/")
+
+    try:
+        for item in stream:
+            # An index of items, if any, is exposed to templates, so they can
+            # get site-wide data (e.g. recent posts) without having them in
+            # the stream. It's looked up once the first item is received,
+            # since that's when preceding processors are done with it.
+            if index is None and "index" in app.metadata:
+                from ..index import Index
+
+                index = Index(app.metadata["index"])
+                context = dict(
+                    context,
+                    query_index=index.query,
+                    related_items=index.related,
+                )
+
+            render = env.get_template(item.get("template", template)).render
+            item["content"] = render(
+                item=item, metadata=app.metadata, **context
+            )
+            yield item
+    finally:
+        if index is not None:
+            index.close()
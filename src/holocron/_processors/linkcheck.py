@@ -0,0 +1,101 @@
+"""Check that internal links point to existing items."""
+
+import html.parser
+import logging
+import urllib.parse
+
+from ._misc import parameters
+
+
+_logger = logging.getLogger("holocron")
+
+
+class _LinkExtractor(html.parser.HTMLParser):
+    """Collect 'href' & 'src' attributes along with their positions."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in {"href", "src"} and value:
+                self.links.append((*self.getpos(), value))
+
+
+def _normalize(path):
+    # The same URL may be written with or without percent-encoding, while
+    # items' URLs are always encoded.
+    return urllib.parse.quote(urllib.parse.unquote(path))
+
+
+def _resolve(href, base):
+    url = urllib.parse.urlsplit(urllib.parse.urljoin(base, href))
+    base = urllib.parse.urlsplit(base)
+
+    # Links that lead to other web sites, or use schemes such as 'mailto:'
+    # are not ours to check.
+    if (url.scheme, url.netloc) != (base.scheme, base.netloc):
+        return None
+    return _normalize(url.path or "/")
+
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {"fail": {"type": "boolean"}},
+    }
+)
+def process(app, stream, *, fail=False):
+    # Each item is looked at once: its URL goes to the index of known URLs,
+    # and its links are extracted as it passes by. Since a link may point to
+    # an item that comes later, only (location, link) tuples are kept till
+    # the end of the stream, not the content they were extracted from.
+    urls = set()
+    links = []
+
+    for item in stream:
+        if "url" in item:
+            # Links are resolved against items' absolute URLs, and those
+            # include a path of the web site if it's not served from the
+            # root (e.g. '/blog' of 'https://yoda.ua/blog/'). So the index
+            # is of absolute URLs' paths rather than of items' URLs.
+            basepath = urllib.parse.urlsplit(item["baseurl"]).path.rstrip("/")
+            destination = item["destination"].as_posix()
+
+            urls.add(_normalize(basepath + item["url"]))
+            urls.add(_normalize(f"{basepath}/{destination}"))
+
+            content = item.get("content")
+            if isinstance(content, str) and item["destination"].suffix in {
+                ".html",
+                ".htm",
+            }:
+                extractor = _LinkExtractor()
+                extractor.feed(content)
+                extractor.close()
+
+                for line, column, href in extractor.links:
+                    path = _resolve(href, item["absurl"])
+                    if path is not None:
+                        links.append(
+                            (item["destination"], line, column, href, path)
+                        )
+        yield item
+
+    broken = 0
+    for destination, line, column, href, path in links:
+        # Web servers usually redirect '/foo' to '/foo/' if the latter is
+        # a directory, so links that miss a trailing slash are fine.
+        if path not in urls and path + "/" not in urls:
+            broken += 1
+            _logger.warning(
+                "linkcheck: %s:%d:%d: unresolved link: '%s'",
+                destination,
+                line,
+                column + 1,
+                href,
+            )
+
+    if fail and broken:
+        raise ValueError(f"unresolved links: {broken}")
@@ -1,9 +1,15 @@
 """Convert Markdown into HTML."""
 
+import collections
+import multiprocessing
 import re
 
 import markdown
+import markdown.preprocessors
+import markdown.treeprocessors
+import more_itertools
 
+from ._highlight import get_highlighter
 from ._misc import parameters
 
 
@@ -25,18 +31,116 @@ _top_heading_re = re.compile(
 )
 
 
-@parameters(
-    jsonschema={
-        "type": "object",
-        "properties": {
-            "extensions": {
-                "type": "object",
-                "propertyNames": {"pattern": r"^markdown\.extensions\..*"},
-            }
-        },
-    }
-)
-def process(app, stream, *, extensions=None):
+class _CachedHiliteTreeprocessor(markdown.treeprocessors.Treeprocessor):
+    """Highlight indented code blocks with cache."""
+
+    def __init__(self, md, wrapped, highlighter, options):
+        super(_CachedHiliteTreeprocessor, self).__init__(md)
+        self._wrapped = wrapped
+        self._highlighter = highlighter
+        self._options = options
+
+    def run(self, root):
+        stash = self.md.htmlStash
+        misses = []
+
+        for block in root.iter("pre"):
+            if len(block) != 1 or block[0].tag != "code":
+                continue
+
+            code = block[0].text
+            if code is None:
+                continue
+
+            html = self._highlighter.lookup(code, None, self._options)
+            if html is None:
+                misses.append(code)
+                continue
+
+            # Replace a code block with a placeholder in exactly the same way
+            # 'codehilite' does, so the result is indistinguishable.
+            block.clear()
+            block.tag = "p"
+            block.text = stash.store(html)
+
+        # Codehilite stashes one HTML block per code block in order of their
+        # appearance, so cache misses can be matched with highlighted HTML.
+        # Just in case it's not so, we'd better not cache anything.
+        start = len(stash.rawHtmlBlocks)
+        self._wrapped.run(root)
+        stashed = stash.rawHtmlBlocks[start:]
+
+        if len(stashed) == len(misses):
+            for code, html in zip(misses, stashed):
+                self._highlighter.store(code, None, self._options, html)
+
+
+class _CachedFencedBlockPreprocessor(markdown.preprocessors.Preprocessor):
+    """Highlight fenced code blocks with cache."""
+
+    def __init__(self, md, wrapped, highlighter, options):
+        super(_CachedFencedBlockPreprocessor, self).__init__(md)
+        self._wrapped = wrapped
+        self._highlighter = highlighter
+        self._options = dict(options, fenced=True)
+
+    def run(self, lines):
+        stash = self.md.htmlStash
+        misses = []
+
+        def substitute(match):
+            code = match.group(0)
+            html = self._highlighter.lookup(code, None, self._options)
+
+            if html is None:
+                misses.append(code)
+                return code
+            return f"\n{stash.store(html)}\n"
+
+        lines = self._wrapped.FENCED_BLOCK_RE.sub(
+            substitute, "\n".join(lines)
+        ).split("\n")
+
+        start = len(stash.rawHtmlBlocks)
+        lines = self._wrapped.run(lines)
+        stashed = stash.rawHtmlBlocks[start:]
+
+        if len(stashed) == len(misses):
+            for code, html in zip(misses, stashed):
+                self._highlighter.store(code, None, self._options, html)
+        return lines
+
+
+def _cache_highlighting(markdown_, highlighter):
+    # Codehilite extension has no extension points to plug a cache into, so
+    # we wrap both places where it's used, and serve known code blocks from
+    # the cache before the wrapped processors even see them.
+    if "hilite" not in markdown_.treeprocessors:
+        return
+
+    hilite = markdown_.treeprocessors["hilite"]
+    options = dict(hilite.config, tab_length=markdown_.tab_length)
+
+    markdown_.treeprocessors.register(
+        _CachedHiliteTreeprocessor(markdown_, hilite, highlighter, options),
+        "hilite",
+        30,
+    )
+
+    if "fenced_code_block" in markdown_.preprocessors:
+        markdown_.preprocessors.register(
+            _CachedFencedBlockPreprocessor(
+                markdown_,
+                markdown_.preprocessors["fenced_code_block"],
+                highlighter,
+                options,
+            ),
+            "fenced_code_block",
+            25,
+        )
+
+
+def _create_markdown(extensions, cachedir):
     markdown_ = markdown.Markdown(
         # No one use pure Markdown nowadays, so let's enhance it with some
         # popular and widely used extensions such as tables, footnotes and
@@ -55,21 +159,114 @@ def process(app, stream, *, extensions=None):
             }
         },
     )
+    _cache_highlighting(markdown_, get_highlighter(cachedir))
+    return markdown_
+
+
+def _convert(markdown_, content):
+    title = None
+    match = _top_heading_re.match(content)
+
+    if match:
+        title = match.group("heading").strip()
+        content = match.group("content").strip()
+
+    # Markdown instance keeps a state of a converted document (e.g. stashed
+    # HTML blocks or footnotes), which must not leak to the next one.
+    html = markdown_.convert(content)
+    markdown_.reset()
+    return title, html
 
-    for item in stream:
-        match = _top_heading_re.match(item["content"])
 
-        if match:
-            title = match.group("heading").strip()
-            item["content"] = match.group("content").strip()
+# Each worker process owns its Markdown instance, which is created once by
+# the pool initializer and then reused for all documents the worker gets.
+_worker_markdown = None
+
+
+def _init_worker(extensions, cachedir):
+    global _worker_markdown
+    _worker_markdown = _create_markdown(extensions, cachedir)
+
+
+def _convert_chunk(contents):
+    return [_convert(_worker_markdown, content) for content in contents]
+
+
+def _convert_in_pool(stream, extensions, cachedir, workers, chunksize):
+    pool = multiprocessing.Pool(
+        workers, initializer=_init_worker, initargs=(extensions, cachedir)
+    )
+
+    # Items are sent to workers in chunks to amortize IPC costs, and only
+    # content travels between processes while items stay in the parent. The
+    # number of chunks in flight is bounded, so the stream is never consumed
+    # further than workers can keep up with. Items come out in the order they
+    # came in and keep their identity, which is what 'when' relies upon to
+    # keep untouched items in place despite the look-ahead.
+    pending = collections.deque()
+
+    try:
+        for chunk in more_itertools.chunked(stream, chunksize):
+            contents = [item["content"] for item in chunk]
+            result = pool.apply_async(_convert_chunk, (contents,))
+            pending.append((chunk, result))
+
+            if len(pending) > workers * 2:
+                chunk, result = pending.popleft()
+                yield from zip(chunk, result.get())
+
+        while pending:
+            chunk, result = pending.popleft()
+            yield from zip(chunk, result.get())
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+@parameters(
+    fallback={"cachedir": "metadata://#/cachedir"},
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "extensions": {
+                "type": "object",
+                "propertyNames": {"pattern": r"^markdown\.extensions\..*"},
+            },
+            "cachedir": {"type": "string", "format": "path"},
+            "workers": {
+                "anyOf": [
+                    {"type": "integer", "minimum": 1},
+                    {"type": "null"},
+                ]
+            },
+            "chunksize": {"type": "integer", "minimum": 1},
+        },
+    },
+)
+def process(
+    app, stream, *, extensions=None, cachedir=None, workers=None, chunksize=64
+):
+    if workers is None:
+        markdown_ = _create_markdown(extensions, cachedir)
+        converted = (
+            (item, _convert(markdown_, item["content"])) for item in stream
+        )
+    else:
+        converted = _convert_in_pool(
+            stream, extensions, cachedir, workers, chunksize
+        )
 
-            # Usually converters go after frontmatter processor and that means
-            # any explicitly specified attribute is already set on the item.
-            # Since frontmatter processor is considered to have a higher
-            # priority, let's set 'title' iff it's not set.
+    for item, (title, html) in converted:
+        # Usually converters go after frontmatter processor and that means
+        # any explicitly specified attribute is already set on the item.
+        # Since frontmatter processor is considered to have a higher
+        # priority, let's set 'title' iff it's not set.
+        if title is not None:
             item["title"] = item.get("title", title)
 
-        item["content"] = markdown_.convert(item["content"])
+        item["content"] = html
         item["destination"] = item["destination"].with_suffix(".html")
 
         yield item
@@ -0,0 +1,61 @@
+"""Merge shards of items back into one stream."""
+
+import heapq
+import pathlib
+import re
+
+from .._core import serialization
+from ._misc import parameters
+from .shard import ORDINAL
+
+
+_re_shard = re.compile(r"^(\d+)-of-(\d+)\.items$")
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        for position, item in enumerate(serialization.load(f)):
+            ordinal = item.pop(ORDINAL, None)
+
+            # Items that were not produced from items of a shard go after
+            # the ones that were, just like they do in a single process.
+            yield (ordinal is None, ordinal or 0, position), item
+
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {"path": {"type": "string", "format": "path"}},
+    }
+)
+def process(app, stream, *, path="_shards"):
+    shards = {}
+
+    for entry in sorted(pathlib.Path(path).iterdir()):
+        match = _re_shard.match(entry.name)
+
+        if match:
+            shard, total = int(match.group(1)), int(match.group(2))
+            shards.setdefault(total, {})[shard] = entry
+
+    if len(shards) != 1:
+        raise ValueError(
+            f"expected shards of exactly one build: {sorted(shards)}"
+        )
+
+    ((total, found),) = shards.items()
+    missing = sorted(set(range(total)) - set(found))
+
+    if missing:
+        raise ValueError(f"missing shards: {missing}")
+
+    yield from stream
+
+    # Each shard preserves the order of items in the original stream, so
+    # the original stream is restored without reading all shards into
+    # memory.
+    for _, item in heapq.merge(
+        *(_read(found[shard]) for shard in range(total)),
+        key=lambda record: record[0],
+    ):
+        yield item
@@ -1,6 +1,6 @@
 """Set given metadata on document instances."""
 
-from ._misc import parameters
+from ._misc import itemmap, parameters
 
 
 @parameters(
@@ -12,9 +12,13 @@ from ._misc import parameters
         },
     }
 )
-def process(app, stream, *, metadata={}, overwrite=True):
-    for item in stream:
-        for key, value in metadata.items():
-            if overwrite or key not in item:
-                item[key] = value
-        yield item
+@itemmap
+def process(app, *, metadata={}, overwrite=True):
+    def setmetadata(items):
+        for item in items:
+            for key, value in metadata.items():
+                if overwrite or key not in item:
+                    item[key] = value
+        return items
+
+    return setmetadata
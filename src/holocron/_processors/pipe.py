@@ -6,7 +6,14 @@ from ._misc import parameters
 @parameters(
     jsonschema={
         "type": "object",
-        "properties": {"pipe": {"type": "array", "items": {"type": "object"}}},
+        "properties": {
+            "pipe": {
+                "anyOf": [
+                    {"type": "array", "items": {"type": "object"}},
+                    {"type": "object"},
+                ]
+            }
+        },
     }
 )
 def process(app, stream, *, pipe=[]):
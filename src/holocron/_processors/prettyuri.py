@@ -1,8 +1,10 @@
 """Strip .HTML extension from URIs."""
 
+from ._misc import itemmap
 
-def process(app, stream):
-    for item in stream:
+
+def _prettify(items):
+    for item in items:
         # Most modern HTTP servers implicitly serve one of these files when
         # requested URL is pointing to a directory on filesystem. Hence in
         # order to provide "pretty" URLs we need to transform destination
@@ -11,5 +13,9 @@ def process(app, stream):
             item["destination"] = item["destination"].parent.joinpath(
                 item["destination"].stem, "index.html"
             )
+    return items
+
 
-        yield item
+@itemmap
+def process(app):
+    return _prettify
@@ -1,19 +1,30 @@
 """Convert reStructuredText into HTML."""
 
-from docutils.core import publish_parts
+from docutils.core import Publisher
+from docutils.io import StringInput, StringOutput
+from docutils.parsers import rst
+from docutils.parsers.rst import directives
+from docutils.parsers.rst.directives import body
+from docutils.readers import standalone
 from docutils.writers import html5_polyglot
 from docutils import nodes
 
-from ._misc import parameters
+from ._highlight import get_highlighter
+from ._misc import itemmap, parameters
 
 
 @parameters(
+    fallback={"cachedir": "metadata://#/cachedir"},
     jsonschema={
         "type": "object",
-        "properties": {"settings": {"type": "object"}},
-    }
+        "properties": {
+            "settings": {"type": "object"},
+            "cachedir": {"type": "string", "format": "path"},
+        },
+    },
 )
-def process(app, stream, *, settings={}):
+@itemmap
+def process(app, *, settings={}, cachedir=None):
     settings = dict(
         {
             # We need to start heading level with <h2> in case there are
@@ -33,37 +44,88 @@ def process(app, stream, *, settings={}):
             # the former notation, so it'd be better to use it in order
             # simplify customization flow.
             "syntax_highlight": "short",
+            # Code blocks are highlighted through a highlighter shared
+            # with other markup processors, so identical snippets are
+            # highlighted only once. See '_CodeBlock' for details.
+            "holocron_highlighter": get_highlighter(cachedir),
         },
         **settings,
     )
 
-    for item in stream:
-        # Writer is mutable so we can't share the same instance between
-        # conversions.
-        writer = html5_polyglot.Writer()
+    # Docutils' 'publish_parts' creates a publisher with a fresh set of
+    # components and, what's more expensive, computes runtime settings from
+    # scratch on each call. Neither settings nor components depend on the
+    # content being converted, so they are created once per invocation. The
+    # reader, the parser and the writer set up their per-document state each
+    # time they are called, thus the only thing to reset between items is
+    # publisher's input and output.
+    publisher = Publisher(
+        reader=standalone.Reader(),
+        parser=_Parser(),
+        writer=_HTMLWriter(),
+        source_class=StringInput,
+        destination_class=StringOutput,
+    )
+    publisher.process_programmatic_settings(None, settings, None)
 
-        # Unfortunately we are not happy with out-of-box conversion to
-        # HTML. For instance, we want to see inline code to be wrapped
-        # into <code> tag rather than <span>. So we need to use custom
-        # translator to fit our needs.
-        writer.translator_class = _HTMLTranslator
+    def convert(items):
+        for item in items:
+            publisher.set_source(item["content"])
+            publisher.set_destination()
+            publisher.publish()
 
-        parts = publish_parts(
-            item["content"], writer=writer, settings_overrides=settings
-        )
+            parts = publisher.writer.parts
+            publisher.document = None
+
+            item["content"] = parts["fragment"].strip()
+            item["destination"] = item["destination"].with_suffix(".html")
+
+            # Usually converters go after frontmatter processor and that
+            # means any explicitly specified attribute is already set on
+            # the item. Since frontmatter processor is considered to
+            # have a higher priority, let's set 'title' iff it does't
+            # exist.
+            if "title" not in item and parts.get("title"):
+                item["title"] = parts["title"]
+        return items
+
+    return convert
+
+
+class _Parser(rst.Parser):
+    """Parse reStructuredText with code blocks highlighted through cache."""
 
-        item["content"] = parts["fragment"].strip()
-        item["destination"] = item["destination"].with_suffix(".html")
+    _code_directives = ("code", "code-block", "sourcecode")
 
-        # Usually converters go after frontmatter processor and that
-        # means any explicitly specified attribute is already set on
-        # the item. Since frontmatter processor is considered to
-        # have a higher priority, let's set 'title' iff it does't
-        # exist.
-        if "title" not in item and parts.get("title"):
-            item["title"] = parts["title"]
+    def parse(self, inputstring, document):
+        # Docutils looks directives up in a process-wide registry. In order
+        # not to affect other docutils users in the same process, our code
+        # block directive is registered for the time of parsing only.
+        registry = directives._directives
+        saved = {name: registry.get(name) for name in self._code_directives}
 
-        yield item
+        registry.update({name: _CodeBlock for name in self._code_directives})
+        try:
+            super(_Parser, self).parse(inputstring, document)
+        finally:
+            for name, directive in saved.items():
+                if directive is None:
+                    registry.pop(name, None)
+                else:
+                    registry[name] = directive
+
+
+class _HTMLWriter(html5_polyglot.Writer):
+    """Write HTML using a custom translator."""
+
+    def __init__(self):
+        super(_HTMLWriter, self).__init__()
+
+        # Unfortunately we are not happy with out-of-box conversion to
+        # HTML. For instance, we want to see inline code to be wrapped
+        # into <code> tag rather than <span>. So we need to use custom
+        # translator to fit our needs.
+        self.translator_class = _HTMLTranslator
 
 
 class _HTMLTranslator(html5_polyglot.HTMLTranslator):
@@ -85,3 +147,59 @@ class _HTMLTranslator(html5_polyglot.HTMLTranslator):
         # HTML tag has been produced. Thus, there's no need to call
         # depart_literal().
         raise nodes.SkipNode
+
+
+class _CodeBlock(body.CodeBlock):
+    """Highlight code blocks with cache."""
+
+    def run(self):
+        settings = self.state.document.settings
+        highlighter = getattr(settings, "holocron_highlighter", None)
+
+        if highlighter is None:
+            return super(_CodeBlock, self).run()
+
+        code = "\n".join(self.content)
+        language = self.arguments[0] if self.arguments else ""
+        options = {
+            "syntax_highlight": settings.syntax_highlight,
+            "number-lines": self.options.get("number-lines"),
+        }
+        tokens = highlighter.lookup(code, language, options)
+
+        if tokens is None:
+            rv = super(_CodeBlock, self).run()
+            highlighter.store(
+                code,
+                language,
+                options,
+                [
+                    (
+                        [node["classes"], node.astext()]
+                        if isinstance(node, nodes.inline)
+                        else [[], node.astext()]
+                    )
+                    for node in rv[0].children
+                ],
+            )
+            return rv
+
+        # Let docutils produce a literal block without highlighting, so it
+        # takes care of all directive options, and then fill it with cached
+        # tokens.
+        syntax_highlight, settings.syntax_highlight = (
+            settings.syntax_highlight,
+            "none",
+        )
+        try:
+            rv = super(_CodeBlock, self).run()
+        finally:
+            settings.syntax_highlight = syntax_highlight
+
+        rv[0].children = []
+        for classes, value in tokens:
+            if classes:
+                rv[0] += nodes.inline(value, value, classes=classes)
+            else:
+                rv[0] += nodes.Text(value)
+        return rv
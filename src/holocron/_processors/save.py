@@ -1,8 +1,16 @@
 """Save items to a filesystem."""
 
+import collections
+import concurrent.futures
+import os
 import pathlib
 
-from ._misc import parameters
+from ._misc import gzip_compress, gzip_uptodate, parameters
+
+
+def _precompress(path, data):
+    if not gzip_uptodate(path, data):
+        path.write_bytes(gzip_compress(data))
 
 
 @parameters(
@@ -12,22 +20,68 @@ from ._misc import parameters
         "properties": {
             "to": {"type": "string", "format": "path"},
             "encoding": {"type": "string", "format": "encoding"},
+            "gzip": {"type": "boolean"},
+            "gzip_min_size": {"type": "integer", "minimum": 0},
+            "gzip_suffixes": {"type": "array", "items": {"type": "string"}},
         },
     },
 )
-def process(app, stream, *, to="_site", encoding="UTF-8"):
+def process(
+    app,
+    stream,
+    *,
+    to="_site",
+    encoding="UTF-8",
+    gzip=False,
+    gzip_min_size=1024,
+    gzip_suffixes=[".css", ".html", ".js", ".json", ".svg", ".txt", ".xml"],
+):
     to = pathlib.Path(to)
 
-    for item in stream:
-        destination = to.joinpath(item["destination"])
-        destination.parent.mkdir(exist_ok=True, parents=True)
+    # Web servers (e.g. nginx with 'gzip_static') may serve precompressed
+    # siblings of files as is, so they don't have to compress them on every
+    # request. Compression happens on a pool of threads, since zlib releases
+    # the GIL while compressing. The number of items being compressed is
+    # bounded, so their content doesn't pile up in memory.
+    workers = os.cpu_count() or 1
+    executor = concurrent.futures.ThreadPoolExecutor(workers) if gzip else None
+    pending = collections.deque()
+
+    try:
+        for item in stream:
+            destination = to.joinpath(item["destination"])
+            destination.parent.mkdir(exist_ok=True, parents=True)
+
+            # Content may be either bytes or string based on the type of
+            # content we deal with (e.g. pictures, pages, etc), and therefore
+            # this content must be saved accordingly.
+            if isinstance(item["content"], str):
+                destination.write_text(item["content"], encoding=encoding)
+            else:
+                destination.write_bytes(item["content"])
+
+            if gzip and destination.suffix in gzip_suffixes:
+                compressed = destination.with_name(destination.name + ".gz")
+                data = item["content"]
+                if isinstance(data, str):
+                    data = data.encode(encoding)
+
+                # Small files don't benefit from compression, yet their
+                # compressed siblings of previous builds must not be served.
+                if len(data) >= gzip_min_size:
+                    pending.append(
+                        executor.submit(_precompress, compressed, data)
+                    )
+                elif compressed.exists():
+                    compressed.unlink()
+
+                while len(pending) > workers * 4:
+                    pending.popleft().result()
 
-        # Content may be either bytes or string based on the type of content we
-        # deal with (e.g. pictures, pages, etc), and therefore this content
-        # must be saved accordingly.
-        if isinstance(item["content"], str):
-            destination.write_text(item["content"], encoding=encoding)
-        else:
-            destination.write_bytes(item["content"])
+            yield item
 
-        yield item
+        while pending:
+            pending.popleft().result()
+    finally:
+        if executor is not None:
+            executor.shutdown()
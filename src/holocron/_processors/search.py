@@ -0,0 +1,141 @@
+"""Generate a static full-text search index.
+
+The index consists of a manifest and shards. The manifest lists indexed
+documents as [url, title] pairs, and maps term prefixes to URLs of shards.
+A shard maps terms starting with the prefix to postings, which are flat
+lists of [document, frequency, ...] pairs with documents encoded as deltas
+from the previous ones. So a browser fetches the manifest, and then only
+the shards the terms of a query fall into.
+"""
+
+import collections
+import html.parser
+import json
+import pathlib
+import re
+
+import holocron
+from ._misc import parameters
+
+
+_TOKEN = re.compile(r"\w+")
+
+
+class _TextExtractor(html.parser.HTMLParser):
+    """Collect text of an HTML document, skipping scripts & styles."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in {"script", "style"}:
+            self._skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in {"script", "style"} and self._skipping:
+            self._skipping -= 1
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self.text.append(data)
+
+
+def _strip(content):
+    extractor = _TextExtractor()
+    extractor.feed(content)
+    extractor.close()
+    return " ".join(extractor.text)
+
+
+def _tokenize(text):
+    return [token.casefold() for token in _TOKEN.findall(text)]
+
+
+def _dumps(value):
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    )
+
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "prefix": {"type": "integer", "exclusiveMinimum": 0},
+            "save_as": {"type": "string"},
+            "shards_as": {"type": "string"},
+            "suffixes": {"type": "array", "items": {"type": "string"}},
+        },
+    }
+)
+def process(
+    app,
+    stream,
+    *,
+    prefix=2,
+    save_as="search/index.json",
+    shards_as="search/{prefix}.json",
+    suffixes=[".html", ".htm"],
+):
+    documents = []
+    postings = collections.defaultdict(list)
+
+    # Items are tokenized as they pass by, and only their term frequencies
+    # are kept. So the build time and memory grow linearly with the size of
+    # the corpus, and the content is released as soon as the item is gone.
+    # Only web pages are indexed, as other textual items (e.g. stylesheets
+    # or SVG images) are not something a reader searches for.
+    for item in stream:
+        content = item.get("content")
+
+        if (
+            isinstance(content, str)
+            and "url" in item
+            and item["destination"].suffix in suffixes
+        ):
+            document = len(documents)
+            documents.append([item["url"], item.get("title")])
+
+            frequencies = collections.Counter(
+                _tokenize(str(item.get("title") or ""))
+            )
+            frequencies.update(_tokenize(_strip(content)))
+
+            for term, frequency in frequencies.items():
+                postings[term].append((document, frequency))
+        yield item
+
+    shards = collections.defaultdict(dict)
+    for term, pairs in postings.items():
+        flat, previous = [], 0
+        for document, frequency in pairs:
+            flat.extend((document - previous, frequency))
+            previous = document
+        shards[term[:prefix]][term] = flat
+
+    urls = {}
+    for prefix_ in sorted(shards):
+        destination = shards_as.format(prefix=prefix_)
+        shard = holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("search://", destination),
+                "destination": pathlib.Path(destination),
+                "content": _dumps(shards.pop(prefix_)),
+                "baseurl": app.metadata["url"],
+            }
+        )
+        urls[prefix_] = shard["url"]
+        yield shard
+
+    yield holocron.WebSiteItem(
+        {
+            "source": pathlib.Path("search://", save_as),
+            "destination": pathlib.Path(save_as),
+            "content": _dumps(
+                {"prefix": prefix, "shards": urls, "documents": documents}
+            ),
+            "baseurl": app.metadata["url"],
+        }
+    )
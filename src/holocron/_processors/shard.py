@@ -0,0 +1,77 @@
+"""Build a shard of items and save it for a merge."""
+
+import hashlib
+import os
+import pathlib
+
+from .._core import serialization
+from ._misc import parameters
+
+
+# Items carry their position in the original stream through the pipe of a
+# shard, so shards can be merged back in the same order. A position cannot
+# be kept aside, since items are not guaranteed to keep their identity
+# (e.g. when they are processed by worker processes).
+ORDINAL = "shard:ordinal"
+
+
+def _shardof(value, shards):
+    # Python's built-in hash is randomized per process, and shards may be
+    # built by different processes or even hosts.
+    digest = hashlib.sha1(str(value).encode("UTF-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def _filename(shard, shards):
+    return f"{shard}-of-{shards}.items"
+
+
+@parameters(
+    fallback={
+        "shard": "metadata://#/shard",
+        "shards": "metadata://#/shards",
+    },
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "pipe": {"type": "array", "items": {"type": "object"}},
+            "shard": {"type": "integer", "minimum": 0},
+            "shards": {"type": "integer", "minimum": 1},
+            "key": {"type": "string"},
+            "to": {"type": "string", "format": "path"},
+        },
+    },
+)
+def process(
+    app, stream, *, pipe, shard=0, shards=1, key="source", to="_shards"
+):
+    if shard >= shards:
+        raise ValueError(f"shard must be less than {shards}: {shard}")
+
+    def owned():
+        for ordinal, item in enumerate(stream):
+            if _shardof(item[key], shards) == shard:
+                item[ORDINAL] = ordinal
+                yield item
+
+    to = pathlib.Path(to)
+    to.mkdir(exist_ok=True, parents=True)
+    path = to / _filename(shard, shards)
+
+    # A shard is written to a temporary file first, so a merge never sees
+    # an incomplete shard.
+    with open(f"{path}.tmp", "wb") as f:
+        writer = serialization.Writer(f)
+
+        for item in app.invoke(pipe, owned()):
+            # Items that were not produced from items of the shard (e.g.
+            # theme statics) are produced by every shard, so only the first
+            # shard keeps them.
+            if ORDINAL not in item and shard != 0:
+                continue
+
+            writer.write(item)
+            item.pop(ORDINAL, None)
+            yield item
+
+    os.replace(f"{path}.tmp", path)
@@ -2,12 +2,11 @@
 
 import os
 import itertools
-import gzip as _gzip
 import xml.dom.minidom as minidom
 import pathlib
 
 import holocron
-from ._misc import parameters
+from ._misc import gzip_compress, parameters
 
 
 @parameters(
@@ -35,9 +34,10 @@ def process(app, stream, *, gzip=False, save_as="sitemap.xml", pretty=True):
     # According to the Sitemap protocol, the sitemap.xml can be compressed
     # using gzip to reduce bandwidth requirements. While HTTP can does
     # compression on fly for us, doing so requires CPU work on the server as
-    # well as proper configuration of web server software.
+    # well as proper configuration of web server software. The same
+    # compression as for precompressed siblings of saved files is used.
     if gzip:
-        sitemap["content"] = _gzip.compress(sitemap["content"])
+        sitemap["content"] = gzip_compress(sitemap["content"])
 
         for key in ("source", "destination"):
             sitemap[key] = pathlib.Path(str(sitemap[key]) + ".gz")
@@ -33,22 +33,74 @@ def _createitem(app, path, source, encoding, tzinfo):
     )
 
 
+# Pipes that run in the same process (e.g. 'holocron run compile assets')
+# often scan the same directories. Scan results are shared between them and
+# are reused as long as modification times of scanned directories are the
+# same, i.e. no entries were added, removed or renamed.
+_scans = {}
+
+
+def _scandir(top, directories, sources, prefix=()):
+    subdirectories = []
+    directories[top] = None
+
+    # Just like 'os.walk' does by default, ignore directories that cannot be
+    # listed and don't follow symbolic links to directories.
+    try:
+        directories[top] = os.stat(top).st_mtime_ns
+
+        with os.scandir(top) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirectories.append(entry)
+                # Sockets and pipes (e.g. the one of a running daemon) can
+                # not be read, so they are not sources.
+                elif entry.is_file():
+                    sources.append(prefix + (entry.name,))
+    except OSError:
+        return
+
+    for entry in subdirectories:
+        _scandir(entry.path, directories, sources, prefix + (entry.name,))
+
+
+def _scan(path):
+    key = os.path.abspath(path)
+
+    try:
+        directories, sources = _scans[key]
+        for directory, mtime in directories.items():
+            if os.stat(directory).st_mtime_ns != mtime:
+                break
+        else:
+            return sources
+    except (KeyError, OSError):
+        pass
+
+    directories, sources = {}, []
+    _scandir(key, directories, sources)
+    _scans[key] = (directories, sources)
+    return sources
+
+
 def _finditems(app, path, pattern, encoding, tzinfo):
     if pattern:
         re_name = re.compile(pattern)
 
-    for root, dirnames, filenames in os.walk(path, topdown=True):
-        root = pathlib.Path(root)
-
-        for filename in filenames:
-            source = root.joinpath(filename).relative_to(path)
+    for parts in _scan(path):
+        source = pathlib.Path(*parts)
 
-            if pattern and not re_name.match(str(source)):
-                continue
+        if pattern and not re_name.match(str(source)):
+            continue
 
-            yield _createitem(
-                app, root / filename, source, encoding=encoding, tzinfo=tzinfo
-            )
+        yield _createitem(
+            app,
+            pathlib.Path(path, source),
+            source,
+            encoding=encoding,
+            tzinfo=tzinfo,
+        )
 
 
 @parameters(
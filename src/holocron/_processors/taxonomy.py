@@ -0,0 +1,121 @@
+"""Generate pages of terms (e.g. tags) and items classified by them."""
+
+import collections
+import pathlib
+import re
+
+import holocron
+from .._core.items import project
+from ._misc import paginate_items, parameters
+
+
+def _slugify(term, taken):
+    # Terms are free-form text (e.g. 'C/C++'), while they are used as parts
+    # of paths. Characters that are not safe in a path are replaced by a
+    # dash, and terms that end up with the same slug are told apart by a
+    # number.
+    slug = re.sub(r"[^\w.-]+", "-", term.lower()).strip(".-") or "term"
+    unique, number = slug, 1
+
+    while unique in taken:
+        number += 1
+        unique = f"{slug}-{number}"
+
+    taken.add(unique)
+    return unique
+
+
+@parameters(
+    jsonschema={
+        "type": "object",
+        "properties": {
+            "key": {"type": "string"},
+            "template": {"type": "string"},
+            "save_as": {"type": "string"},
+            "fields": {
+                "anyOf": [
+                    {"type": "array", "items": {"type": "string"}},
+                    {"type": "null"},
+                ]
+            },
+            "paginate": {
+                "anyOf": [
+                    {"type": "integer", "exclusiveMinimum": 0},
+                    {"type": "null"},
+                ]
+            },
+            "paginate_as": {"type": ["string", "null"]},
+            "terms_template": {"type": "string"},
+            "terms_save_as": {"type": ["string", "null"]},
+        },
+    }
+)
+def process(
+    app,
+    stream,
+    *,
+    key="tags",
+    template="archive.j2",
+    save_as="tags/{term}/index.html",
+    fields=["published", "title"],
+    paginate=None,
+    paginate_as=None,
+    terms_template="terms.j2",
+    terms_save_as="tags/index.html",
+):
+    # Classifying items by means of 'when' & 'archive' per term means going
+    # through the whole stream once for every term. Instead, an inverted
+    # index (term -> items) is built while items pass by, so each item is
+    # looked at once no matter how many terms there are. Items are indexed
+    # by their projections, which are shared between terms.
+    index = collections.defaultdict(list)
+
+    for item in stream:
+        terms = item.get(key) or []
+        if isinstance(terms, str):
+            terms = [terms]
+
+        if terms:
+            projection = item if fields is None else project(item, fields)
+
+            # Terms may come as numbers (e.g. YAML reads 'tags: [2019]' so),
+            # and they are treated as text, so terms of different types can
+            # be sorted and used in paths.
+            for term in dict.fromkeys(map(str, terms)):
+                index[term].append(projection)
+        yield item
+
+    terms, slugs = [], set()
+    for term in sorted(index):
+        items = index.pop(term)
+        slug = _slugify(term, slugs)
+        pages = paginate_items(
+            app,
+            items,
+            scheme="taxonomy",
+            save_as=save_as.format(term=slug),
+            paginate=paginate,
+            paginate_as=(
+                paginate_as.format(term=slug, page="{page}")
+                if paginate_as is not None
+                else None
+            ),
+            template=template,
+            title=term,
+            term=term,
+        )
+        terms.append(
+            {"term": term, "count": len(items), "url": pages[0]["url"]}
+        )
+        yield from pages
+
+    if terms_save_as is not None:
+        yield holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("taxonomy://", terms_save_as),
+                "destination": pathlib.Path(terms_save_as),
+                "template": terms_template,
+                "terms": terms,
+                "baseurl": app.metadata["url"],
+            }
+        )
@@ -1,12 +1,41 @@
 """Convert string based value to a datetime instance."""
 
+import collections
+import datetime
+import logging
 import pathlib
 import re
 
 import dateutil.parser
 import dateutil.tz
 
-from ._misc import parameters
+from ._misc import itemmap, parameters
+
+_logger = logging.getLogger("holocron")
+
+# Python 3.6 has no 'datetime.fromisoformat', so the fast path is simply
+# not available there.
+_fromisoformat = getattr(datetime.datetime, "fromisoformat", None)
+
+
+def _parse(timestamp, format_, fuzzy):
+    # Dateutil's parser is flexible yet slow, since it tokenizes a string and
+    # then guesses what each token means. Try cheap strict parsers first and
+    # fall back to dateutil only if they failed. Strict parsers either
+    # produce exactly what dateutil would produce, or fail.
+    if format_:
+        try:
+            return datetime.datetime.strptime(timestamp, format_), "format"
+        except ValueError:
+            pass
+
+    if _fromisoformat:
+        try:
+            return _fromisoformat(timestamp), "isoformat"
+        except ValueError:
+            pass
+
+    return dateutil.parser.parse(timestamp, fuzzy=fuzzy), "dateutil"
 
 
 @parameters(
@@ -23,58 +52,91 @@ from ._misc import parameters
             "parsearea": {"type": "string"},
             "timezone": {"type": "string", "format": "timezone"},
             "fuzzy": {"type": "boolean"},
+            "format": {"type": "string"},
         },
     },
 )
+@itemmap
 def process(
-    app, stream, *, todatetime, parsearea=".*", fuzzy=False, timezone="UTC"
+    app, *, todatetime, parsearea=".*", fuzzy=False, timezone="UTC", format=None
 ):
     tzinfo = dateutil.tz.gettz(timezone)
     re_parsearea = re.compile(parsearea)
 
-    for item in stream:
-        # Todatetime option may be a string, which means convert and save a
-        # property under the same name, or pair, which means convert and save
-        # properties under the given names. The latter may be handy in cases
-        # when you want to extract a datetime string, let's say, from a
-        # filename.
-        if isinstance(todatetime, str):
-            parsein, saveto = todatetime, todatetime
-        else:
-            parsein, saveto = todatetime
-
-        # Usually raising an error when contract is violated is a preferred
-        # option. However, taking into account the use case of 'todatetime'
-        # processor, we better ignore such items in the stream to save users
-        # from wrapping this processor with 'when' processor.
-        if parsein not in item:
-            yield item
-            continue
-
-        parsein = item[parsein]
-
-        # Cast the path object to string for user, because it's a behaviour a
-        # user would expect anyway. Besides, I personally require such
-        # behaviour because I prefer to have a datetime encoded in path.
-        if isinstance(parsein, pathlib.Path):
-            parsein = str(parsein)
-
-        # Reduce a parse area by applying a regular expression. May be handy if
-        # you want to extract a datetime from, let's say, a filename. If a
-        # regular expression matches nothing, ignore and skip an item to avoid
-        # using 'when' processor to make things *safe*.
-        parsearea = re_parsearea.search(parsein)
-        if not parsearea:
-            yield item
-            continue
-
-        parsearea = parsearea.group(0)
-        converted = dateutil.parser.parse(parsearea, fuzzy=fuzzy)
-
-        # Attach passed timezone to a parsed datetime instance if tzinfo
-        # hasn't been found.
-        if not converted.tzinfo:
-            converted = converted.replace(tzinfo=tzinfo)
-        item[saveto] = converted
-
-        yield item
+    # Timestamps tend to repeat across items (e.g. dates extracted from
+    # paths), so there's no need to parse the same string twice. Datetime
+    # instances are immutable and hence can be safely shared by items.
+    parsed = {}
+    counters = collections.Counter()
+
+    # Todatetime option may be a string, which means convert and save a
+    # property under the same name, or pair, which means convert and save
+    # properties under the given names. The latter may be handy in cases
+    # when you want to extract a datetime string, let's say, from a
+    # filename.
+    if isinstance(todatetime, str):
+        parsein, saveto = todatetime, todatetime
+    else:
+        parsein, saveto = todatetime
+
+    def convert(items):
+        for item in items:
+            # Usually raising an error when contract is violated is a
+            # preferred option. However, taking into account the use case of
+            # 'todatetime' processor, we better ignore such items in the
+            # stream to save users from wrapping this processor with 'when'
+            # processor.
+            if parsein not in item:
+                continue
+
+            timestamp = item[parsein]
+
+            # Cast the path object to string for user, because it's a
+            # behaviour a user would expect anyway. Besides, I personally
+            # require such behaviour because I prefer to have a datetime
+            # encoded in path.
+            if isinstance(timestamp, pathlib.Path):
+                timestamp = str(timestamp)
+
+            # Reduce a parse area by applying a regular expression. May be
+            # handy if you want to extract a datetime from, let's say, a
+            # filename. If a regular expression matches nothing, ignore and
+            # skip an item to avoid using 'when' processor to make things
+            # *safe*.
+            parsearea = re_parsearea.search(timestamp)
+            if not parsearea:
+                continue
+
+            parsearea = parsearea.group(0)
+
+            try:
+                converted = parsed[parsearea]
+                counters["cached"] += 1
+            except KeyError:
+                converted, path = _parse(parsearea, format, fuzzy)
+                counters[path] += 1
+
+                # Attach passed timezone to a parsed datetime instance if
+                # tzinfo hasn't been found.
+                if not converted.tzinfo:
+                    converted = converted.replace(tzinfo=tzinfo)
+                parsed[parsearea] = converted
+
+            item[saveto] = converted
+        return items
+
+    def close():
+        _logger.debug(
+            "todatetime: %d cached, %d format, %d isoformat, %d dateutil",
+            counters["cached"],
+            counters["format"],
+            counters["isoformat"],
+            counters["dateutil"],
+        )
+
+    # Item maps are closed once the stream is exhausted, which is the right
+    # time to report how timestamps have been parsed. Counters are exposed,
+    # so the ones counted in worker processes are not lost.
+    convert.counters = counters
+    convert.close = close
+    return convert
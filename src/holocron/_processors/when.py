@@ -64,23 +64,34 @@ def process(app, stream, processor, *_condition, condition=None):
     if not condition:
         raise TypeError("missing argument or value: 'condition'")
 
+    # Items passed to a processor are remembered along with their positions
+    # in the input stream. Processors may look ahead (e.g. item maps consume
+    # a whole batch before producing anything), and that's how untouched
+    # items that came after a processed one are kept after it.
+    positions = {}
+
     def smartstream():
-        for item in stream:
+        for position, item in enumerate(stream):
             if all(evaluator.eval(cond, item=item) for cond in condition):
+                positions[id(item)] = position, item
                 yield item
             else:
-                untouched.append(item)
+                untouched.append((position, item))
 
     for item in app.invoke([processor], smartstream()):
+        position, _ = positions.pop(id(item), (None, None))
+
         # Some untouched items may be collected during an attempt to retrieve
         # at least one item from a processor. In order to preserve relative
         # order between items from an original input stream and items produced
-        # by a processor, we need to yield these untouched items first.
-        while untouched:
-            yield untouched.popleft()
+        # by a processor, we need to yield these untouched items first. Items
+        # that aren't from the input stream go after all of them.
+        while untouched and (position is None or untouched[0][0] < position):
+            yield untouched.popleft()[1]
         yield item
 
     # Untouched collection may contain some items if app.invoke() drained
     # an input stream without yielding a new item. Ensure they are propagated
     # down the stream.
-    yield from untouched
+    for _, item in untouched:
+        yield item
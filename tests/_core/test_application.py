@@ -1,8 +1,12 @@
 """Core application test suite."""
 
+import collections
+import os
+
 import pytest
 
 import holocron
+from holocron._processors import _misc
 
 
 def test_metadata():
@@ -532,3 +536,208 @@ def test_invoke_processor_wrapper_not_found(caplog):
 
     assert str(excinfo.value) == "no such processor: 'wrapper'"
     assert len(caplog.records) == 0
+
+
+@pytest.mark.parametrize(
+    ["metadata", "batches"],
+    [
+        pytest.param({}, [[0, 1, 2, 3, 4]], id="default"),
+        pytest.param({"batchsize": 2}, [[0, 1], [2, 3], [4]], id="2"),
+        pytest.param({"batchsize": 5}, [[0, 1, 2, 3, 4]], id="5"),
+    ],
+)
+def test_invoke_itemmaps_batches(metadata, batches):
+    """.invoke() passes batches of items to item maps."""
+
+    received = {"a": [], "b": []}
+
+    @_misc.itemmap
+    def processor(app, *, name):
+        def map_(items):
+            received[name].append([item["i"] for item in items])
+            return items
+
+        return map_
+
+    testapp = holocron.Application(metadata)
+    testapp.add_processor("processor", processor)
+
+    stream = testapp.invoke(
+        [
+            {"name": "processor", "args": {"name": "a"}},
+            {"name": "processor", "args": {"name": "b"}},
+        ],
+        [holocron.Item(i=i) for i in range(5)],
+    )
+
+    assert list(stream) == [holocron.Item(i=i) for i in range(5)]
+    assert received == {"a": batches, "b": batches}
+
+
+def test_invoke_itemmaps_batches_mixed():
+    """.invoke() passes items one by one to processors that aren't maps."""
+
+    @_misc.itemmap
+    def processor_a(app):
+        def map_(items):
+            assert isinstance(items, list)
+            for item in items:
+                item["i"] *= 2
+            return items
+
+        return map_
+
+    def processor_b(app, items):
+        for item in items:
+            assert isinstance(item, holocron.Item)
+            if item["i"] % 3:
+                yield item
+
+    testapp = holocron.Application({"batchsize": 2})
+    testapp.add_processor("processor_a", processor_a)
+    testapp.add_processor("processor_b", processor_b)
+
+    stream = testapp.invoke(
+        [
+            {"name": "processor_a"},
+            {"name": "processor_b"},
+            {"name": "processor_a"},
+        ],
+        [holocron.Item(i=i) for i in range(7)],
+    )
+
+    assert list(stream) == [holocron.Item(i=i) for i in (4, 8, 16, 20)]
+
+
+def test_invoke_itemmaps_fused():
+    """.invoke() fuses adjacent item maps into one."""
+
+    received = []
+
+    @_misc.itemmap
+    def processor_a(app, *, key, value):
+        def map_(items):
+            for item in items:
+                item[key] = value
+            return items
+
+        return map_
+
+    def processor_b(app, items):
+        received.append(items)
+        return (item for item in items)
+
+    testapp = holocron.Application()
+    testapp.add_processor("processor_a", processor_a)
+    testapp.add_processor("processor_b", processor_b)
+
+    stream = testapp.invoke(
+        [
+            {"name": "processor_a", "args": {"key": "x", "value": 1}},
+            {"name": "processor_a", "args": {"key": "y", "value": 2}},
+            {"name": "processor_b"},
+            {"name": "processor_a", "args": {"key": "z", "value": 3}},
+            {"name": "processor_b"},
+        ],
+        [holocron.Item(i=i) for i in range(3)],
+    )
+
+    assert list(stream) == [
+        holocron.Item(i=i, x=1, y=2, z=3) for i in range(3)
+    ]
+
+    # Processor B is a barrier, so the first two item maps are fused while
+    # the last one is not.
+    assert [len(items.functions) for items in received] == [2, 1]
+    assert not isinstance(received[0].stream, _misc.ItemMap)
+    assert not isinstance(received[1].stream, _misc.ItemMap)
+
+
+def test_invoke_itemmaps_closed():
+    """.invoke() closes map functions once the stream is exhausted."""
+
+    closed = []
+
+    @_misc.itemmap
+    def processor(app):
+        def map_(items):
+            assert not closed
+            return items
+
+        map_.close = lambda: closed.append(True)
+        return map_
+
+    testapp = holocron.Application()
+    testapp.add_processor("processor", processor)
+
+    stream = testapp.invoke(
+        [{"name": "processor"}], [holocron.Item(i=i) for i in range(3)]
+    )
+
+    assert list(stream) == [holocron.Item(i=i) for i in range(3)]
+    assert closed == [True]
+
+
+@pytest.mark.parametrize(
+    ["workers"],
+    [
+        pytest.param(1, id="1"),
+        pytest.param(3, id="3"),
+    ],
+)
+def test_invoke_itemmaps_workers(workers):
+    """.invoke() maps items in worker processes."""
+
+    @_misc.itemmap
+    def processor(app, *, key):
+        def map_(items):
+            for item in items:
+                item[key] = os.getpid()
+            return items
+
+        return map_
+
+    testapp = holocron.Application({"workers": workers, "batchsize": 16})
+    testapp.add_processor("processor", processor)
+
+    items = [holocron.Item(i=i) for i in range(200)]
+    stream = testapp.invoke(
+        [
+            {"name": "processor", "args": {"key": "x"}},
+            {"name": "processor", "args": {"key": "y"}},
+        ],
+        items,
+    )
+
+    # Items mapped in worker processes must be the very same items, i.e.
+    # their identity must be preserved.
+    assert all(a is b for a, b in zip(stream, items))
+    assert all(item["x"] == item["y"] != os.getpid() for item in items)
+
+
+def test_invoke_itemmaps_workers_closed():
+    """.invoke() closes map functions with counters gathered from workers."""
+
+    closed = []
+
+    @_misc.itemmap
+    def processor(app):
+        counters = collections.Counter()
+
+        def map_(items):
+            counters["items"] += len(items)
+            return items
+
+        map_.counters = counters
+        map_.close = lambda: closed.append(dict(counters))
+        return map_
+
+    testapp = holocron.Application({"workers": 2, "batchsize": 4})
+    testapp.add_processor("processor", processor)
+
+    stream = testapp.invoke(
+        [{"name": "processor"}], [holocron.Item(i=i) for i in range(21)]
+    )
+
+    assert list(stream) == [holocron.Item(i=i) for i in range(21)]
+    assert closed == [{"items": 21}]
@@ -11,21 +11,30 @@ def test_create_app_processors_discover():
     testapp = holocron.create_app({})
 
     assert set(testapp._processors) == {
+        "aggregate",
         "archive",
         "chain",
+        "checkpoint",
         "commonmark",
         "feed",
+        "fingerprint",
         "frontmatter",
         "import-processors",
+        "index",
         "jinja2",
+        "linkcheck",
         "markdown",
+        "merge",
         "metadata",
         "pipe",
         "prettyuri",
         "restructuredtext",
         "save",
+        "search",
+        "shard",
         "sitemap",
         "source",
+        "taxonomy",
         "todatetime",
         "when",
     }
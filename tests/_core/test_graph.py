@@ -0,0 +1,229 @@
+"""Pipe graphs test suite."""
+
+import threading
+
+import pytest
+
+import holocron
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    def tag(app, items, *, key, value):
+        for item in items:
+            item[key] = value
+            yield item
+
+    def collect(app, items):
+        items = list(items)
+        yield holocron.Item(collected=[item["i"] for item in items])
+
+    instance = holocron.Application()
+    instance.add_processor("tag", tag)
+    instance.add_processor("collect", collect)
+    return instance
+
+
+def _sorted(items):
+    return sorted(items, key=lambda item: sorted(item.as_mapping().items()))
+
+
+def test_invoke(testapp):
+    """Graph stages have to share upstream stages."""
+
+    counter = []
+
+    def count(app, items):
+        for item in items:
+            counter.append(item)
+            yield item
+
+    testapp.add_processor("count", count)
+
+    stream = testapp.invoke(
+        {
+            "posts": {"pipe": [{"name": "count"}]},
+            "html": {
+                "after": "posts",
+                "pipe": [{"name": "tag", "args": {"key": "html", "value": 1}}],
+            },
+            "feed": {
+                "after": "posts",
+                "pipe": [{"name": "tag", "args": {"key": "feed", "value": 1}}],
+            },
+        },
+        [holocron.Item(i=i) for i in range(3)],
+    )
+
+    assert _sorted(stream) == _sorted(
+        [holocron.Item(i=i, html=1) for i in range(3)]
+        + [holocron.Item(i=i, feed=1) for i in range(3)]
+    )
+    assert [item["i"] for item in counter] == [0, 1, 2]
+
+
+def test_invoke_named(testapp):
+    """Graphs have to be accepted as named pipes."""
+
+    testapp.add_pipe(
+        "test",
+        {"a": {"pipe": [{"name": "tag", "args": {"key": "a", "value": 1}}]}},
+    )
+
+    stream = testapp.invoke("test", [holocron.Item(i=0)])
+
+    assert list(stream) == [holocron.Item(i=0, a=1)]
+
+
+def test_invoke_many_roots(testapp):
+    """Stages that come after nothing have to receive the input stream."""
+
+    stream = testapp.invoke(
+        {
+            "a": {"pipe": [{"name": "tag", "args": {"key": "a", "value": 1}}]},
+            "b": {"pipe": [{"name": "tag", "args": {"key": "b", "value": 1}}]},
+            "c": {"after": ["a", "b"], "pipe": [{"name": "collect"}]},
+        },
+        [holocron.Item(i=i) for i in range(3)],
+    )
+
+    (item,) = stream
+
+    assert sorted(item["collected"]) == [0, 0, 1, 1, 2, 2]
+
+
+def test_invoke_branches_isolated(testapp):
+    """Branches have to receive their own copies of items."""
+
+    stream = testapp.invoke(
+        {
+            "a": {"pipe": []},
+            "b": {
+                "after": "a",
+                "pipe": [{"name": "tag", "args": {"key": "x", "value": 1}}],
+            },
+            "c": {
+                "after": "a",
+                "pipe": [{"name": "tag", "args": {"key": "x", "value": 2}}],
+            },
+        },
+        [holocron.Item(i=0)],
+    )
+
+    assert _sorted(stream) == [
+        holocron.Item(i=0, x=1),
+        holocron.Item(i=0, x=2),
+    ]
+
+
+def test_invoke_empty(testapp):
+    """Empty graphs have to pass items through."""
+
+    stream = testapp.invoke({}, [holocron.Item(i=0)])
+
+    assert list(stream) == [holocron.Item(i=0)]
+
+
+def test_invoke_bounded(testapp):
+    """Stages have to be connected with bounded buffers."""
+
+    produced = []
+    lags = []
+
+    def produce():
+        for i in range(1000):
+            produced.append(i)
+            yield holocron.Item(i=i)
+
+    def consume(app, items):
+        for item in items:
+            lags.append(len(produced) - item["i"])
+            yield item
+
+    testapp.metadata["buffersize"] = 2
+    testapp.add_processor("consume", consume)
+
+    stream = testapp.invoke(
+        {
+            "a": {"pipe": []},
+            "b": {"after": "a", "pipe": [{"name": "consume"}]},
+            "c": {"after": "a", "pipe": [{"name": "collect"}]},
+        },
+        produce(),
+    )
+
+    items = list(stream)
+
+    assert len(items) == 1001
+    assert max(lags) <= 10
+
+
+def test_invoke_closed(testapp):
+    """Stage threads have to be stopped once the output is closed."""
+
+    threads = threading.active_count()
+    stream = testapp.invoke(
+        {"a": {"pipe": []}, "b": {"after": "a", "pipe": []}},
+        (holocron.Item(i=i) for i in range(1000)),
+    )
+
+    assert next(stream) == holocron.Item(i=0)
+
+    stream.close()
+
+    assert threading.active_count() == threads
+
+
+def test_invoke_processor_errors(testapp):
+    """Errors in stages have to be propagated."""
+
+    def processor(app, items):
+        for item in items:
+            raise ValueError("something bad happened")
+            yield
+
+    testapp.add_processor("processor", processor)
+
+    stream = testapp.invoke(
+        {
+            "a": {"pipe": []},
+            "b": {"after": "a", "pipe": [{"name": "processor"}]},
+        },
+        [holocron.Item(i=0)],
+    )
+
+    with pytest.raises(ValueError, match=r"^something bad happened$"):
+        list(stream)
+
+
+@pytest.mark.parametrize(
+    ["graph", "error"],
+    [
+        pytest.param(
+            {"a": {"after": "b", "pipe": []}},
+            "no such stage: 'b'",
+            id="no-such-stage",
+        ),
+        pytest.param(
+            {"a": {"after": "b", "pipe": []}, "b": {"after": "a", "pipe": []}},
+            "pipe graph has a cycle: 'a'",
+            id="cycle",
+        ),
+        pytest.param(
+            {"a": {"after": "a"}},
+            "stage must have a pipe: 'a'",
+            id="no-pipe",
+        ),
+        pytest.param(
+            {"a": {"pipe": [{"name": "yoda"}]}},
+            "no such processor: 'yoda'",
+            id="no-such-processor",
+        ),
+    ],
+)
+def test_invoke_bad_graph(testapp, graph, error):
+    """Bad graphs have to be reported."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(testapp.invoke(graph))
+    assert str(excinfo.value) == error
@@ -5,6 +5,7 @@ import pathlib
 import pytest
 
 import holocron
+from holocron._core import items
 
 
 @pytest.fixture(
@@ -637,3 +638,50 @@ def test_websiteitem_absurl(properties, absurl):
     instance = holocron.WebSiteItem(properties)
 
     assert instance["absurl"] == absurl
+
+
+def test_project():
+    """Projection has only given properties."""
+
+    instance = holocron.Item(title="The Force", content="Obi-Wan", x=42)
+    projection = items.project(instance, ["title", "x", "y"])
+
+    assert type(projection) is holocron.Item
+    assert projection == holocron.Item(title="The Force", x=42)
+    assert "content" not in projection
+
+
+def test_project_websiteitem():
+    """Projection of website item has its computed properties."""
+
+    instance = holocron.WebSiteItem(
+        destination=pathlib.Path("jedi", "index.html"),
+        baseurl="https://skywalker.org",
+        content="Obi-Wan",
+    )
+    projection = items.project(instance, ["url"])
+
+    assert type(projection) is holocron.WebSiteItem
+    assert projection == holocron.WebSiteItem(
+        destination=pathlib.Path("jedi", "index.html"),
+        baseurl="https://skywalker.org",
+    )
+    assert projection["url"] == "/jedi/"
+    assert projection["absurl"] == "https://skywalker.org/jedi/"
+
+
+def test_project_mutable():
+    """Projection can be changed without affecting other projections."""
+
+    projection_a = items.project(holocron.Item(a=1, b=2), ["a", "b"])
+    projection_b = items.project(holocron.Item(a=3, b=4), ["a", "b"])
+
+    projection_a["a"] = 5
+    projection_a["c"] = 6
+    del projection_a["b"]
+
+    assert projection_a == holocron.Item(a=5, c=6)
+    assert projection_b == holocron.Item(a=3, b=4)
+
+    with pytest.raises(KeyError):
+        del projection_a["b"]
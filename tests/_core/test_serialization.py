@@ -0,0 +1,250 @@
+"""Items serialization test suite."""
+
+import datetime
+import io
+import pathlib
+import pickle
+
+import dateutil.tz
+import pytest
+
+import holocron
+from holocron._core import serialization
+
+
+class _Item(holocron.Item):
+    @property
+    def answer(self):
+        return 42
+
+
+@pytest.mark.parametrize(
+    ["value"],
+    [
+        pytest.param(None, id="none"),
+        pytest.param(True, id="bool"),
+        pytest.param(42, id="int"),
+        pytest.param(4.2, id="float"),
+        pytest.param("Obi-Wan", id="str"),
+        pytest.param(b"\x00\xff", id="bytes"),
+        pytest.param(pathlib.Path("a", "b.md"), id="path"),
+        pytest.param(datetime.date(2020, 1, 31), id="date"),
+        pytest.param(
+            datetime.datetime(2020, 1, 31, 1, 2, 3, 4), id="datetime-naive"
+        ),
+        pytest.param(
+            datetime.datetime(
+                2020,
+                1,
+                31,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=-5)),
+            ),
+            id="datetime-aware",
+        ),
+        pytest.param([1, "a", [pathlib.Path("b")]], id="list"),
+        pytest.param({"a": {"b": pathlib.Path("c")}}, id="dict"),
+        pytest.param(-(2**70), id="int-big"),
+        pytest.param(holocron.Item(a=1), id="item"),
+        pytest.param(
+            holocron.WebSiteItem(
+                destination=pathlib.Path("a.html"),
+                baseurl="https://yoda.ua",
+                prev=holocron.Item(title="b"),
+            ),
+            id="websiteitem",
+        ),
+        pytest.param(_Item(a=1), id="item-custom"),
+    ],
+)
+def test_dump_load(value):
+    """Values have to be restored from their binary representation."""
+
+    (item,) = serialization.loads(
+        serialization.dumps([holocron.Item(value=value)])
+    )
+
+    assert item == holocron.Item(value=value)
+    assert type(item["value"]) is type(value)
+
+
+@pytest.mark.parametrize(
+    ["tzinfo", "tzname"],
+    [
+        pytest.param(dateutil.tz.UTC, "UTC", id="utc"),
+        pytest.param(dateutil.tz.gettz("UTC"), "UTC", id="utc-zone"),
+        pytest.param(dateutil.tz.gettz("Europe/Kiev"), "EET", id="zone"),
+        pytest.param(
+            datetime.timezone(datetime.timedelta(hours=3)),
+            "UTC+03:00",
+            id="offset",
+        ),
+    ],
+)
+def test_dump_load_timezone(tzinfo, tzname):
+    """Timezones have to be restored."""
+
+    value = datetime.datetime(2020, 1, 31, 13, 14, 15, tzinfo=tzinfo)
+
+    (item,) = serialization.loads(
+        serialization.dumps([holocron.Item(value=value)])
+    )
+
+    assert item["value"] == value
+    assert item["value"].tzname() == tzname
+    assert item["value"].isoformat() == value.isoformat()
+
+
+def test_dump_load_timezone_zoneinfo():
+    """Zones of 'zoneinfo' have to be restored as zones, not offsets."""
+
+    zoneinfo = pytest.importorskip("zoneinfo")
+
+    tzinfo = zoneinfo.ZoneInfo("Europe/Kyiv")
+    winter = datetime.datetime(2020, 1, 31, 13, 14, 15, tzinfo=tzinfo)
+
+    (item,) = serialization.loads(
+        serialization.dumps([holocron.Item(value=winter)])
+    )
+
+    assert item["value"] == winter
+    assert item["value"].tzname() == "EET"
+
+    # Daylight saving is in effect in summer, and it's only known by a zone.
+    summer = item["value"].replace(month=7)
+    assert summer.tzname() == "EEST"
+    assert summer.utcoffset() == datetime.timedelta(hours=3)
+
+
+def test_dump_load_stream(tmpdir):
+    """Streams of items have to be written and read lazily."""
+
+    def items():
+        for i in range(1000):
+            yield holocron.WebSiteItem(
+                source=pathlib.Path(f"{i}.md"),
+                destination=pathlib.Path(f"{i}.html"),
+                baseurl="https://yoda.ua",
+                content=f"the Force #{i}",
+            )
+
+    with tmpdir.join("stream").open("wb") as f:
+        serialization.dump(items(), f)
+
+    with tmpdir.join("stream").open("rb") as f:
+        stream = serialization.load(f)
+
+        assert next(stream) == next(items())
+        assert f.tell() < 1000
+        assert list(stream) == list(items())[1:]
+
+
+def test_dump_content_out_of_line():
+    """Content has to be written once per unique content."""
+
+    items = [holocron.Item(i=i, content="the Force") for i in range(10)]
+
+    data = serialization.dumps(items)
+
+    assert data.count(b"the Force") == 1
+    assert serialization.loads(data) == items
+
+
+def test_dump_content_bounded():
+    """Only recently seen content has to be remembered."""
+
+    items = [
+        holocron.Item(content=f"the Force #{i % 100}") for i in range(5000)
+    ]
+
+    buffer = io.BytesIO(serialization.dumps(items))
+    reader = serialization.Reader(buffer)
+
+    assert list(reader) == items
+    assert len(reader._contents) <= 64
+
+    # Contents that were forgotten have to be written again, while the ones
+    # that are still remembered are referred to.
+    data = serialization.dumps(
+        [holocron.Item(content=f"the Force #{i}") for i in range(65)]
+        + [holocron.Item(content="the Force #0")]
+        + [holocron.Item(content="the Force #64")]
+    )
+
+    assert data.count(b"the Force #0") == 2
+    assert data.count(b"the Force #64") == 1
+
+
+def test_dump_content_store():
+    """Content has to be passed to a store if one is passed."""
+
+    store = {}
+
+    def put(data):
+        store[str(len(store))] = data
+        return str(len(store) - 1)
+
+    items = [
+        holocron.Item(content="the Force"),
+        holocron.Item(content=b"\x00\xff"),
+    ]
+
+    data = serialization.dumps(items, store=put)
+
+    assert b"the Force" not in data
+    assert serialization.loads(data, fetch=store.__getitem__) == items
+
+    with pytest.raises(ValueError, match=r"^content is stored outside"):
+        serialization.loads(data)
+
+
+def test_dump_compact():
+    """Items have to be represented more compactly than pickle does."""
+
+    items = [
+        holocron.WebSiteItem(
+            source=pathlib.Path("posts", f"{i}.md"),
+            destination=pathlib.Path("posts", f"{i}.html"),
+            baseurl="https://yoda.ua",
+            title=f"The Force (part #{i})",
+            published=datetime.datetime(
+                2020, 1, i + 1, tzinfo=dateutil.tz.gettz("Europe/Kiev")
+            ),
+            tags=["force", "jedi"],
+            content="Obi-Wan " * 100,
+        )
+        for i in range(28)
+    ]
+
+    data = serialization.dumps(items)
+
+    assert len(data) < len(pickle.dumps(items))
+
+
+@pytest.mark.parametrize(
+    ["data", "error"],
+    [
+        pytest.param(b"", "not a stream of items", id="empty"),
+        pytest.param(b"NOTHOLOCRON\x01", "not a stream of items", id="magic"),
+        pytest.param(
+            b"HOLOCRON\x03", "unsupported format version: 3", id="version"
+        ),
+        pytest.param(
+            b"HOLOCRON\x02\x05\x0c\x00",
+            "truncated stream of items",
+            id="truncated",
+        ),
+    ],
+)
+def test_load_bad_data(data, error):
+    """Malformed streams have to be rejected."""
+
+    with pytest.raises(ValueError) as excinfo:
+        serialization.loads(data)
+    assert str(excinfo.value) == error
+
+
+def test_dump_unknown():
+    """Values of unknown types have to be rejected."""
+
+    with pytest.raises(TypeError, match=r"^cannot serialize 'object'$"):
+        serialization.dumps([holocron.Item(value=object())])
@@ -0,0 +1,240 @@
+"""Aggregate processor test suite."""
+
+import collections.abc
+import datetime
+import pathlib
+
+import pytest
+
+import holocron
+from holocron._processors import aggregate, archive, feed, sitemap
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    def spam(app, items):
+        items = list(items)
+
+        yield from items
+        yield holocron.WebSiteItem(
+            {
+                "destination": pathlib.Path("spam.txt"),
+                "baseurl": app.metadata["url"],
+                "content": [item.as_mapping() for item in items],
+            }
+        )
+
+    instance = holocron.Application({"url": "https://yoda.ua"})
+    instance.add_processor("archive", archive.process)
+    instance.add_processor("sitemap", sitemap.process)
+    instance.add_processor("spam", spam)
+    return instance
+
+
+def _createitem(i):
+    timepoint = datetime.datetime(2020, 1, i + 1, tzinfo=datetime.timezone.utc)
+
+    return holocron.WebSiteItem(
+        {
+            "destination": pathlib.Path(f"{i}.html"),
+            "baseurl": "https://yoda.ua",
+            "title": f"The Force (part #{i})",
+            "content": "Obi-Wan " * 100,
+            "published": timepoint,
+            "updated": timepoint,
+        }
+    )
+
+
+def test_item(testapp):
+    """Aggregate processor has to pass items and emit aggregated ones."""
+
+    stream = aggregate.process(
+        testapp,
+        [_createitem(0), _createitem(1)],
+        aggregators=[{"name": "sitemap"}, {"name": "archive"}],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+
+    items = list(stream)
+    assert items[:2] == [_createitem(0), _createitem(1)]
+    assert [item["destination"] for item in items[2:]] == [
+        pathlib.Path("sitemap.xml"),
+        pathlib.Path("index.html"),
+    ]
+
+
+def test_item_projected(testapp):
+    """Aggregate processor has to pass only required properties."""
+
+    stream = aggregate.process(
+        testapp,
+        [_createitem(0), _createitem(1)],
+        aggregators=[{"name": "archive"}],
+    )
+
+    *_, index = stream
+
+    assert index["items"] == [
+        holocron.WebSiteItem(
+            {
+                "destination": pathlib.Path(f"{i}.html"),
+                "baseurl": "https://yoda.ua",
+                "title": f"The Force (part #{i})",
+                "published": _createitem(i)["published"],
+            }
+        )
+        for i in (1, 0)
+    ]
+    assert [item["url"] for item in index["items"]] == ["/1.html", "/0.html"]
+
+
+def test_item_same_as_standalone(testapp):
+    """Aggregate processor has to produce what each aggregator does alone."""
+
+    stream = aggregate.process(
+        testapp,
+        [_createitem(i) for i in range(5)],
+        aggregators=[{"name": "sitemap"}, {"name": "archive"}],
+    )
+    aggregated = list(stream)
+
+    sitemap_items = list(
+        testapp.invoke(
+            [{"name": "sitemap"}], [_createitem(i) for i in range(5)]
+        )
+    )
+    archive_items = list(
+        testapp.invoke(
+            [{"name": "archive"}], [_createitem(i) for i in range(5)]
+        )
+    )
+
+    assert aggregated[:6] == sitemap_items
+    assert [item["url"] for item in aggregated[6]["items"]] == [
+        item["url"] for item in archive_items[5]["items"]
+    ]
+
+
+def test_item_generated_are_not_aggregated(testapp):
+    """Aggregators have to receive only items of the input stream."""
+
+    stream = aggregate.process(
+        testapp,
+        [_createitem(0)],
+        aggregators=[
+            {"name": "archive"},
+            {"name": "spam", "fields": ["title"]},
+        ],
+    )
+
+    *_, archive_index, spam = stream
+
+    assert archive_index["destination"] == pathlib.Path("index.html")
+    assert spam["content"] == [
+        {
+            "destination": pathlib.Path("0.html"),
+            "baseurl": "https://yoda.ua",
+            "title": "The Force (part #0)",
+            "published": _createitem(0)["published"],
+            "url": "/0.html",
+            "absurl": "https://yoda.ua/0.html",
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    ["names"],
+    [
+        pytest.param(
+            ["archive", "feed", "sitemap"], id="archive-feed-sitemap"
+        ),
+        pytest.param(["feed", "sitemap"], id="feed-sitemap"),
+        pytest.param(["sitemap", "feed"], id="sitemap-feed"),
+    ],
+)
+def test_item_real_aggregators(testapp, names):
+    """Aggregators have to work whatever order they are listed in."""
+
+    testapp.add_processor("feed", feed.process)
+    args = {
+        "feed": {
+            "feed": {
+                "id": "kenobi-way",
+                "title": "Kenobi's Way",
+                "link": {"href": "https://yoda.ua"},
+            },
+            "item": {
+                "id": {"$ref": "item:#/absurl"},
+                "title": {"$ref": "item:#/title"},
+                "published": {"$ref": "item:#/published"},
+                "link": {
+                    "href": {"$ref": "item:#/absurl"},
+                    "rel": "alternate",
+                },
+            },
+        },
+    }
+
+    stream = aggregate.process(
+        testapp,
+        [_createitem(i) for i in range(3)],
+        aggregators=[
+            {"name": name, "args": args.get(name, {})} for name in names
+        ],
+    )
+
+    items = list(stream)
+    assert items[:3] == [_createitem(i) for i in range(3)]
+    assert [item["destination"] for item in items[3:]] == [
+        {
+            "archive": pathlib.Path("index.html"),
+            "feed": pathlib.Path("feed.xml"),
+            "sitemap": pathlib.Path("sitemap.xml"),
+        }[name]
+        for name in names
+    ]
+
+    generated = {item["destination"].name: item for item in items[3:]}
+    if "feed.xml" in generated:
+        assert generated["feed.xml"]["content"].count(b"<entry>") == 3
+    if "sitemap.xml" in generated:
+        assert generated["sitemap.xml"]["content"].count(b"<url>") == 3
+
+
+@pytest.mark.parametrize(
+    ["aggregator"],
+    [
+        pytest.param({"name": "spam"}, id="unknown"),
+        pytest.param({"name": "spam", "fields": None}, id="null"),
+    ],
+)
+def test_args_aggregators_whole_items(testapp, aggregator):
+    """Aggregators that declare no fields have to receive whole items."""
+
+    stream = aggregate.process(
+        testapp, [_createitem(0)], aggregators=[aggregator]
+    )
+
+    *_, spam = stream
+
+    assert spam["content"] == [_createitem(0).as_mapping()]
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param(
+            {"aggregators": 42},
+            "aggregators: 42 is not of type 'array'",
+            id="aggregators-int",
+        ),
+    ],
+)
+def test_args_bad_value(testapp, args, error):
+    """Aggregate processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(aggregate.process(testapp, [], **args))
+    assert str(excinfo.value) == error
@@ -1,6 +1,7 @@
 """Archive processor test suite."""
 
 import collections.abc
+import datetime
 import itertools
 import pathlib
 
@@ -30,9 +31,8 @@ def test_item(testapp):
                 "source": pathlib.Path("archive://index.html"),
                 "destination": pathlib.Path("index.html"),
                 "template": "archive.j2",
-                "items": [
-                    holocron.Item({"title": "The Force", "content": "Obi-Wan"})
-                ],
+                "items": [holocron.Item({"title": "The Force"})],
+                "groups": [(None, [holocron.Item({"title": "The Force"})])],
                 "baseurl": testapp.metadata["url"],
             }
         ),
@@ -59,6 +59,10 @@ def test_item_many(testapp, amount):
             for i in range(amount)
         ],
     )
+    projected = [
+        holocron.Item({"title": "The Force (part #%d)" % i})
+        for i in range(amount)
+    ]
 
     assert isinstance(stream, collections.abc.Iterable)
     assert list(stream) == list(
@@ -73,12 +77,8 @@ def test_item_many(testapp, amount):
                         "source": pathlib.Path("archive://index.html"),
                         "destination": pathlib.Path("index.html"),
                         "template": "archive.j2",
-                        "items": [
-                            holocron.Item(
-                                {"title": "The Force (part #%d)" % i}
-                            )
-                            for i in range(amount)
-                        ],
+                        "items": projected,
+                        "groups": [(None, projected)] if amount else [],
                         "baseurl": testapp.metadata["url"],
                     }
                 )
@@ -104,9 +104,8 @@ def test_args_template(testapp):
                 "source": pathlib.Path("archive://index.html"),
                 "destination": pathlib.Path("index.html"),
                 "template": "foobar.txt",
-                "items": [
-                    holocron.Item({"title": "The Force", "content": "Obi-Wan"})
-                ],
+                "items": [holocron.Item({"title": "The Force"})],
+                "groups": [(None, [holocron.Item({"title": "The Force"})])],
                 "baseurl": testapp.metadata["url"],
             }
         ),
@@ -137,15 +136,201 @@ def test_args_save_as(testapp, save_as):
                 "source": pathlib.Path("archive://", save_as),
                 "destination": save_as,
                 "template": "archive.j2",
-                "items": [
-                    holocron.Item({"title": "The Force", "content": "Obi-Wan"})
-                ],
+                "items": [holocron.Item({"title": "The Force"})],
+                "groups": [(None, [holocron.Item({"title": "The Force"})])],
                 "baseurl": testapp.metadata["url"],
             }
         ),
     ]
 
 
+@pytest.mark.parametrize(
+    ["fields", "projected"],
+    [
+        pytest.param(
+            ["title", "author"],
+            {"title": "The Force", "author": "Yoda"},
+            id="title-author",
+        ),
+        pytest.param([], {}, id="empty"),
+        pytest.param(
+            None,
+            {"title": "The Force", "author": "Yoda", "content": "Obi-Wan"},
+            id="none",
+        ),
+    ],
+)
+def test_args_fields(testapp, fields, projected):
+    """Archive processor has to respect 'fields' argument."""
+
+    stream = archive.process(
+        testapp,
+        [
+            holocron.Item(
+                {"title": "The Force", "author": "Yoda", "content": "Obi-Wan"}
+            )
+        ],
+        fields=fields,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream)[-1]["items"] == [holocron.Item(projected)]
+
+
+def test_item_url(testapp):
+    """Archive processor has to keep items' URLs computed."""
+
+    stream = archive.process(
+        testapp,
+        [
+            holocron.WebSiteItem(
+                {
+                    "title": "The Force",
+                    "content": "Obi-Wan",
+                    "destination": pathlib.Path("posts", "1", "index.html"),
+                    "baseurl": testapp.metadata["url"],
+                }
+            )
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+
+    [item] = list(stream)[-1]["items"]
+    assert "content" not in item
+    assert item["url"] == "/posts/1/"
+    assert item["absurl"] == "https://yoda.ua/posts/1/"
+    assert item == holocron.WebSiteItem(
+        {
+            "title": "The Force",
+            "destination": pathlib.Path("posts", "1", "index.html"),
+            "baseurl": testapp.metadata["url"],
+        }
+    )
+
+
+def test_item_groups(testapp):
+    """Archive processor has to sort and group items by year."""
+
+    def _createitem(title, year=None):
+        item = holocron.Item({"title": title})
+        if year:
+            item["published"] = datetime.datetime(year, 1, 1)
+        return item
+
+    stream = archive.process(
+        testapp,
+        [
+            _createitem("a", 2017),
+            _createitem("b"),
+            _createitem("c", 2019),
+            _createitem("d", 2017),
+            _createitem("e"),
+            _createitem("f", 2018),
+        ],
+        fields=None,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+
+    index = list(stream)[-1]
+    assert [item["title"] for item in index["items"]] == list("cfadbe")
+    assert [
+        (year, [item["title"] for item in items])
+        for year, items in index["groups"]
+    ] == [
+        (2019, ["c"]),
+        (2018, ["f"]),
+        (2017, ["a", "d"]),
+        (None, ["b", "e"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    ["amount", "paginate", "pages"],
+    [
+        pytest.param(0, 2, [[]], id="0-by-2"),
+        pytest.param(1, 2, [[0]], id="1-by-2"),
+        pytest.param(2, 2, [[1, 0]], id="2-by-2"),
+        pytest.param(5, 2, [[4, 3], [2, 1], [0]], id="5-by-2"),
+        pytest.param(5, 5, [[4, 3, 2, 1, 0]], id="5-by-5"),
+        pytest.param(5, 1, [[4], [3], [2], [1], [0]], id="5-by-1"),
+    ],
+)
+def test_args_paginate(testapp, amount, paginate, pages):
+    """Archive processor has to respect 'paginate' argument."""
+
+    stream = archive.process(
+        testapp,
+        [
+            holocron.Item(
+                {"title": i, "published": datetime.datetime(2000 + i, 1, 1)}
+            )
+            for i in range(amount)
+        ],
+        paginate=paginate,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+
+    generated = list(stream)[amount:]
+    destinations = [pathlib.Path("index.html")] + [
+        pathlib.Path("page", str(number), "index.html")
+        for number in range(2, len(pages) + 1)
+    ]
+    urls = ["/"] + [f"/page/{number}/" for number in range(2, len(pages) + 1)]
+
+    assert [page["destination"] for page in generated] == destinations
+    assert [
+        [item["title"] for item in page["items"]] for page in generated
+    ] == pages
+    assert [page["pagination"] for page in generated] == [
+        {
+            "page": number,
+            "pages": len(pages),
+            "prev": urls[number - 2] if number > 1 else None,
+            "next": urls[number] if number < len(pages) else None,
+        }
+        for number in range(1, len(pages) + 1)
+    ]
+
+
+def test_args_paginate_as(testapp):
+    """Archive processor has to respect 'paginate_as' argument."""
+
+    stream = archive.process(
+        testapp,
+        [holocron.Item({"title": i}) for i in range(3)],
+        save_as="posts/index.html",
+        paginate=1,
+        paginate_as="posts/{page}.html",
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert [item["destination"] for item in list(stream)[3:]] == [
+        pathlib.Path("posts", "index.html"),
+        pathlib.Path("posts", "2.html"),
+        pathlib.Path("posts", "3.html"),
+    ]
+
+
+def test_args_paginate_save_as(testapp):
+    """Archive processor has to put pages next to 'save_as' by default."""
+
+    stream = archive.process(
+        testapp,
+        [holocron.Item({"title": i}) for i in range(2)],
+        save_as="posts/index.html",
+        paginate=1,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert [item["url"] for item in list(stream)[2:]] == [
+        "/posts/",
+        "/posts/page/2/",
+    ]
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -179,6 +364,16 @@ def test_args_save_as(testapp, save_as):
             "template: {'y': 2} is not of type 'string'",
             id="template-dict",
         ),
+        pytest.param(
+            {"paginate_as": 42},
+            "paginate_as: 42 is not of type 'string'",
+            id="paginate_as-int",
+        ),
+        pytest.param(
+            {"fields": "title"},
+            "fields: 'title' is not valid under any of the given schemas",
+            id="fields-str",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
@@ -1,6 +1,9 @@
 """Chain processor test suite."""
 
 import collections.abc
+import gc
+import pathlib
+import weakref
 
 import pytest
 
@@ -42,10 +45,18 @@ def test_two_items(testapp):
 
     assert items == [
         holocron.Item(
-            {"title": "The Force", "content": "Obi-Wan", "next": items[1]}
+            {
+                "title": "The Force",
+                "content": "Obi-Wan",
+                "next": holocron.Item({"title": items[1]["title"]}),
+            }
         ),
         holocron.Item(
-            {"title": "Force, The", "content": "Yoda", "prev": items[0]}
+            {
+                "title": "Force, The",
+                "content": "Yoda",
+                "prev": holocron.Item({"title": items[0]["title"]}),
+            }
         ),
     ]
 
@@ -67,18 +78,26 @@ def test_three_items(testapp):
 
     assert items == [
         holocron.Item(
-            {"title": "The Force", "content": "Obi-Wan", "next": items[1]}
+            {
+                "title": "The Force",
+                "content": "Obi-Wan",
+                "next": holocron.Item({"title": items[1]["title"]}),
+            }
         ),
         holocron.Item(
             {
                 "title": "Force, The",
                 "content": "Yoda",
-                "prev": items[0],
-                "next": items[2],
+                "prev": holocron.Item({"title": items[0]["title"]}),
+                "next": holocron.Item({"title": items[2]["title"]}),
             }
         ),
         holocron.Item(
-            {"title": "The Dark Side", "content": "Vader", "prev": items[1]}
+            {
+                "title": "The Dark Side",
+                "content": "Vader",
+                "prev": holocron.Item({"title": items[1]["title"]}),
+            }
         ),
     ]
 
@@ -108,7 +127,7 @@ def test_args_order_by(testapp):
             {
                 "title": "The Force",
                 "content": "Obi-Wan",
-                "next": items[1],
+                "next": holocron.Item({"title": items[1]["title"]}),
                 "id": 1,
             }
         ),
@@ -116,8 +135,8 @@ def test_args_order_by(testapp):
             {
                 "title": "Force, The",
                 "content": "Yoda",
-                "prev": items[0],
-                "next": items[2],
+                "prev": holocron.Item({"title": items[0]["title"]}),
+                "next": holocron.Item({"title": items[2]["title"]}),
                 "id": 2,
             }
         ),
@@ -125,7 +144,7 @@ def test_args_order_by(testapp):
             {
                 "title": "The Dark Side",
                 "content": "Vader",
-                "prev": items[1],
+                "prev": holocron.Item({"title": items[1]["title"]}),
                 "id": 3,
             }
         ),
@@ -158,7 +177,7 @@ def test_args_direction(testapp):
             {
                 "title": "The Dark Side",
                 "content": "Vader",
-                "next": items[1],
+                "next": holocron.Item({"title": items[1]["title"]}),
                 "id": 3,
             }
         ),
@@ -166,8 +185,8 @@ def test_args_direction(testapp):
             {
                 "title": "Force, The",
                 "content": "Yoda",
-                "prev": items[0],
-                "next": items[2],
+                "prev": holocron.Item({"title": items[0]["title"]}),
+                "next": holocron.Item({"title": items[2]["title"]}),
                 "id": 2,
             }
         ),
@@ -175,13 +194,119 @@ def test_args_direction(testapp):
             {
                 "title": "The Force",
                 "content": "Obi-Wan",
-                "prev": items[1],
+                "prev": holocron.Item({"title": items[1]["title"]}),
                 "id": 1,
             }
         ),
     ]
 
 
+@pytest.mark.parametrize(
+    ["fields", "summary"],
+    [
+        pytest.param(["title"], {"title": "Force, The"}, id="title"),
+        pytest.param(
+            ["title", "author"],
+            {"title": "Force, The", "author": "Yoda"},
+            id="title-author",
+        ),
+        pytest.param([], {}, id="empty"),
+    ],
+)
+def test_args_fields(testapp, fields, summary):
+    """Chain processor has to respect 'fields' argument."""
+
+    stream = chain.process(
+        testapp,
+        [
+            holocron.Item({"title": "The Force", "content": "Obi-Wan"}),
+            holocron.Item(
+                {"title": "Force, The", "content": "Yoda", "author": "Yoda"}
+            ),
+        ],
+        fields=fields,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream)[0]["next"] == holocron.Item(summary)
+
+
+def test_args_fields_none(testapp):
+    """Chain processor has to link whole items if 'fields' is None."""
+
+    stream = chain.process(
+        testapp,
+        [
+            holocron.Item({"title": "The Force", "content": "Obi-Wan"}),
+            holocron.Item({"title": "Force, The", "content": "Yoda"}),
+        ],
+        fields=None,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    items = list(stream)
+
+    assert items[0]["next"] is items[1]
+    assert items[1]["prev"] is items[0]
+
+
+def test_item_url(testapp):
+    """Chain processor has to link items with their URLs."""
+
+    stream = chain.process(
+        testapp,
+        [
+            holocron.WebSiteItem(
+                {
+                    "destination": pathlib.Path(f"{i}.html"),
+                    "baseurl": "https://yoda.ua",
+                    "content": "Obi-Wan",
+                }
+            )
+            for i in range(2)
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    items = list(stream)
+
+    assert items[0]["next"]["url"] == "/1.html"
+    assert items[1]["prev"]["url"] == "/0.html"
+    assert "content" not in items[0]["next"]
+
+
+@pytest.mark.parametrize(
+    ["args"],
+    [
+        pytest.param({}, id="unordered"),
+        pytest.param({"order_by": "id"}, id="ordered"),
+    ],
+)
+def test_item_freed(testapp, args):
+    """Chain processor has to let processed items be freed at once."""
+
+    amount = 10000
+    refs = []
+
+    def stream():
+        for i in range(amount):
+            item = holocron.Item({"id": i, "content": "Obi-Wan" * 100})
+            refs.append(weakref.ref(item))
+            yield item
+
+    # Reference cycles are freed by the garbage collector only, so disabling
+    # it ensures that items are freed by reference counting alone.
+    gc.disable()
+    try:
+        for item in chain.process(testapp, stream(), **args):
+            pass
+        del item
+
+        assert [ref for ref in refs if ref() is not None] == []
+    finally:
+        gc.enable()
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -0,0 +1,174 @@
+"""Checkpoint processor test suite."""
+
+import collections.abc
+import pathlib
+
+import pytest
+
+import holocron
+from holocron._processors import checkpoint
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    def spam(app, items):
+        for item in items:
+            item["spam"] = True
+            yield item
+
+    instance = holocron.Application()
+    instance.add_processor("checkpoint", checkpoint.process)
+    instance.add_processor("spam", spam)
+    return instance
+
+
+def _createitem(i, content=None):
+    return holocron.WebSiteItem(
+        source=pathlib.Path(f"{i}.md"),
+        destination=pathlib.Path(f"{i}.html"),
+        baseurl="https://yoda.ua",
+        content=f"the Force #{i}" if content is None else content,
+    )
+
+
+def test_item(testapp, tmpdir):
+    """Checkpoint processor has to save a stream and pass it through."""
+
+    stream = checkpoint.process(
+        testapp,
+        [_createitem(0), _createitem(1, b"\x00\xff")],
+        name="test",
+        to=tmpdir.strpath,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [_createitem(0), _createitem(1, b"\x00\xff")]
+    assert list(checkpoint.load(tmpdir.strpath, "test")) == [
+        _createitem(0),
+        _createitem(1, b"\x00\xff"),
+    ]
+    assert not tmpdir.join("test.items.tmp").check()
+
+
+def test_item_content_addressed(testapp, tmpdir):
+    """Same content has to be stored once."""
+
+    for name in ("a", "b"):
+        stream = checkpoint.process(
+            testapp,
+            [_createitem(i, "the Force") for i in range(3)],
+            name=name,
+            to=tmpdir.strpath,
+        )
+        assert len(list(stream)) == 3
+
+    assert len(tmpdir.join("objects").listdir()) == 1
+    assert b"the Force" not in tmpdir.join("a.items").read_binary()
+
+
+def test_item_saved_before_passed(testapp, tmpdir):
+    """Stream has to be saved before the first item is passed further."""
+
+    stream = checkpoint.process(
+        testapp,
+        [_createitem(i) for i in range(3)],
+        name="test",
+        to=tmpdir.strpath,
+    )
+
+    next(stream)
+
+    assert len(list(checkpoint.load(tmpdir.strpath, "test"))) == 3
+
+
+def test_resume(testapp, tmpdir):
+    """Pipe has to be resumed from a checkpoint."""
+
+    def boom(app, items):
+        raise AssertionError("processors before checkpoint are invoked")
+        yield
+
+    testapp.add_processor("boom", boom)
+    testapp.add_pipe(
+        "test",
+        [
+            {"name": "boom"},
+            {
+                "name": "checkpoint",
+                "args": {"name": "test", "to": tmpdir.strpath},
+            },
+            {"name": "spam"},
+        ],
+    )
+
+    for _ in checkpoint.process(
+        testapp, [_createitem(0)], name="test", to=tmpdir.strpath
+    ):
+        pass
+
+    stream = checkpoint.resume(testapp, "test", "test")
+
+    assert list(stream) == [
+        holocron.WebSiteItem(_createitem(0), spam=True),
+    ]
+
+
+@pytest.mark.parametrize(
+    ["pipe", "name", "error"],
+    [
+        pytest.param("yoda", "test", "no such pipe: 'yoda'", id="no-pipe"),
+        pytest.param(
+            [{"name": "spam"}], "test", "no such checkpoint: 'test'", id="none"
+        ),
+        pytest.param(
+            [{"name": "checkpoint", "args": {"name": "test"}}],
+            "test",
+            "checkpoint has not been saved: 'test'",
+            id="not-saved",
+        ),
+        pytest.param(
+            {
+                "posts": {
+                    "pipe": [{"name": "checkpoint", "args": {"name": "test"}}]
+                }
+            },
+            "test",
+            "cannot resume a graph pipe from a checkpoint",
+            id="graph",
+        ),
+    ],
+)
+def test_resume_bad_value(testapp, monkeypatch, tmpdir, pipe, name, error):
+    """Pipe cannot be resumed from a checkpoint that does not exist."""
+
+    monkeypatch.chdir(tmpdir)
+
+    with pytest.raises(ValueError) as excinfo:
+        next(checkpoint.resume(testapp, pipe, name))
+    assert str(excinfo.value) == error
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param(
+            {"name": 42}, "name: 42 is not of type 'string'", id="name-int"
+        ),
+        pytest.param(
+            {"name": "a/b"},
+            "name: 'a/b' does not match '^[\\\\w.-]+$'",
+            id="name-path",
+        ),
+        pytest.param(
+            {"name": "test", "to": 42},
+            "to: 42 is not of type 'string'",
+            id="to-int",
+        ),
+    ],
+)
+def test_args_bad_value(testapp, args, error):
+    """Checkpoint processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(checkpoint.process(testapp, [], **args))
+    assert str(excinfo.value) == error
@@ -8,7 +8,7 @@ import pathlib
 import pytest
 
 import holocron
-from holocron._processors import commonmark
+from holocron._processors import commonmark, _highlight
 
 
 class _pytest_regex:
@@ -394,6 +394,34 @@ def test_args_pygmentize_unknown_language(testapp, language):
     ]
 
 
+def test_args_pygmentize_cachedir(testapp, tmpdir):
+    """Commonmark processor has to reuse highlighted code from cache."""
+
+    def convert():
+        stream = commonmark.process(
+            testapp,
+            [
+                holocron.Item(
+                    {
+                        "content": "```python\nlambda x: pass\n```\n",
+                        "destination": pathlib.Path("1.md"),
+                    }
+                )
+            ],
+            pygmentize=True,
+            cachedir=tmpdir.strpath,
+        )
+        return list(stream)
+
+    highlighter = _highlight.get_highlighter(tmpdir.strpath)
+    items = convert()
+
+    assert (highlighter.hits, highlighter.misses) == (0, 1)
+    assert convert() == items
+    assert (highlighter.hits, highlighter.misses) == (1, 1)
+    assert tmpdir.join("highlight").check(dir=1)
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
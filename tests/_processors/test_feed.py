@@ -6,7 +6,11 @@ import itertools
 import pathlib
 import unittest.mock
 
-import pkg_resources
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:
+    import importlib_metadata
+
 import pytest
 import untangle
 
@@ -14,7 +18,7 @@ import holocron
 from holocron._processors import feed
 
 
-_HOLOCRON_VERSION = pkg_resources.get_distribution("holocron").version
+_HOLOCRON_VERSION = importlib_metadata.version("holocron")
 
 
 @pytest.fixture(scope="function")
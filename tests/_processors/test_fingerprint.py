@@ -0,0 +1,334 @@
+"""Fingerprint processor test suite."""
+
+import collections.abc
+import hashlib
+import pathlib
+
+import pytest
+
+import holocron
+from holocron._processors import fingerprint, jinja2, linkcheck
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    return holocron.Application({"url": "https://yoda.ua"})
+
+
+def _createitem(name, content):
+    return holocron.WebSiteItem(
+        {
+            "destination": pathlib.Path(name),
+            "baseurl": "https://yoda.ua",
+            "content": content,
+        }
+    )
+
+
+def _digest(content):
+    if isinstance(content, str):
+        content = content.encode("UTF-8")
+    return hashlib.sha1(content).hexdigest()[:8]
+
+
+def test_item(testapp):
+    """Fingerprint processor has to work!"""
+
+    stream = fingerprint.process(
+        testapp,
+        [
+            _createitem("index.html", '<img src="/static/logo.svg">'),
+            _createitem("static/logo.svg", b"<svg/>"),
+        ],
+        rewrite=[".html"],
+    )
+
+    digest = _digest(b"<svg/>")
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        _createitem(f"static/logo.{digest}.svg", b"<svg/>"),
+        _createitem("index.html", f'<img src="/static/logo.{digest}.svg">'),
+    ]
+    assert testapp.metadata["assets"] == {
+        "static/logo.svg": f"static/logo.{digest}.svg"
+    }
+
+
+def test_item_references(testapp):
+    """Fingerprint processor has to rewrite references only."""
+
+    stream = fingerprint.process(
+        testapp,
+        [
+            _createitem("static/a.css", "a {}"),
+            _createitem("static/a.css.map", "{}"),
+            _createitem(
+                "index.html",
+                '<link href="/static/a.css">\n'
+                "<link href='https://yoda.ua/static/a.css?v=1'>\n"
+                '<script src="/static/a.css.map#force"></script>\n'
+                "<a href=/static/a.css>a</a>\n"
+                '<a href="/static/a.cssx">x</a>\n'
+                '<a href="https://google.com/static/a.css">google</a>\n'
+                "<p>/static/a.css</p>\n",
+            ),
+        ],
+        rewrite=[".html"],
+    )
+
+    a, a_map = _digest("a {}"), _digest("{}")
+
+    assert list(stream)[-1]["content"] == (
+        f'<link href="/static/a.{a}.css">\n'
+        f"<link href='https://yoda.ua/static/a.{a}.css?v=1'>\n"
+        f'<script src="/static/a.css.{a_map}.map#force"></script>\n'
+        f"<a href=/static/a.{a}.css>a</a>\n"
+        '<a href="/static/a.cssx">x</a>\n'
+        '<a href="https://google.com/static/a.css">google</a>\n'
+        "<p>/static/a.css</p>\n"
+    )
+
+
+def test_item_stylesheets(testapp):
+    """Fingerprint processor has to fingerprint rewritten stylesheets."""
+
+    stream = fingerprint.process(
+        testapp,
+        [
+            _createitem("index.html", '<link href="/static/a.css">'),
+            _createitem(
+                "static/a.css", 'a { background: url("/static/b.png") }'
+            ),
+            _createitem("static/b.png", b"PNG"),
+        ],
+        rewrite=[".html", ".css"],
+    )
+
+    b = _digest(b"PNG")
+    a = _digest(f'a {{ background: url("/static/b.{b}.png") }}')
+
+    assert list(stream) == [
+        _createitem(f"static/b.{b}.png", b"PNG"),
+        _createitem("index.html", f'<link href="/static/a.{a}.css">'),
+        _createitem(
+            f"static/a.{a}.css",
+            f'a {{ background: url("/static/b.{b}.png") }}',
+        ),
+    ]
+
+
+def test_item_passed_first(testapp):
+    """Fingerprint processor has to pass items that refer nothing at once."""
+
+    def stream():
+        yield _createitem("static/logo.svg", b"<svg/>")
+        raise AssertionError("must not be consumed")
+
+    item = next(fingerprint.process(testapp, stream()))
+
+    assert item["url"] == f"/static/logo.{_digest(b'<svg/>')}.svg"
+
+
+def test_item_passed_rewritten(testapp):
+    """Fingerprint processor has to pass items that refer seen assets."""
+
+    def stream():
+        yield _createitem("static/logo.svg", b"<svg/>")
+        yield _createitem("index.html", '<img src="/static/logo.svg">')
+        yield _createitem("about.html", '<a href="/">Home</a>')
+        raise AssertionError("must not be consumed")
+
+    stream = fingerprint.process(testapp, stream(), rewrite=[".html"])
+    digest = _digest(b"<svg/>")
+
+    assert [next(stream) for _ in range(3)] == [
+        _createitem(f"static/logo.{digest}.svg", b"<svg/>"),
+        _createitem("index.html", f'<img src="/static/logo.{digest}.svg">'),
+        _createitem("about.html", '<a href="/">Home</a>'),
+    ]
+
+
+def test_item_held_unseen(testapp):
+    """Fingerprint processor has to hold items that refer unseen assets."""
+
+    stream = fingerprint.process(
+        testapp,
+        [
+            _createitem("index.html", '<img src="/static/logo.svg">'),
+            _createitem("about.html", '<a href="/">Home</a>'),
+            _createitem(
+                "faq.html", '<img src="https://yoda.ua/static/logo.svg">'
+            ),
+            _createitem("static/logo.svg", b"<svg/>"),
+        ],
+        rewrite=[".html"],
+    )
+
+    digest = _digest(b"<svg/>")
+
+    assert list(stream) == [
+        _createitem("about.html", '<a href="/">Home</a>'),
+        _createitem(f"static/logo.{digest}.svg", b"<svg/>"),
+        _createitem("index.html", f'<img src="/static/logo.{digest}.svg">'),
+        _createitem(
+            "faq.html", f'<img src="https://yoda.ua/static/logo.{digest}.svg">'
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ["rewrite"],
+    [
+        pytest.param([], id="asset_url"),
+        pytest.param([".html", ".css"], id="rewrite"),
+    ],
+)
+def test_item_theme_statics(testapp, caplog, rewrite):
+    """Fingerprint processor has to fingerprint statics of a theme."""
+
+    testapp.add_processor("jinja2", jinja2.process)
+    testapp.add_processor("fingerprint", fingerprint.process)
+    testapp.add_processor("linkcheck", linkcheck.process)
+
+    def stream():
+        yield _createitem("index.html", "the Force")
+        raise AssertionError("must not be consumed")
+
+    pipe = [
+        {"name": "jinja2"},
+        {"name": "fingerprint", "args": {"rewrite": rewrite}},
+        {"name": "linkcheck"},
+    ]
+
+    # Pages are rendered with fingerprinted URLs of theme statics, and hence
+    # they are passed down the stream at once.
+    stream = testapp.invoke(pipe, stream())
+    items = [next(stream) for _ in range(4)]
+    statics = pathlib.Path(jinja2.__file__).parent.joinpath("theme", "static")
+
+    assert sorted(item["destination"] for item in items[:3]) == [
+        pathlib.Path("static", f"{stem}.{_digest(content)}{suffix}")
+        for stem, suffix, content in (
+            (path.stem, path.suffix, path.read_bytes())
+            for path in sorted(statics.iterdir())
+        )
+    ]
+    for static in items[:3]:
+        assert f'"{static["url"]}"' in items[3]["content"]
+    assert "/static/style.css" not in items[3]["content"]
+
+    # Once the stream is exhausted, links are checked, and there must be no
+    # unresolved ones.
+    stream = testapp.invoke(pipe, [_createitem("index.html", "the Force")])
+
+    assert len(list(stream)) == 4
+    assert [record.message for record in caplog.records] == []
+
+
+def test_item_manifest_extended(testapp):
+    """Fingerprint processor has to extend a manifest of preceding runs."""
+
+    testapp.metadata["assets"] = {"static/a.css": "static/a.0.css"}
+
+    for _ in fingerprint.process(testapp, [_createitem("static/b.png", b"")]):
+        pass
+
+    assert testapp.metadata["assets"] == {
+        "static/a.css": "static/a.0.css",
+        "static/b.png": f"static/b.{_digest(b'')}.png",
+    }
+
+
+def test_args_pattern(testapp):
+    """Fingerprint processor has to respect 'pattern' argument."""
+
+    stream = fingerprint.process(
+        testapp,
+        [_createitem("static/a.png", b""), _createitem("img/b.png", b"")],
+        pattern=r"img/",
+    )
+
+    assert [item["url"] for item in stream] == [
+        "/static/a.png",
+        f"/img/b.{_digest(b'')}.png",
+    ]
+
+
+def test_args_length(testapp):
+    """Fingerprint processor has to respect 'length' argument."""
+
+    stream = fingerprint.process(
+        testapp, [_createitem("static/a.png", b"")], length=12
+    )
+
+    (item,) = stream
+    digest = hashlib.sha1(b"").hexdigest()[:12]
+
+    assert item["url"] == f"/static/a.{digest}.png"
+
+
+def test_args_rewrite_default(testapp):
+    """Fingerprint processor has to rewrite nothing by default."""
+
+    stream = fingerprint.process(
+        testapp,
+        [
+            _createitem("index.html", '<img src="/static/logo.svg">'),
+            _createitem("static/logo.svg", b"<svg/>"),
+        ],
+    )
+
+    assert list(stream) == [
+        _createitem("index.html", '<img src="/static/logo.svg">'),
+        _createitem(f"static/logo.{_digest(b'<svg/>')}.svg", b"<svg/>"),
+    ]
+
+
+def test_args_rewrite(testapp):
+    """Fingerprint processor has to respect 'rewrite' argument."""
+
+    stream = fingerprint.process(
+        testapp,
+        [
+            _createitem("index.html", '<img src="/static/logo.svg">'),
+            _createitem("index.xml", '<img src="/static/logo.svg"/>'),
+            _createitem("static/logo.svg", b"<svg/>"),
+        ],
+        rewrite=[".xml"],
+    )
+
+    digest = _digest(b"<svg/>")
+
+    assert [item["content"] for item in stream][::2] == [
+        '<img src="/static/logo.svg">',
+        f'<img src="/static/logo.{digest}.svg"/>',
+    ]
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param(
+            {"pattern": 42},
+            "pattern: 42 is not of type 'string'",
+            id="pattern-int",
+        ),
+        pytest.param(
+            {"length": 2},
+            "length: 2 is less than the minimum of 4",
+            id="length-small",
+        ),
+        pytest.param(
+            {"rewrite": ".html"},
+            "rewrite: '.html' is not of type 'array'",
+            id="rewrite-str",
+        ),
+    ],
+)
+def test_args_bad_value(testapp, args, error):
+    """Fingerprint processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(fingerprint.process(testapp, [], **args))
+    assert str(excinfo.value) == error
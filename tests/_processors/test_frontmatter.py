@@ -515,6 +515,26 @@ def test_args_format(testapp, frontsnippet, format, exception):
         ]
 
 
+def test_item_batches(testapp):
+    """Frontmatter processor has to process batches of items."""
+
+    stream = frontmatter.process(
+        testapp,
+        [
+            holocron.Item({"content": "---\na: 1\n---\nyoda"}),
+            holocron.Item({"content": "vader"}),
+            holocron.Item({"content": "---\na: 2\n---\nluke"}),
+        ],
+    )
+    stream.batchsize = 2
+
+    assert list(stream) == [
+        holocron.Item({"content": "yoda", "a": 1}),
+        holocron.Item({"content": "vader"}),
+        holocron.Item({"content": "luke", "a": 2}),
+    ]
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
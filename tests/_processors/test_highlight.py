@@ -0,0 +1,102 @@
+"""Highlighting service test suite."""
+
+import pygments.util
+import pytest
+
+from holocron._processors import _highlight
+
+
+@pytest.fixture(scope="function")
+def highlighter():
+    return _highlight.Highlighter()
+
+
+def test_highlight(highlighter):
+    """Highlighter has to highlight code using Pygments."""
+
+    html = highlighter.highlight("lambda x: pass", "python")
+
+    assert 'class="highlight"' in html
+    assert '<span class="k">lambda</span>' in html
+    assert (highlighter.hits, highlighter.misses) == (0, 1)
+
+
+def test_highlight_cached(highlighter):
+    """Highlighter has to highlight identical snippets only once."""
+
+    html = highlighter.highlight("lambda x: pass", "python")
+
+    assert highlighter.highlight("lambda x: pass", "python") == html
+    assert (highlighter.hits, highlighter.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    ["code", "language", "options"],
+    [
+        pytest.param("lambda y: pass", "python", {}, id="code"),
+        pytest.param("lambda x: pass", "ruby", {}, id="language"),
+        pytest.param("lambda x: pass", "python", {"linenos": True}, id="opts"),
+    ],
+)
+def test_highlight_key(highlighter, code, language, options):
+    """Highlighter has to distinguish snippets by code, language & options."""
+
+    highlighter.highlight("lambda x: pass", "python")
+    highlighter.highlight(code, language, **options)
+
+    assert (highlighter.hits, highlighter.misses) == (0, 2)
+
+
+def test_highlight_unknown_language(highlighter):
+    """Highlighter has to raise an error if language is unknown."""
+
+    with pytest.raises(pygments.util.ClassNotFound):
+        highlighter.highlight("lambda x: pass", "yoda")
+
+
+def test_get_lexer(highlighter):
+    """Highlighter has to reuse lexer instances."""
+
+    assert highlighter.get_lexer("python") is highlighter.get_lexer("python")
+
+
+def test_lru(highlighter):
+    """Highlighter has to evict least recently used entries."""
+
+    highlighter = _highlight.Highlighter(maxsize=2)
+    highlighter.store("a", "python", {}, "A")
+    highlighter.store("b", "python", {}, "B")
+
+    assert highlighter.lookup("a", "python", {}) == "A"
+
+    highlighter.store("c", "python", {}, "C")
+
+    assert highlighter.lookup("a", "python", {}) == "A"
+    assert highlighter.lookup("b", "python", {}) is None
+    assert highlighter.lookup("c", "python", {}) == "C"
+    assert (highlighter.hits, highlighter.misses) == (3, 1)
+
+
+def test_cachedir(tmpdir):
+    """Highlighter has to persist highlighted snippets on disk."""
+
+    highlighter = _highlight.Highlighter(cachedir=tmpdir.strpath)
+    html = highlighter.highlight("lambda x: pass", "python")
+
+    highlighter = _highlight.Highlighter(cachedir=tmpdir.strpath)
+
+    assert highlighter.highlight("lambda x: pass", "python") == html
+    assert (highlighter.hits, highlighter.misses) == (1, 0)
+    assert tmpdir.join("highlight").check(dir=1)
+
+
+def test_get_highlighter(tmpdir):
+    """Highlighter instances have to be shared per cache directory."""
+
+    assert _highlight.get_highlighter() is _highlight.get_highlighter()
+    assert _highlight.get_highlighter(
+        tmpdir.strpath
+    ) is _highlight.get_highlighter(tmpdir.strpath)
+    assert _highlight.get_highlighter() is not _highlight.get_highlighter(
+        tmpdir.strpath
+    )
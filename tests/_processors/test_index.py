@@ -0,0 +1,225 @@
+"""Index processor test suite."""
+
+import collections.abc
+import datetime
+import pathlib
+import sqlite3
+import weakref
+
+import pytest
+
+import holocron
+from holocron._processors import index
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    return holocron.Application({"url": "https://yoda.ua"})
+
+
+def _createitem(i, tags=()):
+    return holocron.WebSiteItem(
+        source=pathlib.Path(f"{i}.md"),
+        destination=pathlib.Path(f"{i}.html"),
+        baseurl="https://yoda.ua",
+        title=f"The Force (part #{i})",
+        published=datetime.datetime(
+            2020, 1, i + 1, tzinfo=datetime.timezone.utc
+        ),
+        tags=list(tags),
+        content="Obi-Wan " * 100,
+    )
+
+
+def _strip(item):
+    item = holocron.WebSiteItem(item)
+    del item["content"]
+    return item
+
+
+@pytest.fixture(scope="function")
+def built(testapp, tmpdir):
+    items = [
+        _createitem(0, ["jedi"]),
+        _createitem(1, ["jedi", "force"]),
+        _createitem(2, ["sith", "force"]),
+        _createitem(3, ["jedi", "force", "yoda"]),
+        _createitem(4),
+    ]
+
+    for _ in index.process(
+        testapp, items, to=tmpdir.join("index.sqlite").strpath
+    ):
+        pass
+
+    instance = index.Index(tmpdir.join("index.sqlite").strpath)
+    yield instance
+    instance.close()
+
+
+def test_item(testapp, tmpdir):
+    """Index processor has to index items and pass them through."""
+
+    stream = index.process(
+        testapp,
+        [_createitem(0), _createitem(1)],
+        to=tmpdir.join("index.sqlite").strpath,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [_createitem(0), _createitem(1)]
+    assert testapp.metadata["index"] == tmpdir.join("index.sqlite").strpath
+    assert not tmpdir.join("index.sqlite.tmp").check()
+
+
+def test_item_rebuilt(testapp, tmpdir):
+    """Index has to be rebuilt from scratch."""
+
+    for items in ([_createitem(0), _createitem(1)], [_createitem(2)]):
+        for _ in index.process(
+            testapp, items, to=tmpdir.join("index.sqlite").strpath
+        ):
+            pass
+
+    instance = index.Index(tmpdir.join("index.sqlite").strpath)
+    assert instance.query() == [_strip(_createitem(2))]
+
+
+def test_item_tags_str(testapp, tmpdir):
+    """A single tag may be given as a string."""
+
+    item = _createitem(0)
+    item["tags"] = "jedi"
+
+    for _ in index.process(
+        testapp, [item], to=tmpdir.join("index.sqlite").strpath
+    ):
+        pass
+
+    instance = index.Index(tmpdir.join("index.sqlite").strpath)
+    assert [item["source"] for item in instance.query(tag="jedi")] == [
+        pathlib.Path("0.md")
+    ]
+    assert instance.query(tag="j") == []
+    instance.close()
+
+
+def test_item_not_kept(testapp, tmpdir):
+    """Items must not be kept in memory while the stream is indexed."""
+
+    refs = []
+
+    def stream():
+        for i in range(3):
+            item = _createitem(i)
+            refs.append(weakref.ref(item))
+            yield item
+
+    stream = index.process(
+        testapp, stream(), to=tmpdir.join("index.sqlite").strpath
+    )
+
+    assert next(stream) == _createitem(0)
+    assert len(refs) == 3
+    assert [ref() for ref in refs[:-1]] == [None, None]
+    assert list(stream) == [_createitem(1), _createitem(2)]
+
+
+@pytest.mark.parametrize(
+    ["kwargs", "expected"],
+    [
+        pytest.param({}, [4, 3, 2, 1, 0], id="all"),
+        pytest.param({"limit": 2}, [4, 3], id="latest"),
+        pytest.param({"tag": "jedi"}, [3, 1, 0], id="tag"),
+        pytest.param({"tag": "jedi", "limit": 1}, [3], id="tag-latest"),
+        pytest.param({"tag": "vader"}, [], id="tag-unknown"),
+        pytest.param(
+            {
+                "since": datetime.datetime(
+                    2020, 1, 2, tzinfo=datetime.timezone.utc
+                ),
+                "until": datetime.datetime(
+                    2020, 1, 4, tzinfo=datetime.timezone.utc
+                ),
+            },
+            [2, 1],
+            id="range",
+        ),
+        pytest.param({"since": "2020-01-03"}, [4, 3, 2], id="since-str"),
+        pytest.param(
+            {"until": "2020-01-02T02:00:00+03:00"}, [0], id="until-tz"
+        ),
+        pytest.param(
+            {"tag": "force", "since": datetime.date(2020, 1, 3)},
+            [3, 2],
+            id="tag-since",
+        ),
+    ],
+)
+def test_query(built, kwargs, expected):
+    """Index has to be queried by tags and dates."""
+
+    assert [item["source"] for item in built.query(**kwargs)] == [
+        pathlib.Path(f"{i}.md") for i in expected
+    ]
+
+
+def test_query_items(built):
+    """Indexed items have to be restored without their content."""
+
+    assert built.query(tag="sith") == [
+        _strip(_createitem(2, ["sith", "force"]))
+    ]
+    assert built.query(tag="sith")[0]["url"] == "/2.html"
+
+
+def test_query_indexed(tmpdir, built):
+    """Queries have to use indexes rather than scan tables."""
+
+    connection = sqlite3.connect(tmpdir.join("index.sqlite").strpath)
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM items"
+        " JOIN tags ON tags.item = items.id WHERE tags.tag = ?"
+        " ORDER BY items.date DESC LIMIT 5",
+        ("jedi",),
+    ).fetchall()
+
+    assert "SCAN" not in " ".join(row[-1] for row in plan).replace(
+        "SCAN CONSTANT ROW", ""
+    )
+
+
+@pytest.mark.parametrize(
+    ["i", "expected"],
+    [
+        pytest.param(3, [1, 2, 0], id="most-shared"),
+        pytest.param(0, [3, 1], id="one-tag"),
+        pytest.param(4, [], id="no-tags"),
+    ],
+)
+def test_related(built, i, expected):
+    """Related items have to share tags with a given one."""
+
+    assert [
+        item["source"] for item in built.related(_createitem(i), limit=5)
+    ] == [pathlib.Path(f"{i}.md") for i in expected]
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param({"to": 42}, "to: 42 is not of type 'string'", id="to"),
+        pytest.param(
+            {"date": 42}, "date: 42 is not of type 'string'", id="date"
+        ),
+        pytest.param(
+            {"tags": 42}, "tags: 42 is not of type 'string'", id="tags"
+        ),
+    ],
+)
+def test_args_bad_value(testapp, args, error):
+    """Index processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(index.process(testapp, [], **args))
+    assert str(excinfo.value) == error
@@ -1,6 +1,7 @@
 """Jinja2 processor test suite."""
 
 import collections.abc
+import datetime
 import pathlib
 import textwrap
 import unittest.mock
@@ -9,7 +10,7 @@ import pytest
 import bs4
 
 import holocron
-from holocron._processors import jinja2
+from holocron._processors import fingerprint, index, jinja2
 
 
 @pytest.fixture(scope="function")
@@ -31,20 +32,20 @@ def test_item(testapp):
     assert isinstance(stream, collections.abc.Iterable)
 
     items = list(stream)
-    assert items[:1] == [
+    assert items[3:] == [
         holocron.Item(
             {"title": "History of the Force", "content": unittest.mock.ANY}
         )
     ]
 
-    soup = bs4.BeautifulSoup(items[0]["content"], "html.parser")
+    soup = bs4.BeautifulSoup(items[3]["content"], "html.parser")
     assert soup.meta["charset"] == "UTF-8"
     assert soup.article.header.h1.string == "History of the Force"
     assert list(soup.article.stripped_strings)[1] == "the Force"
 
     # Since we don't know in which order statics are discovered, we sort them
     # so we can avoid possible flakes.
-    static = sorted(items[1:], key=lambda d: d["source"])
+    static = sorted(items[:3], key=lambda d: d["source"])
     assert static[0]["source"] == pathlib.Path("static", "logo.svg")
     assert static[0]["destination"] == static[0]["source"]
     assert static[1]["source"] == pathlib.Path("static", "pygments.css")
@@ -126,7 +127,7 @@ def test_item_many(testapp, tmpdir, amount):
     items = list(stream)
 
     assert (
-        items[:amount]
+        items[3:]
         == [
             holocron.Item(
                 {"title": "History of the Force", "content": unittest.mock.ANY}
@@ -135,7 +136,7 @@ def test_item_many(testapp, tmpdir, amount):
         * amount
     )
 
-    for i, item in enumerate(items[:amount]):
+    for i, item in enumerate(items[3:]):
         soup = bs4.BeautifulSoup(item["content"], "html.parser")
         assert soup.meta["charset"] == "UTF-8"
         assert soup.article.header.h1.string == "History of the Force"
@@ -143,7 +144,7 @@ def test_item_many(testapp, tmpdir, amount):
 
     # Since we don't know in which order statics are discovered, we sort them
     # so we can avoid possible flakes.
-    static = sorted(items[amount:], key=lambda d: d["source"])
+    static = sorted(items[:3], key=lambda d: d["source"])
     assert static[0]["source"] == pathlib.Path("static", "logo.svg")
     assert static[0]["destination"] == static[0]["source"]
     assert static[1]["source"] == pathlib.Path("static", "pygments.css")
@@ -182,16 +183,6 @@ def test_args_themes(testapp, tmpdir):
 
     assert isinstance(stream, collections.abc.Iterable)
     assert list(stream) == [
-        holocron.Item(
-            {
-                "title": "History of the Force",
-                "content": textwrap.dedent(
-                    """\
-                    template: my super template
-                    rendered: History of the Force"""
-                ),
-            }
-        ),
         holocron.WebSiteItem(
             {
                 "content": "article { margin: 0 }",
@@ -202,6 +193,16 @@ def test_args_themes(testapp, tmpdir):
                 "baseurl": testapp.metadata["url"],
             }
         ),
+        holocron.Item(
+            {
+                "title": "History of the Force",
+                "content": textwrap.dedent(
+                    """\
+                    template: my super template
+                    rendered: History of the Force"""
+                ),
+            }
+        ),
     ]
 
 
@@ -289,6 +290,108 @@ def test_args_themes_two_themes(testapp, tmpdir):
     ]
 
 
+def test_item_environment_shared(testapp, tmpdir):
+    """Jinja2 processor has to share environments between invocations."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "{{ item.title }}", encoding="UTF-8"
+    )
+
+    with unittest.mock.patch.object(
+        jinja2.jinja2, "Environment", wraps=jinja2.jinja2.Environment
+    ) as environment:
+        for _ in range(2):
+            stream = jinja2.process(
+                testapp,
+                [holocron.Item({"title": "the Force"})],
+                themes=[tmpdir.join("theme_a").strpath],
+            )
+
+            assert list(stream) == [
+                holocron.Item({"title": "the Force", "content": "the Force"})
+            ]
+
+    assert environment.call_count == 1
+
+
+def test_item_index(testapp, tmpdir):
+    """Jinja2 processor has to expose an index of items to templates."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "{% for post in query_index(tag='force', limit=2) %}"
+        "{{ post.url }} "
+        "{% endfor %}"
+        "| {% for post in related_items(item) %}{{ post.title }} {% endfor %}",
+        encoding="UTF-8",
+    )
+    testapp.add_processor("index", index.process)
+    testapp.add_processor("jinja2", jinja2.process)
+
+    stream = testapp.invoke(
+        [
+            {"name": "index", "args": {"to": tmpdir.join("i.sqlite").strpath}},
+            {
+                "name": "jinja2",
+                "args": {"themes": [tmpdir.join("theme_a").strpath]},
+            },
+        ],
+        [
+            holocron.WebSiteItem(
+                {
+                    "source": pathlib.Path(f"{i}.md"),
+                    "destination": pathlib.Path(f"{i}.html"),
+                    "baseurl": testapp.metadata["url"],
+                    "title": f"#{i}",
+                    "tags": ["force"],
+                    "published": datetime.date(2020, 1, i + 1),
+                }
+            )
+            for i in range(3)
+        ],
+    )
+
+    assert [item["content"] for item in stream][:3] == [
+        "/2.html /1.html | #2 #1 ",
+        "/2.html /1.html | #2 #0 ",
+        "/2.html /1.html | #1 #0 ",
+    ]
+
+
+def test_item_asset_url(testapp, tmpdir):
+    """Jinja2 processor has to expose URLs of fingerprinted assets."""
+
+    tmpdir.ensure("theme_a", "templates", "item.j2").write_text(
+        "{{ asset_url('static/a.css') }} {{ asset_url('/static/b.css') }}",
+        encoding="UTF-8",
+    )
+    testapp.add_processor("fingerprint", fingerprint.process)
+    testapp.add_processor("jinja2", jinja2.process)
+
+    stream = testapp.invoke(
+        [
+            {"name": "fingerprint", "args": {"rewrite": []}},
+            {
+                "name": "jinja2",
+                "args": {"themes": [tmpdir.join("theme_a").strpath]},
+            },
+        ],
+        [
+            holocron.WebSiteItem(
+                {
+                    "destination": pathlib.Path("static", "a.css"),
+                    "baseurl": testapp.metadata["url"],
+                    "content": "body {}",
+                    "template": "item.j2",
+                }
+            ),
+        ],
+    )
+
+    assert [item["content"] for item in stream] == [
+        "/static/a.40294f6c.css /static/b.css"
+    ]
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
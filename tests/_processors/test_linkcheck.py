@@ -0,0 +1,224 @@
+"""Linkcheck processor test suite."""
+
+import collections.abc
+import pathlib
+
+import pytest
+
+import holocron
+from holocron._processors import linkcheck
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    return holocron.Application({"url": "https://yoda.ua"})
+
+
+def _createitem(name, content="", baseurl="https://yoda.ua"):
+    return holocron.WebSiteItem(
+        {
+            "destination": pathlib.Path(name),
+            "baseurl": baseurl,
+            "content": content,
+        }
+    )
+
+
+def _messages(caplog):
+    return [record.message for record in caplog.records]
+
+
+def test_item(testapp, caplog):
+    """Linkcheck processor has to work!"""
+
+    stream = linkcheck.process(
+        testapp,
+        [
+            _createitem("index.html", '<a href="/about/">About</a>'),
+            _createitem("about/index.html", '<a href="/">Home</a>'),
+        ],
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        _createitem("index.html", '<a href="/about/">About</a>'),
+        _createitem("about/index.html", '<a href="/">Home</a>'),
+    ]
+    assert _messages(caplog) == []
+
+
+def test_item_unresolved(testapp, caplog):
+    """Linkcheck processor has to report unresolved links with locations."""
+
+    stream = linkcheck.process(
+        testapp,
+        [
+            _createitem(
+                "posts/1.html",
+                "<p>\n"
+                '  <a href="/posts/2.html">Next</a>\n'
+                '  <img src="../static/force.png">\n'
+                "</p>",
+            ),
+            _createitem("static/yoda.png"),
+        ],
+    )
+
+    assert len(list(stream)) == 2
+    assert _messages(caplog) == [
+        "linkcheck: posts/1.html:2:3: unresolved link: '/posts/2.html'",
+        "linkcheck: posts/1.html:3:3: unresolved link: '../static/force.png'",
+    ]
+
+
+@pytest.mark.parametrize(
+    ["href"],
+    [
+        pytest.param("/posts/2.html", id="absolute"),
+        pytest.param("2.html", id="relative"),
+        pytest.param("../posts/2.html", id="relative-parent"),
+        pytest.param("https://yoda.ua/posts/2.html", id="absurl"),
+        pytest.param("/posts/2.html#force", id="fragment"),
+        pytest.param("/posts/2.html?force=1", id="query"),
+        pytest.param("#force", id="fragment-only"),
+        pytest.param("/posts/", id="index"),
+        pytest.param("/posts/index.html", id="index-html"),
+        pytest.param("/posts", id="index-no-slash"),
+        pytest.param("/posts/%D0%B9%D0%BE%D0%B4%D0%B0.html", id="quoted"),
+        pytest.param("/posts/йода.html", id="unquoted"),
+        pytest.param("https://google.com/", id="external"),
+        pytest.param("//google.com/", id="external-no-scheme"),
+        pytest.param("mailto:yoda@yoda.ua", id="mailto"),
+    ],
+)
+def test_item_resolved(testapp, caplog, href):
+    """Linkcheck processor has to resolve internal links only."""
+
+    stream = linkcheck.process(
+        testapp,
+        [
+            _createitem("posts/1.html", f'<a href="{href}">Link</a>'),
+            _createitem("posts/2.html"),
+            _createitem("posts/index.html"),
+            _createitem("posts/йода.html"),
+        ],
+    )
+
+    assert len(list(stream)) == 4
+    assert _messages(caplog) == []
+
+
+@pytest.mark.parametrize(
+    ["href"],
+    [
+        pytest.param("/blog/posts/2.html", id="absolute"),
+        pytest.param("2.html", id="relative"),
+        pytest.param("https://yoda.ua/blog/posts/2.html", id="absurl"),
+        pytest.param("/blog/posts/", id="index"),
+        pytest.param("/blog/posts/index.html", id="index-html"),
+        pytest.param("/blog/posts/йода.html", id="unquoted"),
+        pytest.param("/blog/", id="root"),
+    ],
+)
+def test_item_resolved_basepath(testapp, caplog, href):
+    """Linkcheck processor has to resolve links on a site under a path."""
+
+    baseurl = "https://yoda.ua/blog/"
+    stream = linkcheck.process(
+        testapp,
+        [
+            _createitem("posts/1.html", f'<a href="{href}">Link</a>', baseurl),
+            _createitem("posts/2.html", baseurl=baseurl),
+            _createitem("posts/index.html", baseurl=baseurl),
+            _createitem("posts/йода.html", baseurl=baseurl),
+            _createitem("index.html", baseurl=baseurl),
+        ],
+    )
+
+    assert len(list(stream)) == 5
+    assert _messages(caplog) == []
+
+
+def test_item_unresolved_basepath(testapp, caplog):
+    """Linkcheck processor has to report links outside of a site path."""
+
+    baseurl = "https://yoda.ua/blog/"
+    stream = linkcheck.process(
+        testapp,
+        [
+            _createitem(
+                "posts/1.html", '<a href="/posts/2.html">2</a>', baseurl
+            ),
+            _createitem("posts/2.html", baseurl=baseurl),
+        ],
+    )
+
+    assert len(list(stream)) == 2
+    assert _messages(caplog) == [
+        "linkcheck: posts/1.html:1:1: unresolved link: '/posts/2.html'",
+    ]
+
+
+def test_item_forward(testapp, caplog):
+    """Linkcheck processor has to resolve links to items that come later."""
+
+    stream = linkcheck.process(
+        testapp,
+        [
+            _createitem("1.html", '<a href="/2.html">2</a>'),
+            _createitem("2.html", '<link href="/3.css" rel="stylesheet">'),
+            _createitem("3.css", 'a { background: url("/4.png"); }'),
+        ],
+    )
+
+    assert len(list(stream)) == 3
+    assert _messages(caplog) == []
+
+
+def test_item_passed_first(testapp):
+    """Linkcheck processor has to pass items as soon as they come."""
+
+    def stream():
+        yield _createitem("1.html", '<a href="/2.html">2</a>')
+        raise AssertionError("must not be consumed")
+
+    assert next(linkcheck.process(testapp, stream())) == _createitem(
+        "1.html", '<a href="/2.html">2</a>'
+    )
+
+
+def test_args_fail(testapp, caplog):
+    """Linkcheck processor has to fail on unresolved links if asked."""
+
+    stream = linkcheck.process(
+        testapp,
+        [
+            _createitem("1.html", '<a href="/2.html">2</a>'),
+            _createitem("2.html", '<a href="/3.html">3</a>'),
+        ],
+        fail=True,
+    )
+
+    with pytest.raises(ValueError, match=r"^unresolved links: 1$"):
+        list(stream)
+    assert _messages(caplog) == [
+        "linkcheck: 2.html:1:1: unresolved link: '/3.html'",
+    ]
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param(
+            {"fail": 42},
+            "fail: 42 is not of type 'boolean'",
+            id="fail-int",
+        ),
+    ],
+)
+def test_args_bad_value(testapp, args, error):
+    """Linkcheck processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(linkcheck.process(testapp, [], **args))
+    assert str(excinfo.value) == error
@@ -9,7 +9,7 @@ import pathlib
 import pytest
 
 import holocron
-from holocron._processors import markdown
+from holocron._processors import markdown, when, _highlight
 
 
 class _pytest_regex:
@@ -534,6 +534,151 @@ def test_args_extensions(testapp, extensions, rendered):
     ]
 
 
+def test_args_cachedir(testapp, tmpdir):
+    """Markdown processor has to reuse highlighted code from cache."""
+
+    content = textwrap.dedent(
+        """\
+        test codeblock
+
+            :::python
+            lambda x: pass
+
+        ```python
+        lambda y: pass
+        ```
+        """
+    )
+
+    def convert():
+        stream = markdown.process(
+            testapp,
+            [
+                holocron.Item(
+                    {
+                        "content": content,
+                        "destination": pathlib.Path("1.md"),
+                    }
+                )
+            ],
+            cachedir=tmpdir.strpath,
+        )
+        return list(stream)
+
+    highlighter = _highlight.get_highlighter(tmpdir.strpath)
+    items = convert()
+
+    assert (highlighter.hits, highlighter.misses) == (0, 2)
+    assert convert() == items
+    assert (highlighter.hits, highlighter.misses) == (2, 2)
+    assert items == [
+        holocron.Item(
+            {
+                "content": _pytest_regex(
+                    r"<p>test codeblock</p>\s*.*highlight.*lambda.*x.*"
+                    r"highlight.*lambda.*y.*",
+                    re.DOTALL,
+                ),
+                "destination": pathlib.Path("1.html"),
+            }
+        )
+    ]
+
+
+def test_item_many_state_is_reset(testapp):
+    """Markdown processor has to convert items independently."""
+
+    stream = markdown.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "the Force[^1]\n\n[^1]: is strong",
+                    "destination": pathlib.Path("1.md"),
+                }
+            ),
+            holocron.Item(
+                {
+                    "content": "the key is **1**",
+                    "destination": pathlib.Path("2.md"),
+                }
+            ),
+        ],
+    )
+
+    items = list(stream)
+
+    assert "footnote" in items[0]["content"]
+    assert items[1]["content"] == "<p>the key is <strong>1</strong></p>"
+
+
+@pytest.mark.parametrize(
+    ["workers", "chunksize"],
+    [
+        pytest.param(1, 1, id="1-1"),
+        pytest.param(1, 64, id="1-64"),
+        pytest.param(2, 3, id="2-3"),
+    ],
+)
+def test_args_workers(testapp, workers, chunksize):
+    """Markdown processor has to convert items in worker processes."""
+
+    def createitems():
+        return [
+            holocron.Item(
+                {
+                    "content": "# the key %d\n\nthe key is **%d**[^1]\n\n"
+                    "[^1]: the footnote\n\n"
+                    "```python\nlambda x: %d\n```" % (i, i, i),
+                    "destination": pathlib.Path("%d.md" % i),
+                }
+            )
+            for i in range(20)
+        ]
+
+    stream = markdown.process(
+        testapp, createitems(), workers=workers, chunksize=chunksize
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+
+    items = list(stream)
+
+    assert items == list(markdown.process(testapp, createitems()))
+    assert [item["title"] for item in items] == [
+        "the key %d" % i for i in range(20)
+    ]
+
+
+def test_args_workers_when(testapp):
+    """Markdown processor has to keep items order under when processor."""
+
+    testapp.add_processor("markdown", markdown.process)
+
+    stream = when.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "the key is **%d**" % i,
+                    "destination": pathlib.Path("%d.md" % i),
+                }
+            )
+            for i in range(8)
+        ],
+        processor={
+            "name": "markdown",
+            "args": {"workers": 2, "chunksize": 1},
+        },
+        condition=["item.destination.stem | int is odd"],
+    )
+
+    assert [item["destination"] for item in stream] == [
+        pathlib.Path("%d.html" % i) if i % 2 else pathlib.Path("%d.md" % i)
+        for i in range(8)
+    ]
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -547,6 +692,16 @@ def test_args_extensions(testapp, extensions, rendered):
             r"extensions: 'a' does not match '^markdown\\.extensions\\..*'",
             id="extensions-dict",
         ),
+        pytest.param(
+            {"workers": "2"},
+            "workers: '2' is not valid under any of the given schemas",
+            id="workers-str",
+        ),
+        pytest.param(
+            {"chunksize": "2"},
+            "chunksize: '2' is not of type 'integer'",
+            id="chunksize-str",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
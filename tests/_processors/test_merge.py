@@ -0,0 +1,196 @@
+"""Merge processor test suite."""
+
+import collections.abc
+import multiprocessing
+import os
+import pathlib
+import re
+
+import pytest
+
+import holocron
+from holocron._processors import merge, shard
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    return holocron.Application({"url": "https://yoda.ua"})
+
+
+def _createitem(i):
+    return holocron.Item(source=pathlib.Path(f"{i}.md"), i=i)
+
+
+def _build_shards(app, path, items, shards):
+    for i in range(shards):
+        for _ in shard.process(
+            app, items(), pipe=[], shard=i, shards=shards, to=path
+        ):
+            pass
+
+
+def test_item(testapp, tmpdir):
+    """Merge processor has to restore the original stream."""
+
+    _build_shards(
+        testapp,
+        tmpdir.strpath,
+        lambda: [_createitem(i) for i in range(100)],
+        shards=4,
+    )
+
+    stream = merge.process(testapp, [holocron.Item(i=-1)], path=tmpdir.strpath)
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [holocron.Item(i=-1)] + [
+        _createitem(i) for i in range(100)
+    ]
+
+
+def test_item_missing_shards(testapp, tmpdir):
+    """Merge processor has to refuse to merge incomplete builds."""
+
+    _build_shards(
+        testapp,
+        tmpdir.strpath,
+        lambda: [_createitem(i) for i in range(10)],
+        shards=3,
+    )
+    tmpdir.join("1-of-3.items").remove()
+
+    with pytest.raises(ValueError, match=r"^missing shards: \[1\]$"):
+        next(merge.process(testapp, [], path=tmpdir.strpath))
+
+
+def test_item_many_builds(testapp, tmpdir):
+    """Merge processor has to refuse to merge shards of different builds."""
+
+    for shards in (2, 3):
+        _build_shards(
+            testapp,
+            tmpdir.strpath,
+            lambda: [_createitem(i) for i in range(10)],
+            shards=shards,
+        )
+
+    with pytest.raises(
+        ValueError, match=r"^expected shards of exactly one build: \[2, 3\]$"
+    ):
+        next(merge.process(testapp, [], path=tmpdir.strpath))
+
+
+def _site_pipes():
+    per_item = [
+        {"name": "frontmatter"},
+        {"name": "commonmark"},
+        {"name": "todatetime", "args": {"todatetime": "published"}},
+        {"name": "todatetime", "args": {"todatetime": "updated"}},
+        {"name": "prettyuri"},
+    ]
+    aggregates = [
+        {"name": "chain", "args": {"order_by": "published"}},
+        {"name": "archive", "when": ["item.source | match('posts/')"]},
+        {"name": "sitemap", "when": ["item.source | match('posts/')"]},
+        {
+            "name": "feed",
+            "when": ["item.source | match('posts/')"],
+            "args": {
+                "feed": {
+                    "id": "kenobi-way",
+                    "title": "Kenobi's Way",
+                    "link": {"href": "https://yoda.ua"},
+                    "description": "Labours of Obi-Wan",
+                },
+                "item": {
+                    "id": {"$ref": "item:#/absurl"},
+                    "title": {"$ref": "item:#/title"},
+                    "content": {"$ref": "item:#/content"},
+                    "link": {"href": {"$ref": "item:#/absurl"}},
+                    "published": {"$ref": "item:#/published"},
+                    "updated": {"$ref": "item:#/published"},
+                },
+            },
+        },
+        {"name": "jinja2", "when": ["item.source | match('posts/|archive:')"]},
+        {"name": "save"},
+    ]
+    source = [{"name": "source", "args": {"pattern": "posts/"}}]
+
+    return {
+        "single": source + per_item + aggregates,
+        "shard": source + [{"name": "shard", "args": {"pipe": per_item}}],
+        "merge": [{"name": "merge"}] + aggregates,
+    }
+
+
+def _run(workdir, pipe, metadata=None):
+    os.chdir(workdir)
+    app = holocron.create_app(
+        dict({"url": "https://yoda.ua"}, **(metadata or {})),
+        pipes=_site_pipes(),
+    )
+    for _ in app.invoke(pipe):
+        pass
+
+
+def _read_site(path):
+    site = {
+        str(filename.relative_to(path)): filename.read_bytes()
+        for filename in pathlib.Path(path).rglob("*")
+        if filename.is_file()
+    }
+
+    # Feeds carry time they are built at, and that's the only difference
+    # two builds are allowed to have.
+    site["feed.xml"] = re.sub(
+        rb"<updated>[^<]*</updated>", b"", site["feed.xml"], count=1
+    )
+    return site
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork is required to build shards in child processes",
+)
+def test_item_same_as_single_process(monkeypatch, tmpdir):
+    """Sharded build has to produce byte-identical output."""
+
+    monkeypatch.chdir(tmpdir)
+
+    single, sharded = tmpdir.mkdir("single"), tmpdir.mkdir("sharded")
+
+    for site in (single, sharded):
+        for i in range(30):
+            site.ensure("posts", f"{i}.md").write_text(
+                f"---\npublished: '2020-01-{i % 28 + 1:02d}'\n"
+                f"updated: '2020-02-{i % 28 + 1:02d}'\n---\n"
+                f"# Post {i}\n\nThe Force is strong with #{i}.\n",
+                encoding="UTF-8",
+            )
+
+    _run(single.strpath, "single")
+
+    # Shards are built by separate processes just like they would be built
+    # by separate hosts sharing a filesystem.
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(
+            target=_run,
+            args=(sharded.strpath, "shard", {"shard": i, "shards": 3}),
+        )
+        for i in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    _run(sharded.strpath, "merge")
+
+    assert sorted(sharded.join("_shards").listdir()) == [
+        sharded.join("_shards", f"{i}-of-3.items") for i in range(3)
+    ]
+    assert _read_site(sharded.join("_site").strpath) == _read_site(
+        single.join("_site").strpath
+    )
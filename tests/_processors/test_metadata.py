@@ -104,6 +104,19 @@ def test_args_overwrite(testapp, overwrite, author):
     ]
 
 
+def test_item_batches(testapp):
+    """Metadata processor has to process batches of items."""
+
+    stream = metadata.process(
+        testapp,
+        [holocron.Item({"a": i}) for i in range(3)],
+        metadata={"b": 3},
+    )
+    stream.batchsize = 2
+
+    assert list(stream) == [holocron.Item({"a": i, "b": 3}) for i in range(3)]
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -122,11 +122,31 @@ def test_item_many(testapp, amount):
     ]
 
 
+def test_args_pipe_graph(testapp):
+    """Pipe processor has to pass items through a pipe graph."""
+
+    stream = pipe.process(
+        testapp,
+        [holocron.Item({"content": "the Force"})],
+        pipe={
+            "a": {"pipe": [{"name": "spam"}]},
+            "b": {"after": "a", "pipe": [{"name": "eggs"}]},
+        },
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item({"content": "the Force #friedeggs", "spam": 42})
+    ]
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
         pytest.param(
-            {"pipe": 42}, "pipe: 42 is not of type 'array'", id="pipe-int"
+            {"pipe": 42},
+            "pipe: 42 is not valid under any of the given schemas",
+            id="pipe-int",
         )
     ],
 )
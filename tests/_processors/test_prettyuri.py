@@ -77,3 +77,23 @@ def test_item_many(testapp, amount):
         )
         for i in range(amount)
     ]
+
+
+def test_item_batches(testapp):
+    """Prettyuri processor has to process batches of items."""
+
+    stream = prettyuri.process(
+        testapp,
+        [
+            holocron.Item({"destination": pathlib.Path("a.html")}),
+            holocron.Item({"destination": pathlib.Path("index.html")}),
+            holocron.Item({"destination": pathlib.Path("b.html")}),
+        ],
+    )
+    stream.batchsize = 2
+
+    assert list(stream) == [
+        holocron.Item({"destination": pathlib.Path("a", "index.html")}),
+        holocron.Item({"destination": pathlib.Path("index.html")}),
+        holocron.Item({"destination": pathlib.Path("b", "index.html")}),
+    ]
@@ -8,7 +8,7 @@ import pathlib
 import pytest
 
 import holocron
-from holocron._processors import restructuredtext
+from holocron._processors import restructuredtext, _highlight
 
 
 class _pytest_regex:
@@ -240,6 +240,43 @@ def test_item_with_code(testapp):
     ]
 
 
+def test_item_with_code_cached(testapp, tmpdir):
+    """reStructuredText processor has to reuse highlighted code from cache."""
+
+    content = textwrap.dedent(
+        """\
+        test codeblock
+
+        .. code:: python
+           :number-lines:
+
+           lambda x: pass
+        """
+    )
+
+    def convert():
+        stream = restructuredtext.process(
+            testapp,
+            [
+                holocron.Item(
+                    {
+                        "content": content,
+                        "destination": pathlib.Path("1.rst"),
+                    }
+                )
+            ],
+            cachedir=tmpdir.strpath,
+        )
+        return list(stream)
+
+    highlighter = _highlight.get_highlighter(tmpdir.strpath)
+    items = convert()
+
+    assert (highlighter.hits, highlighter.misses) == (0, 1)
+    assert convert() == items
+    assert (highlighter.hits, highlighter.misses) == (1, 1)
+
+
 def test_item_with_inline_code(testapp):
     """reStructuredText processor has to use <code> tag for inline code."""
 
@@ -354,6 +391,69 @@ def test_item_many(testapp, amount):
     ]
 
 
+def test_item_many_state_is_reset(testapp, monkeypatch):
+    """reStructuredText processor has to convert items independently."""
+
+    get_settings = restructuredtext.Publisher.get_settings
+    calls = []
+
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return get_settings(*args, **kwargs)
+
+    monkeypatch.setattr(restructuredtext.Publisher, "get_settings", spy)
+
+    stream = restructuredtext.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "Yoda\n====\n\n.. _master:\n\nthe Force",
+                    "destination": pathlib.Path("1.rst"),
+                }
+            ),
+            holocron.Item(
+                {
+                    "content": "may the `master`_ be with you",
+                    "destination": pathlib.Path("2.rst"),
+                }
+            ),
+        ],
+    )
+
+    items = list(stream)
+
+    assert items[0]["title"] == "Yoda"
+    assert items[0]["content"] == '<p id="master">the Force</p>'
+    assert "title" not in items[1]
+    assert "Unknown target name" in items[1]["content"]
+    assert len(calls) == 1
+
+
+def test_item_directives_scoped(testapp):
+    """reStructuredText processor has to keep docutils directives intact."""
+
+    from docutils.parsers.rst import directives
+
+    stream = restructuredtext.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": ".. code:: python\n\n   lambda: 42",
+                    "destination": pathlib.Path("1.rst"),
+                }
+            )
+        ],
+    )
+
+    assert "lambda" in next(stream)["content"]
+
+    for name in ("code", "code-block", "sourcecode"):
+        directive = directives._directives.get(name)
+        assert directive is not restructuredtext._CodeBlock
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -1,6 +1,8 @@
 """Save processor test suite."""
 
 import collections.abc
+import gzip
+import os
 import pathlib
 
 import py
@@ -210,6 +212,110 @@ def test_args_to(testapp, monkeypatch, tmpdir, to):
     assert tmpdir.join(to, "1.html").read_text("UTF-8") == "Obi-Wan"
 
 
+def test_args_gzip(testapp, monkeypatch, tmpdir):
+    """Save processor has to save compressed siblings of text files."""
+
+    monkeypatch.chdir(tmpdir)
+
+    stream = save.process(
+        testapp,
+        [
+            holocron.Item(
+                {"content": "Obi-Wan" * 200, "destination": pathlib.Path(n)}
+            )
+            for n in ("1.html", "2.css", "3.png")
+        ]
+        + [
+            holocron.Item(
+                {"content": "Obi-Wan", "destination": pathlib.Path("4.html")}
+            )
+        ],
+        gzip=True,
+    )
+
+    assert len(list(stream)) == 4
+    assert sorted(os.listdir(tmpdir.join("_site"))) == [
+        "1.html",
+        "1.html.gz",
+        "2.css",
+        "2.css.gz",
+        "3.png",
+        "4.html",
+    ]
+
+    for name in ("1.html.gz", "2.css.gz"):
+        compressed = tmpdir.join("_site", name).read_binary()
+        assert gzip.decompress(compressed) == b"Obi-Wan" * 200
+
+
+def test_args_gzip_uptodate(testapp, monkeypatch, tmpdir):
+    """Save processor has to skip compressed siblings that are up to date."""
+
+    monkeypatch.chdir(tmpdir)
+
+    def run(content):
+        stream = save.process(
+            testapp,
+            [
+                holocron.Item(
+                    {"content": content, "destination": pathlib.Path("1.html")}
+                )
+            ],
+            gzip=True,
+            gzip_min_size=4,
+        )
+        for _ in stream:
+            pass
+
+    compressed = tmpdir.join("_site", "1.html.gz")
+
+    run("Obi-Wan")
+    os.utime(compressed.strpath, ns=(0, 0))
+
+    run("Obi-Wan")
+    assert os.stat(compressed.strpath).st_mtime_ns == 0
+
+    run("Kenobi")
+    assert gzip.decompress(compressed.read_binary()) == b"Kenobi"
+
+    run("Obi")
+    assert not compressed.check()
+
+
+@pytest.mark.parametrize(
+    ["gzip_suffixes", "gzip_min_size", "compressed"],
+    [
+        pytest.param([".txt"], 0, ["1.txt.gz"], id="suffixes"),
+        pytest.param([".txt", ".dat"], 3, ["1.txt.gz"], id="min_size"),
+        pytest.param([".txt", ".dat"], 0, ["1.txt.gz", "2.dat.gz"], id="all"),
+    ],
+)
+def test_args_gzip_filters(
+    testapp, monkeypatch, tmpdir, gzip_suffixes, gzip_min_size, compressed
+):
+    """Save processor has to respect 'gzip_*' arguments."""
+
+    monkeypatch.chdir(tmpdir)
+
+    stream = save.process(
+        testapp,
+        [
+            holocron.Item({"content": c, "destination": pathlib.Path(n)})
+            for c, n in (("abc", "1.txt"), ("ab", "2.dat"))
+        ],
+        gzip=True,
+        gzip_min_size=gzip_min_size,
+        gzip_suffixes=gzip_suffixes,
+    )
+
+    assert len(list(stream)) == 2
+    assert sorted(
+        name
+        for name in os.listdir(tmpdir.join("_site"))
+        if name.endswith(".gz")
+    ) == sorted(compressed)
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -239,6 +345,16 @@ def test_args_to(testapp, monkeypatch, tmpdir, to):
             "encoding: {'y': 2} is not of type 'string'",
             id="encoding-dict",
         ),
+        pytest.param(
+            {"gzip": 42},
+            "gzip: 42 is not of type 'boolean'",
+            id="gzip-int",
+        ),
+        pytest.param(
+            {"gzip_min_size": -1},
+            "gzip_min_size: -1 is less than the minimum of 0",
+            id="gzip_min_size-negative",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
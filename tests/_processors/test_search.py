@@ -0,0 +1,291 @@
+"""Search processor test suite."""
+
+import collections.abc
+import json
+import pathlib
+
+import pytest
+
+import holocron
+from holocron._processors import search
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    return holocron.Application({"url": "https://yoda.ua"})
+
+
+def _createitem(name, content, title=None):
+    item = holocron.WebSiteItem(
+        {
+            "destination": pathlib.Path(name),
+            "baseurl": "https://yoda.ua",
+            "content": content,
+        }
+    )
+    if title is not None:
+        item["title"] = title
+    return item
+
+
+def _lookup(items, term):
+    # That's what a browser does: find the shard by term's prefix, fetch it
+    # and decode postings.
+    *shards, manifest = items
+    manifest = json.loads(manifest["content"])
+    shards = {shard["url"]: json.loads(shard["content"]) for shard in shards}
+
+    prefix = manifest["prefix"]
+    url = manifest["shards"].get(term[:prefix])
+    postings = shards[url].get(term, []) if url else []
+
+    found, document = [], 0
+    for i in range(0, len(postings), 2):
+        document += postings[i]
+        found.append((manifest["documents"][document][0], postings[i + 1]))
+    return found
+
+
+def test_item(testapp):
+    """Search processor has to work!"""
+
+    stream = search.process(
+        testapp, [_createitem("1.html", "<p>Obi-Wan</p>", "The Force")]
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        _createitem("1.html", "<p>Obi-Wan</p>", "The Force"),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("search://search/fo.json"),
+                "destination": pathlib.Path("search/fo.json"),
+                "content": '{"force":[0,1]}',
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("search://search/ob.json"),
+                "destination": pathlib.Path("search/ob.json"),
+                "content": '{"obi":[0,1]}',
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("search://search/th.json"),
+                "destination": pathlib.Path("search/th.json"),
+                "content": '{"the":[0,1]}',
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("search://search/wa.json"),
+                "destination": pathlib.Path("search/wa.json"),
+                "content": '{"wan":[0,1]}',
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("search://search/index.json"),
+                "destination": pathlib.Path("search/index.json"),
+                "content": json.dumps(
+                    {
+                        "documents": [["/1.html", "The Force"]],
+                        "prefix": 2,
+                        "shards": {
+                            "fo": "/search/fo.json",
+                            "ob": "/search/ob.json",
+                            "th": "/search/th.json",
+                            "wa": "/search/wa.json",
+                        },
+                    },
+                    separators=(",", ":"),
+                ),
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+    ]
+
+
+def test_item_many(testapp):
+    """Search processor has to index term frequencies of many items."""
+
+    stream = search.process(
+        testapp,
+        [
+            _createitem("1.html", "<p>Luke, I am your father.</p>"),
+            _createitem("2.html", "<p>No. No. That's not true!</p>"),
+            _createitem("3.html", "Search your feelings, Luke.", "Luke"),
+        ],
+    )
+
+    items = list(stream)[3:]
+
+    assert _lookup(items, "luke") == [("/1.html", 1), ("/3.html", 2)]
+    assert _lookup(items, "no") == [("/2.html", 2)]
+    assert _lookup(items, "your") == [("/1.html", 1), ("/3.html", 1)]
+    assert _lookup(items, "yoda") == []
+
+
+def test_item_html_stripped(testapp):
+    """Search processor has to index text of HTML only."""
+
+    stream = search.process(
+        testapp,
+        [
+            _createitem(
+                "1.html",
+                '<div class="jedi"><script>var force = 1;</script>'
+                "<style>.sith { color: red; }</style>"
+                "<a href='/yoda.html'>Yoda&nbsp;Master</a></div>",
+            )
+        ],
+    )
+
+    items = list(stream)[1:]
+
+    assert _lookup(items, "yoda") == [("/1.html", 1)]
+    assert _lookup(items, "master") == [("/1.html", 1)]
+    assert _lookup(items, "jedi") == []
+    assert _lookup(items, "force") == []
+    assert _lookup(items, "sith") == []
+
+
+def test_item_not_indexed(testapp):
+    """Search processor has to skip items with no textual content."""
+
+    stream = search.process(
+        testapp,
+        [
+            _createitem("1.png", b"\x89PNG"),
+            holocron.Item({"content": "Obi-Wan"}),
+        ],
+    )
+
+    *_, manifest = stream
+
+    assert json.loads(manifest["content"]) == {
+        "documents": [],
+        "prefix": 2,
+        "shards": {},
+    }
+
+
+def test_item_not_html(testapp):
+    """Search processor has to index only web pages."""
+
+    stream = search.process(
+        testapp,
+        [
+            _createitem("1.html", "<p>Obi-Wan</p>"),
+            _createitem("style.css", "body { color: obi; }"),
+            _createitem("logo.svg", "<svg><text>Obi-Wan</text></svg>"),
+        ],
+    )
+
+    items = list(stream)[3:]
+
+    assert json.loads(items[-1]["content"])["documents"] == [["/1.html", None]]
+    assert _lookup(items, "obi") == [("/1.html", 1)]
+
+
+def test_item_passed_first(testapp):
+    """Search processor has to pass items as soon as they come."""
+
+    def stream():
+        yield _createitem("1.html", "Obi-Wan")
+        raise AssertionError("must not be consumed")
+
+    assert next(search.process(testapp, stream())) == _createitem(
+        "1.html", "Obi-Wan"
+    )
+
+
+def test_args_prefix(testapp):
+    """Search processor has to respect 'prefix' argument."""
+
+    stream = search.process(
+        testapp, [_createitem("1.html", "Obi-Wan Kenobi")], prefix=1
+    )
+
+    assert [item["url"] for item in list(stream)[1:]] == [
+        "/search/k.json",
+        "/search/o.json",
+        "/search/w.json",
+        "/search/index.json",
+    ]
+
+
+def test_args_save_as(testapp):
+    """Search processor has to respect 'save_as' & 'shards_as' arguments."""
+
+    stream = search.process(
+        testapp,
+        [_createitem("1.html", "Obi-Wan")],
+        save_as="search.json",
+        shards_as="search/{prefix}/shard.json",
+    )
+
+    items = list(stream)[1:]
+
+    assert [item["url"] for item in items] == [
+        "/search/ob/shard.json",
+        "/search/wa/shard.json",
+        "/search.json",
+    ]
+    assert _lookup(items, "obi") == [("/1.html", 1)]
+
+
+def test_args_suffixes(testapp):
+    """Search processor has to respect 'suffixes' argument."""
+
+    stream = search.process(
+        testapp,
+        [
+            _createitem("1.html", "<p>Obi-Wan</p>"),
+            _createitem("2.txt", "Obi-Wan Kenobi"),
+        ],
+        suffixes=[".txt"],
+    )
+
+    items = list(stream)[2:]
+
+    assert _lookup(items, "obi") == [("/2.txt", 1)]
+    assert _lookup(items, "kenobi") == [("/2.txt", 1)]
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param(
+            {"prefix": 0},
+            "prefix: 0 is less than or equal to the minimum of 0",
+            id="prefix-zero",
+        ),
+        pytest.param(
+            {"save_as": 42},
+            "save_as: 42 is not of type 'string'",
+            id="save_as-int",
+        ),
+        pytest.param(
+            {"shards_as": 42},
+            "shards_as: 42 is not of type 'string'",
+            id="shards_as-int",
+        ),
+        pytest.param(
+            {"suffixes": ".html"},
+            "suffixes: '.html' is not of type 'array'",
+            id="suffixes-str",
+        ),
+    ],
+)
+def test_args_bad_value(testapp, args, error):
+    """Search processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(search.process(testapp, [], **args))
+    assert str(excinfo.value) == error
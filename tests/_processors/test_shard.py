@@ -0,0 +1,166 @@
+"""Shard processor test suite."""
+
+import collections.abc
+import pathlib
+
+import pytest
+
+import holocron
+from holocron._processors import shard
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    def spam(app, items):
+        for item in items:
+            item["spam"] = True
+            yield item
+        yield holocron.Item(source=pathlib.Path("spam://"))
+
+    instance = holocron.Application()
+    instance.add_processor("spam", spam)
+    return instance
+
+
+def _createitem(i):
+    return holocron.Item(source=pathlib.Path(f"{i}.md"), i=i)
+
+
+def test_item(testapp, tmpdir):
+    """Shard processor has to pick items of a shard and save them."""
+
+    stream = shard.process(
+        testapp,
+        [_createitem(i) for i in range(3)],
+        pipe=[],
+        shard=0,
+        shards=1,
+        to=tmpdir.strpath,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [_createitem(i) for i in range(3)]
+    assert tmpdir.join("0-of-1.items").check(file=1)
+    assert not tmpdir.join("0-of-1.items.tmp").check()
+
+
+@pytest.mark.parametrize(
+    ["shards"],
+    [
+        pytest.param(2, id="2"),
+        pytest.param(3, id="3"),
+        pytest.param(8, id="8"),
+    ],
+)
+def test_item_partitioned(testapp, tmpdir, shards):
+    """Every item has to belong to exactly one shard."""
+
+    built = [
+        list(
+            shard.process(
+                testapp,
+                [_createitem(i) for i in range(100)],
+                pipe=[],
+                shard=i,
+                shards=shards,
+                to=tmpdir.strpath,
+            )
+        )
+        for i in range(shards)
+    ]
+
+    assert sorted(item["i"] for items in built for item in items) == list(
+        range(100)
+    )
+    assert all(built)
+
+
+def test_item_pipe(testapp, tmpdir):
+    """Items of a shard have to be passed through a pipe."""
+
+    stream = shard.process(
+        testapp,
+        [_createitem(i) for i in range(3)],
+        pipe=[{"name": "spam"}],
+        to=tmpdir.strpath,
+    )
+
+    assert list(stream) == [
+        holocron.Item(source=pathlib.Path(f"{i}.md"), i=i, spam=True)
+        for i in range(3)
+    ] + [holocron.Item(source=pathlib.Path("spam://"))]
+
+
+def test_item_generated(testapp, tmpdir):
+    """Items that are produced by every shard have to be kept by one."""
+
+    built = [
+        list(
+            shard.process(
+                testapp,
+                [_createitem(i) for i in range(10)],
+                pipe=[{"name": "spam"}],
+                shard=i,
+                shards=2,
+                to=tmpdir.strpath,
+            )
+        )
+        for i in range(2)
+    ]
+
+    assert built[0][-1] == holocron.Item(source=pathlib.Path("spam://"))
+    assert "spam://" not in {str(item["source"]) for item in built[1]}
+
+
+def test_args_from_metadata(testapp, tmpdir):
+    """Shard processor has to respect metadata fallback."""
+
+    testapp.metadata.update({"shard": 1, "shards": 2})
+
+    items = list(
+        shard.process(
+            testapp,
+            [_createitem(i) for i in range(10)],
+            pipe=[],
+            to=tmpdir.strpath,
+        )
+    )
+
+    assert 0 < len(items) < 10
+    assert tmpdir.join("1-of-2.items").check(file=1)
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param(
+            {"pipe": 42}, "pipe: 42 is not of type 'array'", id="pipe-int"
+        ),
+        pytest.param(
+            {"pipe": [], "shard": -1},
+            "shard: -1 is less than the minimum of 0",
+            id="shard-negative",
+        ),
+        pytest.param(
+            {"pipe": [], "shards": 0},
+            "shards: 0 is less than the minimum of 1",
+            id="shards-zero",
+        ),
+        pytest.param(
+            {"pipe": [], "shard": 2, "shards": 2},
+            "shard must be less than 2: 2",
+            id="shard-out-of-range",
+        ),
+        pytest.param(
+            {"pipe": [], "key": 42},
+            "key: 42 is not of type 'string'",
+            id="key-int",
+        ),
+    ],
+)
+def test_args_bad_value(testapp, tmpdir, args, error):
+    """Shard processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(shard.process(testapp, [], to=tmpdir.strpath, **args))
+    assert str(excinfo.value) == error
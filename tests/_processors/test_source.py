@@ -397,6 +397,34 @@ def test_args_timezone_in_action(testapp, monkeypatch, tmpdir):
     assert created_kie.isoformat().split("+")[-1] in ("02:00", "03:00")
 
 
+def test_item_scan_shared(testapp, monkeypatch, tmpdir):
+    """Source processor has to reuse scans until directories change."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("about", "cv.pdf").write_text("Obi-Wan", encoding="UTF-8")
+
+    scandir = unittest.mock.Mock(wraps=source.os.scandir)
+    monkeypatch.setattr(source.os, "scandir", scandir)
+
+    assert [item["source"] for item in source.process(testapp, [])] == [
+        pathlib.Path("about", "cv.pdf")
+    ]
+    assert scandir.call_count == 2
+
+    assert [item["source"] for item in source.process(testapp, [])] == [
+        pathlib.Path("about", "cv.pdf")
+    ]
+    assert scandir.call_count == 2
+
+    tmpdir.ensure("about", "photo.png").write_text("", encoding="UTF-8")
+
+    assert sorted(item["source"] for item in source.process(testapp, [])) == [
+        pathlib.Path("about", "cv.pdf"),
+        pathlib.Path("about", "photo.png"),
+    ]
+    assert scandir.call_count == 4
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -0,0 +1,350 @@
+"""Taxonomy processor test suite."""
+
+import collections.abc
+import datetime
+import pathlib
+
+import pytest
+
+import holocron
+from holocron._processors import aggregate, taxonomy
+
+
+@pytest.fixture(scope="function")
+def testapp():
+    instance = holocron.Application({"url": "https://yoda.ua"})
+    instance.add_processor("taxonomy", taxonomy.process)
+    return instance
+
+
+def _createitem(i, tags):
+    return holocron.Item(
+        {
+            "title": f"The Force (part #{i})",
+            "content": "Obi-Wan",
+            "published": datetime.datetime(2000 + i, 1, 1),
+            "tags": tags,
+        }
+    )
+
+
+def test_item(testapp):
+    """Taxonomy processor has to work!"""
+
+    stream = taxonomy.process(
+        testapp, [holocron.Item({"title": "The Force", "tags": ["jedi"]})]
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item({"title": "The Force", "tags": ["jedi"]}),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("taxonomy://tags/jedi/index.html"),
+                "destination": pathlib.Path("tags/jedi/index.html"),
+                "template": "archive.j2",
+                "items": [holocron.Item({"title": "The Force"})],
+                "groups": [(None, [holocron.Item({"title": "The Force"})])],
+                "title": "jedi",
+                "term": "jedi",
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+        holocron.WebSiteItem(
+            {
+                "source": pathlib.Path("taxonomy://tags/index.html"),
+                "destination": pathlib.Path("tags/index.html"),
+                "template": "terms.j2",
+                "terms": [
+                    {"term": "jedi", "count": 1, "url": "/tags/jedi/"},
+                ],
+                "baseurl": testapp.metadata["url"],
+            }
+        ),
+    ]
+
+
+def test_item_many(testapp):
+    """Taxonomy processor has to classify items by terms in one pass."""
+
+    stream = taxonomy.process(
+        testapp,
+        [
+            _createitem(0, ["jedi", "sith"]),
+            _createitem(1, ["jedi"]),
+            _createitem(2, []),
+            _createitem(3, ["sith", "jedi", "sith"]),
+            holocron.Item({"title": "The Force"}),
+        ],
+    )
+
+    items = list(stream)
+
+    assert items[:5] == [
+        _createitem(0, ["jedi", "sith"]),
+        _createitem(1, ["jedi"]),
+        _createitem(2, []),
+        _createitem(3, ["sith", "jedi", "sith"]),
+        holocron.Item({"title": "The Force"}),
+    ]
+    assert [
+        (page["term"], [item["published"].year for item in page["items"]])
+        for page in items[5:-1]
+    ] == [
+        ("jedi", [2003, 2001, 2000]),
+        ("sith", [2003, 2000]),
+    ]
+    assert items[-1]["terms"] == [
+        {"term": "jedi", "count": 3, "url": "/tags/jedi/"},
+        {"term": "sith", "count": 2, "url": "/tags/sith/"},
+    ]
+
+
+def test_item_passed_first(testapp):
+    """Taxonomy processor has to pass items as soon as they come."""
+
+    def stream():
+        yield _createitem(0, ["jedi"])
+        raise AssertionError("must not be consumed")
+
+    assert next(taxonomy.process(testapp, stream())) == _createitem(
+        0, ["jedi"]
+    )
+
+
+def test_item_str(testapp):
+    """Taxonomy processor has to treat a string as a single term."""
+
+    stream = taxonomy.process(testapp, [_createitem(0, "jedi")])
+
+    *_, terms = stream
+
+    assert terms["terms"] == [
+        {"term": "jedi", "count": 1, "url": "/tags/jedi/"},
+    ]
+
+
+def test_item_mixed_types(testapp):
+    """Taxonomy processor has to treat terms of any type as text."""
+
+    stream = taxonomy.process(
+        testapp,
+        [_createitem(0, [2019, "python"]), _createitem(1, ["2019"])],
+    )
+
+    *_, terms = stream
+
+    assert terms["terms"] == [
+        {"term": "2019", "count": 2, "url": "/tags/2019/"},
+        {"term": "python", "count": 1, "url": "/tags/python/"},
+    ]
+
+
+def test_item_slugified(testapp):
+    """Taxonomy processor has to make terms safe to be used in paths."""
+
+    stream = taxonomy.process(
+        testapp,
+        [
+            _createitem(0, ["C/C++", "c", "../..", "Йода Master"]),
+        ],
+    )
+
+    *pages, terms = list(stream)[1:]
+
+    assert [page["destination"] for page in pages] == [
+        pathlib.Path("tags", "term", "index.html"),
+        pathlib.Path("tags", "c-c", "index.html"),
+        pathlib.Path("tags", "c", "index.html"),
+        pathlib.Path("tags", "йода-master", "index.html"),
+    ]
+    assert terms["terms"] == [
+        {"term": "../..", "count": 1, "url": "/tags/term/"},
+        {"term": "C/C++", "count": 1, "url": "/tags/c-c/"},
+        {"term": "c", "count": 1, "url": "/tags/c/"},
+        {
+            "term": "Йода Master",
+            "count": 1,
+            "url": "/tags/%D0%B9%D0%BE%D0%B4%D0%B0-master/",
+        },
+    ]
+
+
+def test_item_slugified_clash(testapp):
+    """Taxonomy processor has to tell apart terms with the same slug."""
+
+    stream = taxonomy.process(testapp, [_createitem(0, ["C++", "C#", "c"])])
+
+    *_, terms = stream
+
+    assert terms["terms"] == [
+        {"term": "C#", "count": 1, "url": "/tags/c/"},
+        {"term": "C++", "count": 1, "url": "/tags/c-2/"},
+        {"term": "c", "count": 1, "url": "/tags/c-3/"},
+    ]
+
+
+def test_args_key(testapp):
+    """Taxonomy processor has to respect 'key' argument."""
+
+    stream = taxonomy.process(
+        testapp,
+        [holocron.Item({"title": "The Force", "category": ["jedi"]})],
+        key="category",
+        save_as="categories/{term}.html",
+        terms_save_as="categories.html",
+    )
+
+    assert [item["url"] for item in list(stream)[1:]] == [
+        "/categories/jedi.html",
+        "/categories.html",
+    ]
+
+
+@pytest.mark.parametrize(
+    ["fields", "projected"],
+    [
+        pytest.param(
+            ["title"],
+            holocron.Item({"title": "The Force (part #0)"}),
+            id="title",
+        ),
+        pytest.param(None, _createitem(0, ["jedi"]), id="null"),
+    ],
+)
+def test_args_fields(testapp, fields, projected):
+    """Taxonomy processor has to respect 'fields' argument."""
+
+    stream = taxonomy.process(
+        testapp, [_createitem(0, ["jedi"])], fields=fields
+    )
+
+    _, page, _ = stream
+
+    assert page["items"] == [projected]
+
+
+def test_args_template(testapp):
+    """Taxonomy processor has to respect templates arguments."""
+
+    stream = taxonomy.process(
+        testapp,
+        [_createitem(0, ["jedi"])],
+        template="tag.j2",
+        terms_template="tags.j2",
+    )
+
+    assert [item["template"] for item in list(stream)[1:]] == [
+        "tag.j2",
+        "tags.j2",
+    ]
+
+
+def test_args_terms_save_as_null(testapp):
+    """Taxonomy processor has to skip terms page if asked."""
+
+    stream = taxonomy.process(
+        testapp, [_createitem(0, ["jedi"])], terms_save_as=None
+    )
+
+    assert [item["url"] for item in list(stream)[1:]] == ["/tags/jedi/"]
+
+
+@pytest.mark.parametrize(
+    ["paginate_as", "urls"],
+    [
+        pytest.param(
+            None,
+            [
+                "/tags/jedi/",
+                "/tags/jedi/page/2/",
+                "/tags/jedi/page/3/",
+                "/tags/sith/",
+            ],
+            id="default",
+        ),
+        pytest.param(
+            "tags/{term}/{page}.html",
+            [
+                "/tags/jedi/",
+                "/tags/jedi/2.html",
+                "/tags/jedi/3.html",
+                "/tags/sith/",
+            ],
+            id="custom",
+        ),
+    ],
+)
+def test_args_paginate(testapp, paginate_as, urls):
+    """Taxonomy processor has to paginate pages of each term."""
+
+    stream = taxonomy.process(
+        testapp,
+        [
+            _createitem(0, ["jedi"]),
+            _createitem(1, ["jedi", "sith"]),
+            _createitem(2, ["jedi"]),
+        ],
+        paginate=1,
+        paginate_as=paginate_as,
+    )
+
+    pages = list(stream)[3:-1]
+
+    assert [page["url"] for page in pages] == urls
+    assert [page["pagination"] for page in pages] == [
+        {"page": 1, "pages": 3, "prev": None, "next": urls[1]},
+        {"page": 2, "pages": 3, "prev": urls[0], "next": urls[2]},
+        {"page": 3, "pages": 3, "prev": urls[1], "next": None},
+        {"page": 1, "pages": 1, "prev": None, "next": None},
+    ]
+
+
+def test_item_aggregated(testapp):
+    """Taxonomy processor has to receive terms when aggregated."""
+
+    stream = aggregate.process(
+        testapp,
+        [_createitem(0, ["jedi"])],
+        aggregators=[{"name": "taxonomy", "args": {"fields": ["title"]}}],
+    )
+
+    _, page, terms = stream
+
+    assert page["items"] == [holocron.Item({"title": "The Force (part #0)"})]
+    assert terms["terms"] == [
+        {"term": "jedi", "count": 1, "url": "/tags/jedi/"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ["args", "error"],
+    [
+        pytest.param(
+            {"key": 42},
+            "key: 42 is not of type 'string'",
+            id="key-int",
+        ),
+        pytest.param(
+            {"save_as": 42},
+            "save_as: 42 is not of type 'string'",
+            id="save_as-int",
+        ),
+        pytest.param(
+            {"paginate": 0},
+            "paginate: 0 is less than or equal to the minimum of 0",
+            id="paginate-zero",
+        ),
+        pytest.param(
+            {"terms_save_as": 42},
+            "terms_save_as: 42 is not of type 'string', 'null'",
+            id="terms_save_as-int",
+        ),
+    ],
+)
+def test_args_bad_value(testapp, args, error):
+    """Taxonomy processor has to validate input arguments."""
+
+    with pytest.raises(ValueError) as excinfo:
+        next(taxonomy.process(testapp, [], **args))
+    assert str(excinfo.value) == error
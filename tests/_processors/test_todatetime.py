@@ -2,6 +2,7 @@
 
 import collections.abc
 import datetime
+import logging
 import pathlib
 
 import pytest
@@ -456,6 +457,108 @@ def test_args_timezone_fallback(testapp, tz):
     ]
 
 
+@pytest.mark.parametrize(
+    ["timestamp", "format", "parsed"],
+    [
+        pytest.param(
+            "15.01.2019 21:07",
+            "%d.%m.%Y %H:%M",
+            datetime.datetime(2019, 1, 15, 21, 7, tzinfo=_TZ_UTC),
+            id="format",
+        ),
+        pytest.param(
+            "2019-01-15T21:07:07+02:00",
+            "%d.%m.%Y %H:%M",
+            datetime.datetime(2019, 1, 15, 21, 7, 7, tzinfo=_TZ_EET),
+            id="fallback",
+        ),
+    ],
+)
+def test_args_format(testapp, timestamp, format, parsed):
+    """Todatetime processor has to respect "format" argument."""
+
+    stream = todatetime.process(
+        testapp,
+        [
+            holocron.Item(
+                {
+                    "content": "the Force is strong with this one",
+                    "timestamp": timestamp,
+                }
+            )
+        ],
+        todatetime="timestamp",
+        format=format,
+    )
+
+    assert isinstance(stream, collections.abc.Iterable)
+    assert list(stream) == [
+        holocron.Item(
+            {
+                "content": "the Force is strong with this one",
+                "timestamp": parsed,
+            }
+        )
+    ]
+
+
+def test_item_parsed_once(testapp, caplog):
+    """Todatetime processor has to parse repeated timestamps once."""
+
+    caplog.set_level(logging.DEBUG, logger="holocron")
+
+    stream = todatetime.process(
+        testapp,
+        [
+            holocron.Item({"timestamp": timestamp})
+            for timestamp in [
+                "15.01.2019",
+                "2019-01-15",
+                "January 15, 2019",
+                "2019-01-15",
+                "15.01.2019",
+            ]
+        ],
+        todatetime="timestamp",
+        format="%d.%m.%Y",
+    )
+
+    items = list(stream)
+
+    parsed = datetime.datetime(2019, 1, 15, tzinfo=_TZ_UTC)
+
+    assert items == [holocron.Item({"timestamp": parsed})] * 5
+    assert items[1]["timestamp"] is items[3]["timestamp"]
+    assert caplog.messages == [
+        "todatetime: 2 cached, 1 format, 1 isoformat, 1 dateutil"
+    ]
+
+
+def test_item_batches(testapp):
+    """Todatetime processor has to process batches of items."""
+
+    stream = todatetime.process(
+        testapp,
+        [
+            holocron.Item({"timestamp": "2019-01-15"}),
+            holocron.Item({"content": "the Force"}),
+            holocron.Item({"timestamp": "2019-01-16"}),
+        ],
+        todatetime="timestamp",
+    )
+    stream.batchsize = 2
+
+    assert list(stream) == [
+        holocron.Item(
+            {"timestamp": datetime.datetime(2019, 1, 15, tzinfo=_TZ_UTC)}
+        ),
+        holocron.Item({"content": "the Force"}),
+        holocron.Item(
+            {"timestamp": datetime.datetime(2019, 1, 16, tzinfo=_TZ_UTC)}
+        ),
+    ]
+
+
 @pytest.mark.parametrize(
     ["args", "error"],
     [
@@ -477,6 +580,11 @@ def test_args_timezone_fallback(testapp, tz):
         pytest.param(
             {"fuzzy": 42}, "fuzzy: 42 is not of type 'boolean'", id="fuzzy-int"
         ),
+        pytest.param(
+            {"format": 42},
+            "format: 42 is not of type 'string'",
+            id="format-int",
+        ),
     ],
 )
 def test_args_bad_value(testapp, args, error):
@@ -7,7 +7,7 @@ import pathlib
 import pytest
 
 import holocron
-from holocron._processors import when
+from holocron._processors import metadata, when
 
 
 @pytest.fixture(scope="function")
@@ -31,10 +31,15 @@ def testapp(request):
             else:
                 yield holocron.Item({"key": item_a["key"] + item_b["key"]})
 
+    def ahead(app, items):
+        yield from list(items)
+
     instance = holocron.Application()
     instance.add_processor("spam", spam)
     instance.add_processor("rice", rice)
     instance.add_processor("eggs", eggs)
+    instance.add_processor("ahead", ahead)
+    instance.add_processor("metadata", metadata.process)
     return instance
 
 
@@ -156,6 +161,45 @@ def test_item_many_eggs(testapp):
     ]
 
 
+def test_item_many_ahead(testapp):
+    """When processor has to preserve order if processor looks ahead."""
+
+    stream = when.process(
+        testapp,
+        [holocron.Item({"key": i}) for i in range(8)],
+        processor={"name": "ahead"},
+        condition=["item.key % 2 != 0"],
+    )
+
+    assert list(stream) == [holocron.Item({"key": i}) for i in range(8)]
+
+
+@pytest.mark.parametrize(
+    ["app_metadata"],
+    [
+        pytest.param({}, id="default"),
+        pytest.param({"batchsize": 3}, id="batchsize"),
+        pytest.param({"workers": 2, "batchsize": 1}, id="workers"),
+    ],
+)
+def test_item_many_itemmap(testapp, app_metadata):
+    """When processor has to preserve order of mapped items."""
+
+    testapp.metadata.update(app_metadata)
+
+    stream = when.process(
+        testapp,
+        [holocron.Item({"key": i}) for i in range(8)],
+        processor={"name": "metadata", "args": {"metadata": {"odd": True}}},
+        condition=["item.key % 2 != 0"],
+    )
+
+    assert list(stream) == [
+        holocron.Item({"key": i, "odd": True} if i % 2 else {"key": i})
+        for i in range(8)
+    ]
+
+
 @pytest.mark.parametrize(
     ["cond"],
     [
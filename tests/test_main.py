@@ -1,16 +1,34 @@
 """Tests Holocron CLI."""
 
+import io
 import logging
+import os
 import pathlib
+import re
 import subprocess
 import sys
 import textwrap
+import threading
+import time
 
 import mock
 import pytest
 import yaml
 
 
+class _pytest_regex:
+    """Assert that a given string meets some expectations."""
+
+    def __init__(self, pattern, flags=0):
+        self._regex = re.compile(pattern, flags)
+
+    def __eq__(self, actual):
+        return bool(self._regex.match(actual))
+
+    def __repr__(self):
+        return self._regex.pattern
+
+
 @pytest.fixture(autouse=True)
 def _fake_root_logger(monkeypatch):
     """Prevent modifying global root instance."""
@@ -210,3 +228,534 @@ def test_run_conf_yml_interpolate_in_path(
     execute(["-c", tmpdir.join(".holocron.yml").strpath, "run", "test"])
 
     assert tmpdir.join("_compiled", "cv.md").read_binary() == b"yoda"
+
+
+def test_run_progress(monkeypatch, tmpdir, execute, example_site):
+    """Progress line is shown instead of built items."""
+
+    monkeypatch.chdir(tmpdir)
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        assert execute(["run", "test", "--progress"], False) == ""
+
+    assert stderr.getvalue().endswith("\n")
+    assert stderr.getvalue().splitlines()[-1].split("\r")[-1] == _pytest_regex(
+        r"\[test\] 4 items, \d+\.\d items/sec, \d+\.\ds"
+    )
+
+
+@pytest.mark.parametrize(
+    ["args"],
+    [
+        pytest.param([], id="sequential"),
+        pytest.param(["--concurrent"], id="concurrent"),
+    ],
+)
+def test_run_many_pipes(monkeypatch, tmpdir, execute, args):
+    """Many pipes are run in one process and timings are reported."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join(".holocron.yml").write_binary(
+        yaml.safe_dump(
+            {
+                "metadata": {"url": "https://yoda.ua"},
+                "pipes": {
+                    "posts": [
+                        {"name": "source", "args": {"pattern": "posts/"}},
+                        {"name": "save"},
+                    ],
+                    "assets": [
+                        {"name": "source", "args": {"pattern": "static/"}},
+                        {"name": "save"},
+                    ],
+                },
+            },
+            encoding="UTF-8",
+            default_flow_style=False,
+        )
+    )
+    tmpdir.ensure("posts", "yoda.md").write_binary(b"yoda")
+    tmpdir.ensure("static", "yoda.png").write_binary(b"")
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        output = execute(["run", "posts", "assets"] + args, False)
+
+    assert set(output.splitlines()) == {
+        "==> posts/yoda.md",
+        "==> static/yoda.png",
+    }
+    assert tmpdir.join("_site", "posts", "yoda.md").read_binary() == b"yoda"
+    assert tmpdir.join("_site", "static", "yoda.png").check(file=1)
+    assert stderr.getvalue().splitlines() == [
+        _pytest_regex(r"\[posts\] 1 items, \d+\.\ds"),
+        _pytest_regex(r"\[assets\] 1 items, \d+\.\ds"),
+        _pytest_regex(r"\[total\] 2 items, \d+\.\ds"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ["args"],
+    [
+        pytest.param([], id="shared-process"),
+        pytest.param(["--workers", "2"], id="workers"),
+    ],
+)
+def test_run_many(monkeypatch, tmpdir, execute, args):
+    """Many sites are built at once, each with its own metadata."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("theme", "templates", "item.j2").write_binary(
+        b"{{ metadata.url }}: {{ item.content }}"
+    )
+
+    for site in ("yoda", "luke"):
+        tmpdir.ensure(site, ".holocron.yml").write_binary(
+            yaml.safe_dump(
+                {
+                    "metadata": {"url": f"https://{site}.ua"},
+                    "pipes": {
+                        "compile": [
+                            {"name": "source", "args": {"pattern": "posts/"}},
+                            {
+                                "name": "jinja2",
+                                "args": {"themes": ["%(here)s/../theme"]},
+                            },
+                            {"name": "save"},
+                        ]
+                    },
+                },
+                encoding="UTF-8",
+                default_flow_style=False,
+            )
+        )
+        tmpdir.ensure(site, "posts", "about.txt").write_text(
+            site, encoding="UTF-8"
+        )
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        output = execute(
+            ["run-many", "yoda/.holocron.yml", "luke/.holocron.yml"]
+            + ["--pipe", "compile"]
+            + args,
+            False,
+        )
+
+    assert output.splitlines() == [
+        _pytest_regex(
+            rf"==> {re.escape(str(tmpdir.join(site, '.holocron.yml')))} "
+            r"1 items, \d+\.\d items/sec, \d+\.\ds"
+        )
+        for site in ("yoda", "luke")
+    ]
+    assert stderr.getvalue().splitlines() == [
+        _pytest_regex(r"\[total\] 2 sites, 2 items, \d+\.\d items/sec"),
+    ]
+
+    for site in ("yoda", "luke"):
+        assert (
+            tmpdir.join(site, "_site", "posts", "about.txt").read_text(
+                encoding="UTF-8"
+            )
+            == f"https://{site}.ua: {site}"
+        )
+
+
+def test_run_many_site_fails(monkeypatch, tmpdir, execute, example_site):
+    """Sites that cannot be built do not stop others from being built."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.ensure("yoda", ".holocron.yml").write_binary(
+        b"metadata: {}\npipes: {}"
+    )
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        with pytest.raises(SystemExit):
+            execute(
+                ["run-many", "yoda/.holocron.yml", ".holocron.yml"]
+                + ["--pipe", "test"],
+                False,
+            )
+
+    assert tmpdir.join("_site", "cv.md").read_binary() == b"yoda"
+    assert stderr.getvalue().splitlines() == [
+        f"[{tmpdir.join('yoda', '.holocron.yml')}] no such pipe: 'test'",
+        _pytest_regex(r"\[total\] 2 sites, \d+ items, "),
+    ]
+
+
+def test_run_resume_from(monkeypatch, tmpdir, execute):
+    """Pipe is resumed from a checkpoint without running preceding steps."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join(".holocron.yml").write_binary(
+        yaml.safe_dump(
+            {
+                "metadata": {"url": "https://yoda.ua"},
+                "pipes": {
+                    "test": [
+                        {"name": "source", "args": {"pattern": "posts/"}},
+                        {"name": "checkpoint", "args": {"name": "sources"}},
+                        {"name": "save"},
+                    ],
+                },
+            },
+            encoding="UTF-8",
+            default_flow_style=False,
+        )
+    )
+    tmpdir.ensure("posts", "yoda.md").write_binary(b"yoda")
+
+    assert execute(["run", "test"], False) == "==> posts/yoda.md\n"
+
+    tmpdir.join("posts").remove()
+    tmpdir.join("_site").remove()
+
+    output = execute(["run", "test", "--resume-from", "sources"], False)
+
+    assert output == "==> posts/yoda.md\n"
+    assert tmpdir.join("_site", "posts", "yoda.md").read_binary() == b"yoda"
+
+
+def test_run_shard(monkeypatch, tmpdir, execute):
+    """Shard to build is passed to the 'shard' processor."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join(".holocron.yml").write_binary(
+        yaml.safe_dump(
+            {
+                "metadata": {"url": "https://yoda.ua"},
+                "pipes": {
+                    "shard": [
+                        {"name": "source", "args": {"pattern": "posts/"}},
+                        {"name": "shard", "args": {"pipe": []}},
+                    ],
+                },
+            },
+            encoding="UTF-8",
+            default_flow_style=False,
+        )
+    )
+    for i in range(10):
+        tmpdir.ensure("posts", f"{i}.md").write_binary(b"yoda")
+
+    built = [
+        execute(["run", "shard", "--shard", f"{i}/3"], False).splitlines()
+        for i in range(3)
+    ]
+
+    assert sorted(sum(built, [])) == sorted(
+        f"==> posts/{i}.md" for i in range(10)
+    )
+    assert sorted(tmpdir.join("_shards").listdir()) == [
+        tmpdir.join("_shards", f"{i}-of-3.items") for i in range(3)
+    ]
+
+
+@pytest.mark.parametrize(
+    ["shard"],
+    [
+        pytest.param("1", id="no-total"),
+        pytest.param("3/3", id="out-of-range"),
+        pytest.param("a/b", id="not-int"),
+    ],
+)
+def test_run_shard_bad_value(monkeypatch, tmpdir, execute, shard):
+    """Bad shards are rejected."""
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        with pytest.raises(SystemExit):
+            execute(["run", "shard", "--shard", shard], False)
+
+    assert f"expected I/N, got {shard!r}" in stderr.getvalue()
+
+
+@pytest.fixture(scope="function")
+def daemon(tmpdir):
+    from holocron.__main__ import create_daemon
+
+    server = create_daemon(
+        str(tmpdir.join(".holocron.yml")), str(tmpdir.join(".holocron.sock"))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_run_via_daemon(monkeypatch, tmpdir, execute, example_site, daemon):
+    """Pipes are run by a daemon, and a changed config is reloaded."""
+
+    monkeypatch.chdir(tmpdir)
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        output = execute(["run", "test", "--via-daemon"], False)
+
+    assert set(output.splitlines()) == {
+        "==> .holocron.yml",
+        "==> cv.md",
+        "==> 2019/02/12/skywalker/index.html",
+        "==> about/photo.png",
+    }
+    assert tmpdir.join("_site", "cv.md").read_binary() == b"yoda"
+    assert stderr.getvalue().splitlines() == [
+        _pytest_regex(r"\[test\] 4 items, \d+\.\d{3}s"),
+    ]
+
+    tmpdir.join(".holocron.yml").write_binary(
+        yaml.safe_dump(
+            {
+                "metadata": {"url": "https://yoda.ua"},
+                "pipes": {
+                    "test": [
+                        {"name": "source", "args": {"pattern": "about/"}},
+                        {"name": "save"},
+                    ]
+                },
+            },
+            encoding="UTF-8",
+            default_flow_style=False,
+        )
+    )
+    # Some file systems have coarse timestamps, so make sure the daemon
+    # sees a new modification time.
+    stat = os.stat(str(tmpdir.join(".holocron.yml")))
+    os.utime(
+        str(tmpdir.join(".holocron.yml")),
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9),
+    )
+
+    output = execute(["run", "test", "--via-daemon"], False)
+
+    assert output.splitlines() == ["==> about/photo.png"]
+
+
+def test_run_via_daemon_metadata(monkeypatch, tmpdir):
+    """Metadata set by processors do not leak into further requests."""
+
+    import holocron.__main__
+
+    seen = []
+
+    def leak(app, items):
+        seen.append(app.metadata.get("leak"))
+        app.metadata["leak"] = len(seen)
+        yield from items
+
+    def create_app_from_yml(path):
+        app = create_app_from_yml.wrapped(path)
+        app.add_processor("leak", leak)
+        return app
+
+    create_app_from_yml.wrapped = holocron.__main__.create_app_from_yml
+    monkeypatch.setattr(
+        holocron.__main__, "create_app_from_yml", create_app_from_yml
+    )
+
+    tmpdir.join(".holocron.yml").write_binary(
+        yaml.safe_dump(
+            {
+                "metadata": {"url": "https://yoda.ua"},
+                "pipes": {"test": [{"name": "leak"}, {"name": "leak"}]},
+            },
+            encoding="UTF-8",
+            default_flow_style=False,
+        )
+    )
+    socket_path = str(tmpdir.join(".holocron.sock"))
+
+    server = holocron.__main__.create_daemon(
+        str(tmpdir.join(".holocron.yml")), socket_path
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with mock.patch("sys.stderr", new_callable=io.StringIO):
+            for _ in range(2):
+                holocron.__main__.request_daemon(
+                    socket_path, ["test"], report=lambda destination: None
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert seen == [None, 1, None, 3]
+
+
+def test_run_via_daemon_shard(monkeypatch, tmpdir, execute):
+    """Shard to build is passed to a daemon along with pipes."""
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join(".holocron.yml").write_binary(
+        yaml.safe_dump(
+            {
+                "metadata": {"url": "https://yoda.ua"},
+                "pipes": {
+                    "shard": [
+                        {"name": "source", "args": {"pattern": "posts/"}},
+                        {"name": "shard", "args": {"pipe": []}},
+                    ],
+                },
+            },
+            encoding="UTF-8",
+            default_flow_style=False,
+        )
+    )
+    for i in range(10):
+        tmpdir.ensure("posts", f"{i}.md").write_binary(b"yoda")
+
+    from holocron.__main__ import create_daemon
+
+    server = create_daemon(
+        str(tmpdir.join(".holocron.yml")), str(tmpdir.join(".holocron.sock"))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with mock.patch("sys.stderr", new_callable=io.StringIO):
+            built = [
+                execute(
+                    ["run", "shard", "--shard", f"{i}/3", "--via-daemon"],
+                    False,
+                ).splitlines()
+                for i in range(3)
+            ]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert sorted(sum(built, [])) == sorted(
+        f"==> posts/{i}.md" for i in range(10)
+    )
+    assert sorted(tmpdir.join("_shards").listdir()) == [
+        tmpdir.join("_shards", f"{i}-of-3.items") for i in range(3)
+    ]
+
+
+def test_run_via_daemon_error(monkeypatch, tmpdir, execute, daemon):
+    """Errors in a daemon are reported by a client."""
+
+    monkeypatch.chdir(tmpdir)
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        with pytest.raises(SystemExit):
+            execute(["run", "yoda", "--via-daemon"], False)
+
+    assert stderr.getvalue().endswith("no such pipe: 'yoda'\n")
+
+
+def test_run_via_daemon_not_running(monkeypatch, tmpdir, execute):
+    """Missing daemon is reported."""
+
+    monkeypatch.chdir(tmpdir)
+
+    with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+        with pytest.raises(SystemExit):
+            execute(["run", "test", "--via-daemon"], False)
+
+    assert stderr.getvalue() == _pytest_regex(r"No daemon is running: .*")
+
+
+def test_configure_logger_repeated(capsys):
+    """Repeated records are printed once and summarized at exit."""
+
+    from holocron.__main__ import configure_logger
+
+    with configure_logger(logging.WARNING):
+        logger = logging.getLogger()
+
+        for _ in range(3):
+            logger.warning("no such language: '%s'", "yoda")
+        logger.warning("no such language: '%s'", "vader")
+
+    assert capsys.readouterr().err.splitlines() == [
+        "[WARN] no such language: 'yoda'",
+        "[WARN] no such language: 'vader'",
+        "[WARN] no such language: 'yoda' (repeated 2 more times)",
+    ]
+
+
+def test_configure_logger_bounded(capsys):
+    """Records are streamed once a buffer is full."""
+
+    from holocron.__main__ import configure_logger
+
+    with configure_logger(logging.WARNING, capacity=2):
+        logger = logging.getLogger()
+
+        logger.warning("the first one")
+        assert capsys.readouterr().err == ""
+
+        logger.warning("the second one")
+        assert capsys.readouterr().err.splitlines() == [
+            "[WARN] the first one",
+            "[WARN] the second one",
+        ]
+
+
+def test_configure_logger_flush_interval(capsys):
+    """Records are streamed once a flush interval is over."""
+
+    from holocron.__main__ import configure_logger
+
+    with configure_logger(logging.WARNING, flush_interval=0.1):
+        logger = logging.getLogger()
+
+        logger.warning("the only one")
+        assert capsys.readouterr().err == ""
+
+        time.sleep(0.5)
+        assert capsys.readouterr().err.splitlines() == [
+            "[WARN] the only one",
+        ]
+
+
+def test_import_time():
+    """CLI startup must not be slowed down by processors' dependencies."""
+
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, holocron.__main__; print(*sys.modules)",
+        ],
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+
+    # Built-in processors are imported lazily, hence their heavy dependencies
+    # must not be imported on startup.
+    modules = set(output.splitlines()[-1].split())
+    assert modules.isdisjoint(
+        {
+            "docutils",
+            "feedgen",
+            "jinja2",
+            "jsonschema",
+            "markdown",
+            "mistletoe",
+            "pkg_resources",
+            "pygments",
+        }
+    )
+
+    # Import time report contains lines like the following one, where the
+    # second column is cumulative import time in microseconds:
+    #
+    #   import time:  1666 |  68192 | holocron.__main__
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in output.splitlines()
+        if line.startswith("import time:")
+        and line.split("|")[2].strip() == "holocron.__main__"
+    )
+    assert cumulative < 500_000